@@ -0,0 +1,73 @@
+"""Compares the parser backends of every format on representative configs.
+
+Three configs are generated and written out in TOML, YAML and JSON:
+
+- "small": a handful of flat hyperparameters, the typical imported snippet,
+- "training": a nested experiment config with lists and a few dozen sections,
+- "catalog": a large dataset catalog with thousands of entries.
+
+Each file is decoded with every available backend for its format (the bytes are
+read once upfront, so only the decoding is measured).
+
+Usage:
+    python benchmarks/bench_backends.py [--repeat 20] [--catalog-size 2000]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from confuk import dump_config
+from confuk.backends import available_parser_backends, set_parser_backend, parse_bytes
+
+
+def _small_config():
+    return {"lr": 0.001, "batch_size": 32, "epochs": 10, "optimizer": "adam", "seed": 42}
+
+
+def _training_config():
+    return {
+        "experiment": {"name": "baseline", "tags": ["vision", "resnet", "ablation"]},
+        "model": {f"block_{i}": {"channels": 64 * (i + 1), "kernel": 3, "dropout": 0.1, "activation": "relu"}
+                  for i in range(24)},
+        "data": {"root": "/data/imagenet", "augmentations": ["flip", "crop", "jitter"], "workers": 8},
+        "training": _small_config() | {"schedule": {"warmup": 500, "milestones": [30, 60, 90]}},
+    }
+
+
+def _catalog_config(size: int):
+    return {"datasets": {f"dataset_{i}": {"path": f"/data/set_{i}", "size": i * 100, "split": [0.8, 0.1, 0.1],
+                                          "description": f"Dataset number {i}"}
+                         for i in range(size)}}
+
+
+def _measure(fmt: str, data: bytes, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse_bytes(fmt, data)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--catalog-size", type=int, default=2000)
+    args = parser.parse_args()
+
+    configs = {"small": _small_config(), "training": _training_config(), "catalog": _catalog_config(args.catalog_size)}
+    print(f"{'config':<10}{'format':<8}{'backend':<10}{'size [KiB]':>12}{'time [ms]':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, config in configs.items():
+            for fmt in ("toml", "yaml", "json"):
+                path = Path(tmp) / f"{name}.{fmt}"
+                dump_config(config, path)
+                data = path.read_bytes()
+                for backend in available_parser_backends(fmt):
+                    set_parser_backend(fmt, backend)
+                    elapsed = _measure(fmt, data, args.repeat)
+                    print(f"{name:<10}{fmt:<8}{backend:<10}{len(data) / 1024:>12.1f}{elapsed * 1e3:>12.3f}")
+                set_parser_backend(fmt, None)
+
+
+if __name__ == "__main__":
+    main()
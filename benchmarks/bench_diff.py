@@ -0,0 +1,52 @@
+"""Benchmark of diffing two big configs which differ in a single value.
+
+Builds a config with `--sections` sections of `--keys` keys each and a copy of it
+with one value changed, then compares them with `confuk.diff` and by flattening
+both configs (`confuk.parse.flatten`) and comparing the flat dictionaries, for
+configs parsed as dictionaries and as frozen configs.
+
+Usage:
+    python benchmarks/bench_diff.py [--sections 1000] [--keys 100] [--rounds 5]
+"""
+import argparse
+import copy
+import time
+
+from confuk import diff, parse_config
+from confuk.parse import flatten
+
+
+def _flat_diff(a, b) -> set:
+    a, b = flatten(a), flatten(b)
+    return {k for k in a.keys() | b.keys() if a.get(k) != b.get(k)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sections", type=int, default=1000)
+    parser.add_argument("--keys", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    old = {f"section_{i}": {f"key_{j}": j for j in range(args.keys)} for i in range(args.sections)}
+    new = copy.deepcopy(old)
+    new[f"section_{args.sections // 2}"]["key_0"] = -1
+    path = {f"section_{args.sections // 2}.key_0"}
+
+    print(f"{args.sections * args.keys} leaves")
+    print(f"{'format':>8}{'method':>10}{'time [ms]':>12}")
+    for cfg_class in ("dict", "frozen"):
+        a, b = parse_config(old, cfg_class), parse_config(new, cfg_class)
+        for name, fn in (("flatten", _flat_diff), ("diff", lambda a, b: set(diff(a, b).paths))):
+            if cfg_class == "frozen" and name == "flatten":
+                # `flatten` only descends into dictionaries
+                continue
+            start = time.perf_counter()
+            for _ in range(args.rounds):
+                assert fn(a, b) == path
+            elapsed = (time.perf_counter() - start) / args.rounds
+            print(f"{cfg_class:>8}{name:>10}{elapsed * 1e3:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
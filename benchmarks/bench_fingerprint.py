@@ -0,0 +1,49 @@
+"""Benchmark of fingerprinting many configs built on one base config.
+
+Builds a base config with `--sections` sections of `--keys` keys each and `--variants`
+configs which override one value of the base each, sharing every other section with
+it (as the variants yielded by `sweep` do). Every variant is fingerprinted by
+hashing its JSON dump with sorted keys, with `fingerprint` and with a single
+`Fingerprinter` shared by all the variants. Checks that the duplicates are found.
+
+Usage:
+    python benchmarks/bench_fingerprint.py [--sections 100] [--keys 100] [--variants 500]
+"""
+import argparse
+import hashlib
+import json
+import time
+
+from confuk import Fingerprinter, fingerprint
+
+
+def _json_hash(config) -> str:
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sections", type=int, default=100)
+    parser.add_argument("--keys", type=int, default=100)
+    parser.add_argument("--variants", type=int, default=500)
+    args = parser.parse_args()
+
+    base = {f"section_{i}": {f"key_{j}": j * 0.5 for j in range(args.keys)} for i in range(args.sections)}
+    variants = []
+    for i in range(args.variants):
+        # Every value is used twice, so half of the variants are duplicates:
+        section = f"section_{i // 2 % args.sections}"
+        variants.append({**base, section: {**base[section], "key_0": i // 2}})
+
+    print(f"{args.sections * args.keys} leaves per config, {args.variants} configs")
+    print(f"{'method':>14}{'time [ms]':>12}")
+    for name, fn in (("json", _json_hash), ("fingerprint", fingerprint), ("Fingerprinter", Fingerprinter())):
+        start = time.perf_counter()
+        unique = {fn(v) for v in variants}
+        elapsed = time.perf_counter() - start
+        assert len(unique) == -(-args.variants // 2), len(unique)
+        print(f"{name:>14}{elapsed * 1e3:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Benchmark of populating nested dataclasses with `from_config`.
+
+Builds a model config with a list of `--layers` layer sections and populates a
+`Model` dataclass (holding a `List[Layer]`) from it, with the current `from_config`
+and with the implementation it replaced, which inspected the dataclass fields and
+their type hints on every call. The results of both are checked to be equal. Both
+are run on an OmegaConf `DictConfig` and on a plain dictionary, which the previous
+implementation wrapped in `OmegaConf.create` and the current one reads directly.
+
+Usage:
+    python benchmarks/bench_from_config.py [--layers 500] [--rounds 20]
+"""
+import argparse
+import time
+import typing
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Any, List, Optional, get_args, get_origin
+
+from omegaconf import DictConfig, ListConfig, OmegaConf
+
+from confuk import from_config
+from confuk.from_config import _resolve_hints, _unwrap_optional
+
+
+def _previous_convert(value: Any, tp: Any) -> Any:
+    if tp in (DictConfig, ListConfig):
+        return value
+    tp = _unwrap_optional(tp)
+    if is_dataclass(tp) and isinstance(value, DictConfig):
+        return _previous_from_config(tp, value)
+    origin = get_origin(tp)
+    if origin in (list, tuple) and isinstance(value, ListConfig):
+        args = get_args(tp)
+        elem_tp = _unwrap_optional(args[0]) if args else Any
+        if is_dataclass(elem_tp):
+            items = [_previous_from_config(elem_tp, v) for v in value]
+            return tuple(items) if origin is tuple else items
+    if isinstance(value, (DictConfig, ListConfig)):
+        return OmegaConf.to_container(value, resolve=True)
+    return value
+
+
+def _previous_from_config(cls, config, *, strict=False):
+    """`from_config` as it was before construction plans were cached per class."""
+    if not is_dataclass(cls):
+        raise TypeError(f"{cls!r} is not a dataclass")
+    if not isinstance(config, DictConfig):
+        config = OmegaConf.create(config)
+    hints = _resolve_hints(cls)
+    kwargs = {}
+    for f in fields(cls):
+        if not f.init:
+            continue
+        if f.name not in config or OmegaConf.is_missing(config, f.name):
+            continue
+        kwargs[f.name] = _previous_convert(config[f.name], hints.get(f.name, f.type))
+    if strict:
+        known = {f.name for f in fields(cls)}
+        unknown = [k for k in config.keys() if k not in known]
+        if unknown:
+            raise ValueError(f"Unknown config keys for {cls.__name__}: {sorted(unknown)}")
+    return cls(**kwargs)
+
+
+@dataclass
+class Activation:
+    name: str = "relu"
+    slope: Optional[float] = None
+
+
+@dataclass
+class Layer:
+    units: int
+    dropout: float = 0.0
+    activation: Activation = field(default_factory=Activation)
+    tags: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Model:
+    name: str
+    layers: List[Layer]
+    extra: Any = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--layers", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    raw = {
+        "name": "mlp",
+        "layers": [{"units": 16 * i, "dropout": 0.1, "activation": {"name": "gelu"}, "tags": ["a"]}
+                   for i in range(args.layers)],
+        "extra": {"seed": 0},
+    }
+    cfg = OmegaConf.create(raw)
+    assert from_config(Model, cfg) == _previous_from_config(Model, cfg) == from_config(Model, raw)
+
+    print(f"{'implementation':>16}{'config':>12}{'time [ms]':>12}")
+    for config in (cfg, raw):
+        for name, fn in (("previous", _previous_from_config), ("current", from_config)):
+            start = time.perf_counter()
+            for _ in range(args.rounds):
+                fn(Model, config)
+            elapsed = (time.perf_counter() - start) / args.rounds
+            print(f"{name:>16}{type(config).__name__:>12}{elapsed * 1e3:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
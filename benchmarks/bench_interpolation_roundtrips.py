@@ -0,0 +1,94 @@
+"""Compares the allocations of the OmegaConf interpolation pipeline before and after
+keeping the config in a single node tree (one `OmegaConf.create` per pass).
+
+The "legacy" variant patches in the previous implementation, which converted
+the config to a `DictConfig` and back twice per pass and built yet another
+`DictConfig` for the `"o"` output format.
+
+Usage:
+    python benchmarks/bench_interpolation_roundtrips.py [--depth 4] [--width 4] [--repeat 3]
+"""
+import argparse
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from unittest import mock
+
+from omegaconf import OmegaConf, DictConfig as OmegaConfigDict
+
+import confuk.parse as confuk_parse
+from confuk import parse_config, dump_config
+
+
+def _legacy_handle_variable_interpolation(config_dict, config_path, as_node=False):
+    config = confuk_parse._interpolate_special_variables(config_dict, config_path)
+    parameterized = confuk_parse._extract_parameterized_sections(config)
+    config = OmegaConfigDict(config)
+    config = OmegaConf.create(config)
+    config = OmegaConf.to_container(config, resolve=False)
+    with confuk_parse._parse_context():
+        confuk_parse._register_parameterized_resolvers(parameterized)
+        config = OmegaConf.create(config)
+        config = OmegaConf.to_container(config, resolve=True)
+    return config
+
+
+def _legacy_parse_leaf_config(config_file_path, as_node=False):
+    config_dict, post_fn = confuk_parse._parse_config_dict(config_file_path)
+    config_dict = confuk_parse._handle_leaf_node_interpolation(config_dict, config_file_path)
+    config_dict = _legacy_handle_variable_interpolation(config_dict, config_file_path)
+    if post_fn is not None:
+        post_fn(config_dict)
+    return OmegaConf.create(config_dict) if as_node else config_dict
+
+
+@contextmanager
+def _legacy_pipeline():
+    with mock.patch.object(confuk_parse, "_handle_variable_interpolation", _legacy_handle_variable_interpolation), \
+         mock.patch.object(confuk_parse, "_parse_leaf_config", _legacy_parse_leaf_config):
+        yield
+
+
+def _make_deep_config(depth: int, width: int):
+    if depth == 0:
+        return {f"leaf_{i}": i for i in range(width)} | {"name": "${root_name}/${this_filename_stem}"}
+    return {f"node_{i}": _make_deep_config(depth - 1, width) for i in range(width)}
+
+
+def _measure(path: Path, cfg_class, repeat: int):
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse_config(path, cfg_class)
+    elapsed = (time.perf_counter() - start) / repeat
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--width", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "deep.json"
+        config = _make_deep_config(args.depth, args.width)
+        config["root_name"] = "deep"
+        dump_config(config, path)
+
+        print(f"{'format':<8}{'pipeline':<10}{'time [ms]':>12}{'peak [KiB]':>14}")
+        for cfg_class in ("d", "o"):
+            with _legacy_pipeline():
+                legacy_time, legacy_peak = _measure(path, cfg_class, args.repeat)
+            time_, peak = _measure(path, cfg_class, args.repeat)
+            print(f"{cfg_class:<8}{'legacy':<10}{legacy_time * 1e3:>12.1f}{legacy_peak / 1024:>14.1f}")
+            print(f"{cfg_class:<8}{'current':<10}{time_ * 1e3:>12.1f}{peak / 1024:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
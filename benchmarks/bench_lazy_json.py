@@ -0,0 +1,59 @@
+"""Benchmark of looking up a single key in a big JSON payload imported by a config.
+
+Generates a JSON file with a label map and a feature list, imports it from a small
+YAML config and reads one value from it, once with an eager parse and once with a
+lazy parse (which memory-maps the JSON file). Reports the time and the peak of
+Python allocations of each.
+
+Usage:
+    python benchmarks/bench_lazy_json.py [--labels 20000] [--features 200000]
+"""
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from confuk import parse_config
+
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    value = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--labels", type=int, default=20_000)
+    parser.add_argument("--features", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        payload = {
+            "labels": {f"n{i:08d}": f"label number {i}" for i in range(args.labels)},
+            "features": list(range(args.features)),
+            "meta": {"version": 3},
+        }
+        (root / "payload.json").write_text(json.dumps(payload))
+        leaf = root / "leaf.yaml"
+        leaf.write_text("pre:\n  imports:\n    - ${this_dir}/payload.json\nlr: 0.1\n")
+        size = (root / "payload.json").stat().st_size
+        print(f"payload: {size / 2 ** 20:.1f} MiB")
+
+        print(f"{'mode':>8}{'time [ms]':>12}{'peak [MiB]':>12}")
+        for mode, fn in (("eager", lambda: parse_config(leaf)["meta"]["version"]),
+                         ("lazy", lambda: parse_config(leaf, lazy=True)["meta"]["version"])):
+            value, elapsed, peak = _measure(fn)
+            assert value == 3
+            print(f"{mode:>8}{elapsed * 1e3:>12.1f}{peak / 2 ** 20:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
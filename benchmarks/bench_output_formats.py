@@ -0,0 +1,49 @@
+"""Benchmark of the memory footprint and read speed of the config output formats.
+
+Builds a config with many sections, converts it to every output format and reports
+the memory allocated by the conversion and the time of reading a nested value with
+attribute (or, for plain dictionaries, item) access. Plain dictionaries are the
+baseline: the conversion is a shallow copy of the input, so it allocates next to nothing.
+
+Usage:
+    python benchmarks/bench_output_formats.py [--sections 10000] [--reads 1000000]
+"""
+import argparse
+import time
+import tracemalloc
+
+from confuk import parse_config
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sections", type=int, default=10_000)
+    parser.add_argument("--reads", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    config = {
+        "training": {"optimizer": {"lr": 0.1, "momentum": 0.9}, "epochs": 10},
+        "sections": {f"section_{i}": {"path": f"/data/{i}", "size": i, "tags": ["a", "b"]}
+                     for i in range(args.sections)},
+    }
+    readers = {
+        "dict": lambda cfg: cfg["training"]["optimizer"]["lr"],
+        "attr": lambda cfg: cfg.training.optimizer.lr,
+        "omega": lambda cfg: cfg.training.optimizer.lr,
+        "frozen": lambda cfg: cfg.training.optimizer.lr,
+    }
+    print(f"{'format':>8}{'memory [MiB]':>14}{'read [ns]':>12}")
+    for cfg_class, read in readers.items():
+        tracemalloc.start()
+        cfg = parse_config(config, cfg_class)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        start = time.perf_counter()
+        for _ in range(args.reads):
+            read(cfg)
+        elapsed = time.perf_counter() - start
+        print(f"{cfg_class:>8}{memory / 2 ** 20:>14.2f}{elapsed / args.reads * 1e9:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
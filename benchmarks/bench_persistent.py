@@ -0,0 +1,56 @@
+"""Benchmark of parsing many configs built on one big imported base config.
+
+Writes a base config with `--sections` sections of `--keys` keys each and `--configs`
+configs which import it and override one value each, then parses them all with
+`parse_configs` (which parses the base only once). Configs without anything left to
+interpolate are returned as they are, sharing the untouched sections with the base
+(see `confuk.persistent`); `omegaconf` forces the previous behaviour of resolving every
+config with OmegaConf, which copies the whole tree.
+
+Usage:
+    python benchmarks/bench_persistent.py [--sections 100] [--keys 100] [--configs 20]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+from confuk import parse as confuk_parse
+from confuk import parse_configs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sections", type=int, default=100)
+    parser.add_argument("--keys", type=int, default=100)
+    parser.add_argument("--configs", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        (tmp / "base.yaml").write_text("".join(
+            f"section_{i}:\n" + "".join(f"  key_{j}: {j}\n" for j in range(args.keys)) for i in range(args.sections)
+        ))
+        paths = []
+        for i in range(args.configs):
+            path = tmp / f"config_{i}.yaml"
+            path.write_text(f"pre:\n  imports:\n    - ${{this_dir}}/base.yaml\n"
+                            f"section_{i % args.sections}:\n  key_0: {-i}\n")
+            paths.append(path)
+
+        print(f"{args.sections * args.keys} leaves, {args.configs} configs")
+        print(f"{'method':>10}{'time [ms]':>12}")
+        results = {}
+        for name in ("omegaconf", "shared"):
+            with mock.patch.object(confuk_parse, "_is_resolved", return_value=False) if name == "omegaconf" \
+                    else mock.patch.object(confuk_parse, "_is_resolved", wraps=confuk_parse._is_resolved):
+                start = time.perf_counter()
+                results[name] = list(parse_configs(paths, "dict"))
+                elapsed = time.perf_counter() - start
+            print(f"{name:>10}{elapsed * 1e3:>12.1f}")
+        assert results["omegaconf"] == results["shared"]
+
+
+if __name__ == "__main__":
+    main()
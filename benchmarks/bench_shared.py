@@ -0,0 +1,70 @@
+"""Benchmark of handing a big config to multiprocessing workers.
+
+Builds a config with a large catalog section and starts a pool of workers, each of
+which receives the config and reads one value from it. The config is sent either as
+a plain dictionary (pickled and unpickled by every worker) or as a `SharedConfig`
+(which pickles down to the name of a shared memory segment). Reports the size of the
+pickled config, the time until every worker has read its value and the peak of the
+allocations in a worker.
+
+Usage:
+    python benchmarks/bench_shared.py [--entries 200000] [--workers 8]
+"""
+import argparse
+import multiprocessing
+import pickle
+import time
+import tracemalloc
+
+from confuk import share_config
+
+
+def _read(cfg) -> tuple:
+    tracemalloc.start()
+    value = cfg["training"]["lr"]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, peak
+
+
+def _unpickle_and_read(payload: bytes) -> tuple:
+    tracemalloc.start()
+    value = pickle.loads(payload)["training"]["lr"]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    config = {
+        "catalog": {f"item_{i}": {"path": f"/data/{i}", "size": i} for i in range(args.entries)},
+        "training": {"lr": 0.1},
+    }
+    print(f"{'mode':>8}{'pickled [KiB]':>15}{'time [ms]':>12}{'worker peak [MiB]':>20}")
+    with multiprocessing.get_context("spawn").Pool(args.workers) as pool:
+        # Warm up the workers, so that process startup is not measured:
+        pool.map(abs, range(args.workers))
+
+        start = time.perf_counter()
+        payload = pickle.dumps(config)
+        results = pool.map(_unpickle_and_read, [payload] * args.workers)
+        elapsed = time.perf_counter() - start
+        peak = max(p for _, p in results)
+        print(f"{'dict':>8}{len(payload) / 2 ** 10:>15.1f}{elapsed * 1e3:>12.1f}{peak / 2 ** 20:>20.1f}")
+
+        start = time.perf_counter()
+        with share_config(config) as shared:
+            results = pool.map(_read, [shared] * args.workers)
+            elapsed = time.perf_counter() - start
+            size = len(pickle.dumps(shared))
+        peak = max(p for _, p in results)
+        print(f"{'shared':>8}{size / 2 ** 10:>15.1f}{elapsed * 1e3:>12.1f}{peak / 2 ** 20:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
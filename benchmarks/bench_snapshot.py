@@ -0,0 +1,52 @@
+"""Benchmark of reading config values in a training loop.
+
+Reads `optim.lr` and `data.batch_size` once per simulated step from an OmegaConf
+`DictConfig`, an `EasyDict`, a `FrozenConfig` and a snapshot of the `DictConfig`, and
+reports the latency of a single access. Every `--update-every` steps the learning rate
+is changed with `update_config`, and the snapshot is checked to have picked it up.
+
+Usage:
+    python benchmarks/bench_snapshot.py [--steps 200000] [--update-every 1000]
+"""
+import argparse
+import time
+
+from confuk import parse_config, snapshot, update_config
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=200_000)
+    parser.add_argument("--update-every", type=int, default=1000)
+    args = parser.parse_args()
+
+    config = {
+        "optim": {"lr": 0.1, "momentum": 0.9, "warmup_lr": "${optim.lr}"},
+        "data": {"batch_size": 32, "root": "/data"},
+        "model": {f"layer_{i}": {"units": 16 * i} for i in range(50)},
+    }
+    omega = parse_config(config, "o")
+    configs = {
+        "omega": omega,
+        "attr": parse_config(config, "attr"),
+        "frozen": parse_config(config, "frozen"),
+        "snapshot": snapshot(omega, "optim.lr", "data.batch_size"),
+    }
+    print(f"{'format':>10}{'access [ns]':>14}")
+    for name, cfg in configs.items():
+        start = time.perf_counter()
+        for _ in range(args.steps):
+            cfg.optim.lr
+            cfg.data.batch_size
+        elapsed = time.perf_counter() - start
+        print(f"{name:>10}{elapsed / (2 * args.steps) * 1e9:>14.1f}")
+
+    snap = configs["snapshot"]
+    for step in range(args.steps):
+        if step % args.update_every == 0:
+            update_config(omega, "optim.lr", step * 1e-6)
+            assert snap.optim.lr == step * 1e-6
+
+
+if __name__ == "__main__":
+    main()
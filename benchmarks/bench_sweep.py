@@ -0,0 +1,57 @@
+"""Benchmark of generating the variants of a hyperparameter grid.
+
+Writes a base config with `--sections` sections of `--keys` keys each and builds the
+variants of a grid over two keys (`--values` values each), either by loading the
+config and applying command-line style overrides for every variant (what the `main`
+decorators do, `_load_and_override_config`) or with `sweep`, which parses the base
+once and shares every untouched section between the variants.
+
+Usage:
+    python benchmarks/bench_sweep.py [--sections 20] [--keys 50] [--values 5]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from rich.console import Console
+
+from confuk import grid, sweep
+from confuk.main_decorator import _load_and_override_config
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sections", type=int, default=20)
+    parser.add_argument("--keys", type=int, default=50)
+    parser.add_argument("--values", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "base.yaml"
+        path.write_text("optim:\n  lr: 0.1\n  momentum: 0.9\n" + "".join(
+            f"section_{i}:\n" + "".join(f"  key_{j}: {j}\n" for j in range(args.keys)) for i in range(args.sections)
+        ))
+        axes = {"optim.lr": [10.0 ** -i for i in range(args.values)],
+                "optim.momentum": [0.5 + i / (2 * args.values) for i in range(args.values)]}
+        n_variants = args.values ** 2
+        console = Console()
+
+        def overridden():
+            for overrides in grid(axes):
+                yield _load_and_override_config(path, "dict", {}, [f"{k}={v}" for k, v in overrides.items()],
+                                                False, console)
+
+        print(f"{args.sections * args.keys} leaves, {n_variants} variants")
+        print(f"{'method':>10}{'time [ms]':>12}")
+        results = {}
+        for name, variants in (("override", overridden), ("sweep", lambda: sweep(path, grid(axes)))):
+            start = time.perf_counter()
+            results[name] = list(variants())
+            elapsed = time.perf_counter() - start
+            print(f"{name:>10}{elapsed * 1e3:>12.1f}")
+        assert results["override"] == results["sweep"]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Stress test of parsing configs concurrently from a thread pool.
+
+Generates N leaf configs which import shared base configs and define parameterized
+sections with clashing names, then parses all of them with 1, 2, 4, ... M threads.
+Every result is compared with the result of a serial parse, so both the correctness
+under concurrency and the throughput scaling are reported. Parsing is CPU-bound, so
+on a GIL build of CPython the throughput is expected to stay flat, use
+`parse_configs(..., parallel="process")` to scale across cores.
+
+Usage:
+    python benchmarks/bench_threads.py [--configs 200] [--max-threads 8] [--rounds 3]
+"""
+import argparse
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from confuk import parse_config
+
+
+def _write_configs(root: Path, n: int):
+    (root / "base.yaml").write_text(
+        "root: ${cwd}\n"
+        "layer(units, act):\n  units: ${units}\n  act: ${act}\n  tag: base\n"
+        + "".join(f"section_{i}:\n  value: {i}\n  path: ${{this_dir}}/{i}\n" for i in range(20))
+    )
+    (root / "data.toml").write_text("[data]\nroot = \"${this_dir}/data\"\nworkers = 4\n")
+    leaves = []
+    for i in range(n):
+        leaf = root / f"leaf_{i}.yaml"
+        # Every other config redefines the template with the same name:
+        template = f"layer(units, act):\n  units: ${{units}}\n  act: ${{act}}\n  tag: leaf_{i}\n" if i % 2 else ""
+        leaf.write_text(
+            "pre:\n  imports:\n    - ${this_dir}/base.yaml\n    - ${this_dir}/data.toml\n"
+            + template
+            + f"name: ${{this_filename_stem}}\nlr: {i}\n"
+            + "".join(f"layer_{j}: ${{layer:{j * 16 + i},relu}}\n" for j in range(5))
+        )
+        leaves.append(leaf)
+    return leaves
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--configs", type=int, default=200)
+    parser.add_argument("--max-threads", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        leaves = _write_configs(Path(tmp), args.configs)
+        expected = [parse_config(leaf) for leaf in leaves]
+
+        print(f"{'threads':>8}{'configs/s':>12}{'speedup':>10}{'mismatches':>12}")
+        threads, baseline = 1, None
+        while threads <= args.max_threads:
+            mismatches = 0
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                for _ in range(args.rounds):
+                    for result, exp in zip(executor.map(parse_config, leaves), expected):
+                        mismatches += result != exp
+            throughput = args.configs * args.rounds / (time.perf_counter() - start)
+            baseline = baseline or throughput
+            print(f"{threads:>8}{throughput:>12.1f}{throughput / baseline:>10.2f}{mismatches:>12}")
+            threads *= 2
+
+
+if __name__ == "__main__":
+    main()
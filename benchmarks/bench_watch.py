@@ -0,0 +1,59 @@
+"""Benchmark of reloading a config after one of its files changed.
+
+Writes a leaf config importing `--imports` base configs with `--entries` entries each,
+then repeatedly edits the leaf and picks up the change either by parsing the whole
+config again or with `ConfigWatcher.check`, which parses only the changed file and
+the files importing it.
+
+Usage:
+    python benchmarks/bench_watch.py [--imports 20] [--entries 500] [--rounds 10]
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from confuk import parse_config
+from confuk.watch import ConfigWatcher
+
+
+def _edit(path: Path, text: str) -> None:
+    stat = os.stat(path)
+    path.write_text(text)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--imports", type=int, default=20)
+    parser.add_argument("--entries", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        imports = []
+        for i in range(args.imports):
+            base = directory / f"base_{i}.yaml"
+            base.write_text(f"section_{i}:\n" + "".join(f"  key_{j}: value_{j}\n" for j in range(args.entries)))
+            imports.append(f"    - ${{this_dir}}/{base.name}\n")
+        leaf = directory / "leaf.yaml"
+        preamble = "pre:\n  imports:\n" + "".join(imports)
+        leaf.write_text(preamble + "training:\n  lr: 0\n")
+
+        watcher = ConfigWatcher(leaf)
+        print(f"{'reload':>12}{'time [ms]':>12}")
+        for name in ("full", "watcher"):
+            elapsed = 0.0
+            for i in range(args.rounds):
+                _edit(leaf, preamble + f"training:\n  lr: {i + 1}\n")
+                start = time.perf_counter()
+                config = parse_config(leaf) if name == "full" else watcher.check().config
+                elapsed += time.perf_counter() - start
+                assert config["training"]["lr"] == i + 1
+            print(f"{name:>12}{elapsed / args.rounds * 1e3:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Measures the per-file overhead of parsing and dumping many small YAML configs,
+with a fresh `YAML` instance per file ("legacy") and with the thread-local
+instances reused across files ("current").
+
+Usage:
+    python benchmarks/bench_yaml_instances.py [--files 500] [--threads 1]
+"""
+import argparse
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from unittest import mock
+
+from ruamel.yaml import YAML
+
+import confuk.backends as confuk_backends
+import confuk.dump as confuk_dump
+from confuk import parse_config, dump_config
+
+
+@contextmanager
+def _fresh_instances():
+    fresh = lambda: YAML(typ="safe")
+    with mock.patch.object(confuk_backends, "_ruamel_loader", fresh), \
+         mock.patch.object(confuk_dump, "_yaml_dumper", fresh):
+        yield
+
+
+def _small_config(i: int):
+    return {"index": i, "lr": 0.001 * i, "layers": [64, 128, 256], "name": f"config_{i}"}
+
+
+def _measure(fn, items, threads: int) -> float:
+    start = time.perf_counter()
+    if threads == 1:
+        for item in items:
+            fn(item)
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(fn, items))
+    return (time.perf_counter() - start) / len(items)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [Path(tmp) / f"config_{i}.yaml" for i in range(args.files)]
+        dump = lambda i: dump_config(_small_config(i), paths[i])
+        print(f"{'operation':<12}{'instances':<12}{'per file [us]':>16}")
+        for name, fn, items in (("dump", dump, range(args.files)), ("parse", parse_config, paths)):
+            with _fresh_instances():
+                legacy = _measure(fn, items, args.threads)
+            current = _measure(fn, items, args.threads)
+            print(f"{name:<12}{'legacy':<12}{legacy * 1e6:>16.1f}")
+            print(f"{name:<12}{'current':<12}{current * 1e6:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
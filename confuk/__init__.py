@@ -1,6 +1,17 @@
-from .parse import parse_config
+from .parse import parse_config, parse_configs
+from .parse_async import parse_config_async
 from .dump import dump_config
 from .main_decorator import main, click_main, click_option
 from .doc import extract_docs, extract_docs_from_file
 from .logging import get_console_and_logger
 from .from_config import from_config, ConfigMixin, config_dataclass
+from .cache import invalidate_parse_cache, set_parse_cache_size, clear_disk_cache
+from .lazy import LazyConfig
+from .shared import share_config, SharedConfig
+from .frozen import FrozenConfig
+from .snapshots import snapshot, update_config
+from .watch import watch_config, ConfigWatcher, ConfigChange
+from .diff import diff, ConfigDiff
+from .fingerprint import fingerprint, Fingerprinter
+from .sweep import sweep, grid
+from .backends import register_parser, set_parser_backend
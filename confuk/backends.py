@@ -0,0 +1,163 @@
+"""Registry of the parsers used to decode config files.
+
+Every file format has a list of backends ordered by preference. Unless a backend is
+picked explicitly with `set_parser_backend`, the first one whose dependencies are
+installed is used:
+
+- TOML: `tomllib` (standard library since Python 3.11), then the `toml` package.
+- YAML: `ruamel` in safe mode, which uses the libyaml-based C parser when
+  `ruamel.yaml.clib` is installed. `pyyaml` (with its `CSafeLoader` when available)
+  can be selected explicitly, but it is never picked automatically, since it
+  implements YAML 1.1 and e.g. reads `yes`/`no` as booleans.
+- JSON: `orjson`, then the standard `json` module. `orjson` is stricter than
+  `json` (no `NaN`/`Infinity`), files it rejects are decoded again with `json`.
+
+Backends take the raw bytes of a file and return the decoded dictionary.
+"""
+import json
+import threading
+from typing import *
+
+import toml
+from ruamel.yaml import YAML
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import yaml as pyyaml
+except ImportError:
+    pyyaml = None
+
+__all__ = ["register_parser", "set_parser_backend", "get_parser_backend", "available_parser_backends"]
+
+ParserBackend = Callable[[bytes], Dict[str, Any]]
+
+_lock = threading.Lock()
+_backends: Dict[str, Dict[str, ParserBackend]] = {"toml": {}, "yaml": {}, "json": {}}
+_selected: Dict[str, str | None] = {"toml": None, "yaml": None, "json": None}
+# Resolved backend per format, cleared whenever the registry changes:
+_active: Dict[str, Tuple[str, ParserBackend]] = {}
+_local = threading.local()
+
+
+def _check_format(fmt: str) -> str:
+    fmt = fmt.lower().lstrip(".")
+    if fmt not in _backends:
+        raise ValueError(f"Unsupported config format: {fmt}. Use one of: {', '.join(_backends)}")
+    return fmt
+
+
+def register_parser(fmt: str, name: str, parser: ParserBackend, preferred: bool = False) -> None:
+    """Registers a parser backend for a file format.
+
+    Args:
+        fmt (str): file format, one of `toml`, `yaml` and `json`
+        name (str): name of the backend, used to select it with `set_parser_backend`
+        parser (ParserBackend): function decoding the raw bytes of a file into a dictionary
+        preferred (bool, optional): whether the backend should be picked automatically before
+            the already registered ones. Defaults to False.
+    """
+    fmt = _check_format(fmt)
+    with _lock:
+        backends = dict(_backends[fmt])
+        backends.pop(name, None)
+        _backends[fmt] = {name: parser, **backends} if preferred else {**backends, name: parser}
+        _active.clear()
+
+
+def set_parser_backend(fmt: str, name: str | None) -> None:
+    """Selects the parser backend used for a file format.
+
+    Args:
+        fmt (str): file format, one of `toml`, `yaml` and `json`
+        name (str | None): name of a registered backend, `None` goes back to the automatic choice
+    """
+    fmt = _check_format(fmt)
+    if name is not None and name not in _backends[fmt]:
+        raise ValueError(f"Unknown {fmt} parser backend: {name}. "
+                         f"Available: {', '.join(available_parser_backends(fmt))}")
+    with _lock:
+        _selected[fmt] = name
+        _active.clear()
+
+
+def available_parser_backends(fmt: str) -> List[str]:
+    """Lists the backends registered for a file format, in the order of preference."""
+    return list(_backends[_check_format(fmt)])
+
+
+def _active_backend(fmt: str) -> Tuple[str, ParserBackend]:
+    active = _active.get(fmt)
+    if active is None:
+        with _lock:
+            name = _selected[fmt] or next(iter(_backends[fmt]), None)
+            if name is None:
+                raise ValueError(f"No parser backend available for {fmt} configs")
+            active = _active[fmt] = (name, _backends[fmt][name])
+    return active
+
+
+def get_parser_backend(fmt: str) -> str:
+    """Returns the name of the backend currently used for a file format."""
+    return _active_backend(_check_format(fmt))[0]
+
+
+def parse_bytes(fmt: str, data: bytes) -> Dict[str, Any]:
+    """Decodes the contents of a config file with the active backend for `fmt`."""
+    return _active_backend(fmt)[1](data)
+
+
+def _parse_tomllib(data: bytes) -> Dict[str, Any]:
+    return tomllib.loads(data.decode("utf-8"))
+
+
+def _parse_toml(data: bytes) -> Dict[str, Any]:
+    return toml.loads(data.decode("utf-8"))
+
+
+def _ruamel_loader() -> YAML:
+    """Setting up a `YAML` instance is a noticeable share of loading a small file,
+    but instances are not thread-safe, so every thread reuses its own one.
+    """
+    yaml = getattr(_local, "yaml", None)
+    if yaml is None:
+        yaml = _local.yaml = YAML(typ="safe")
+    return yaml
+
+
+def _parse_ruamel(data: bytes) -> Dict[str, Any]:
+    return _ruamel_loader().load(data)
+
+
+def _parse_pyyaml(data: bytes) -> Dict[str, Any]:
+    return pyyaml.load(data, Loader=getattr(pyyaml, "CSafeLoader", pyyaml.SafeLoader))
+
+
+def _parse_orjson(data: bytes) -> Dict[str, Any]:
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
+def _parse_json(data: bytes) -> Dict[str, Any]:
+    return json.loads(data)
+
+
+if tomllib is not None:
+    register_parser("toml", "tomllib", _parse_tomllib)
+register_parser("toml", "toml", _parse_toml)
+register_parser("yaml", "ruamel", _parse_ruamel)
+if pyyaml is not None:
+    register_parser("yaml", "pyyaml", _parse_pyyaml)
+if orjson is not None:
+    register_parser("json", "orjson", _parse_orjson)
+register_parser("json", "json", _parse_json)
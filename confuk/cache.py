@@ -0,0 +1,280 @@
+"""Caches of fully parsed configs.
+
+`ParseCache` is the process-wide in-memory cache. Entries are keyed by the resolved
+path of the leaf config, the working directory (since `${cwd}` ends up in the parsed
+values) and the selected parser backends, and remember the `(mtime_ns, size)` signature
+of every file read while building them, i.e. the whole import graph. A lookup re-stats
+those files and only returns the cached config if none of them changed, so a hit never
+touches the format parsers. Configs which depend on anything but their files, i.e. the
+ones importing Python files or calling OmegaConf resolvers (e.g. `${oc.env:HOME}`), are
+never cached.
+
+`DiskCache` persists the same entries across processes, for short-lived CLI programs.
+On top of the signatures, it stores the content hash of every file of the import graph,
+so an entry stays valid when a file is touched or checked out again without changes.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from copy import deepcopy
+from pathlib import Path
+from typing import *
+
+FileSignature = Tuple[int, int]
+CacheKey = Tuple[Path, Path, Tuple[str, ...]]
+
+
+class Dependencies(Dict[Path, FileSignature]):
+    """Signatures of the files a config was built from, by resolved path.
+
+    `dynamic` is set when the config also depends on something other than the files,
+    e.g. on environment variables read by a resolver, in which case it can't be cached.
+    """
+    dynamic: bool = False
+
+
+_tracked_dependencies: ContextVar[Dependencies | None] = ContextVar("confuk_tracked_dependencies", default=None)
+
+
+def _file_signature(path: Path) -> FileSignature | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def record_dependency(path: Path) -> None:
+    """Records `path` as a dependency of the config that is currently being parsed.
+
+    Must be called *before* the file is read, so that a write racing with
+    the read invalidates the entry on the next lookup instead of being missed.
+    Does nothing when no dependency tracking is active.
+    """
+    deps = _tracked_dependencies.get()
+    if deps is None:
+        return
+    resolved = Path(path).resolve()
+    if resolved not in deps:
+        signature = _file_signature(resolved)
+        if signature is not None:
+            deps[resolved] = signature
+
+
+def record_dynamic_value() -> None:
+    """Records that the config that is currently being parsed depends on something other
+    than its files, e.g. a resolver call. Does nothing when no dependency tracking is active.
+    """
+    deps = _tracked_dependencies.get()
+    if deps is not None:
+        deps.dynamic = True
+
+
+@contextmanager
+def track_dependencies():
+    """Collects the signatures of all files recorded with `record_dependency`
+    within the `with` block into the yielded `Dependencies`.
+    """
+    deps = Dependencies()
+    token = _tracked_dependencies.set(deps)
+    try:
+        yield deps
+    finally:
+        _tracked_dependencies.reset(token)
+
+
+def is_cacheable(deps: Dependencies) -> bool:
+    """Tells whether a config built from `deps` only depends on the contents of its files.
+    Python configs can compute their values dynamically, so they're never cacheable.
+    """
+    return not deps.dynamic and not any(dep.suffix.lower() == ".py" for dep in deps)
+
+
+class ParseCache:
+    """Thread-safe LRU cache of parsed config dictionaries validated against file signatures."""
+
+    def __init__(self, maxsize: int = 128):
+        self._maxsize = maxsize
+        self._entries: OrderedDict[CacheKey, Tuple[Dict[Path, FileSignature], Dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _is_fresh(deps: Dict[Path, FileSignature]) -> bool:
+        return all(_file_signature(path) == signature for path, signature in deps.items())
+
+    def get(self, key: CacheKey) -> Dict[str, Any] | None:
+        """Returns a fresh copy of the cached config or `None` on a miss or a stale entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        deps, config = entry
+        if not self._is_fresh(deps):
+            with self._lock:
+                # Only drop the entry if nobody replaced it in the meantime:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+            return None
+        return deepcopy(config)
+
+    def put(self, key: CacheKey, deps: Dict[Path, FileSignature], config: Dict[str, Any]) -> None:
+        if self._maxsize <= 0:
+            return
+        entry = (dict(deps), deepcopy(config))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path: Path | str | None = None) -> None:
+        """Drops every entry when `path` is `None`, otherwise drops the entries
+        whose import graph contains `path`.
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            resolved = Path(path).resolve()
+            stale = [key for key, (deps, _) in self._entries.items() if resolved in deps]
+            for key in stale:
+                del self._entries[key]
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._entries) > max(maxsize, 0):
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_parse_cache = ParseCache()
+
+
+def get_parse_cache() -> ParseCache:
+    return _parse_cache
+
+
+def invalidate_parse_cache(path: Path | str | None = None) -> None:
+    """Invalidates the process-wide parse cache used by `parse_config(..., use_cache=True)`.
+
+    Args:
+        path (Path | str | None, optional): if provided, only the configs that
+            (transitively) import this file are dropped. Defaults to None,
+            which clears the whole cache.
+    """
+    _parse_cache.invalidate(path)
+
+
+def set_parse_cache_size(maxsize: int) -> None:
+    """Sets the maximum number of configs kept in the process-wide parse cache.
+    Least recently used entries are evicted first. `0` disables caching.
+    """
+    _parse_cache.resize(maxsize)
+
+
+DISK_CACHE_FORMAT = 1
+DiskDependencies = Dict[str, Tuple[str, int, int]]
+
+
+def _content_hash(path: Path) -> str | None:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def default_disk_cache_dir() -> Path:
+    """`$CONFUK_CACHE_DIR` if set, otherwise `confuk` in `$XDG_CACHE_HOME` (`~/.cache` by default)."""
+    if os.environ.get("CONFUK_CACHE_DIR"):
+        return Path(os.environ["CONFUK_CACHE_DIR"])
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "confuk"
+
+
+class DiskCache:
+    """Cache of parsed config dictionaries stored as one pickle file per config.
+
+    A lookup is a single read of the entry followed by a `stat` of every file in
+    the import graph of the config. Files whose signature changed are hashed and
+    compared with the content hash stored in the entry. Any file that cannot be
+    read, a corrupt entry or one written by an incompatible version is a miss.
+
+    Entries are unpickled, which can run arbitrary code, so the directory must only
+    be writable by the user reading from it.
+    """
+
+    def __init__(self, directory: Path | str):
+        self.directory = Path(directory).expanduser()
+
+    def _entry_path(self, key: Hashable) -> Path:
+        digest = hashlib.sha256(repr((DISK_CACHE_FORMAT, key)).encode()).hexdigest()
+        return self.directory / f"{digest[:32]}.pkl"
+
+    @staticmethod
+    def _is_fresh(deps: DiskDependencies) -> bool:
+        for path, (content_hash, mtime_ns, size) in deps.items():
+            signature = _file_signature(Path(path))
+            if signature is None:
+                return False
+            if signature != (mtime_ns, size) and (signature[1] != size or _content_hash(Path(path)) != content_hash):
+                return False
+        return True
+
+    def get(self, key: Hashable) -> Dict[str, Any] | None:
+        try:
+            data = self._entry_path(key).read_bytes()
+        except OSError:
+            return None
+        try:
+            version, deps, config = pickle.loads(data)
+        except Exception:
+            return None
+        if version != DISK_CACHE_FORMAT or not self._is_fresh(deps):
+            return None
+        return config
+
+    def put(self, key: Hashable, deps: Dict[Path, FileSignature], config: Dict[str, Any]) -> None:
+        disk_deps: DiskDependencies = {}
+        for path, signature in deps.items():
+            content_hash = _content_hash(path)
+            # A file modified since it was parsed would be stored with the wrong hash:
+            if content_hash is None or _file_signature(path) != signature:
+                return
+            disk_deps[str(path)] = (content_hash, *signature)
+        data = pickle.dumps((DISK_CACHE_FORMAT, disk_deps, config), protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Written next to the entry and renamed, so that readers never see a partial entry:
+            with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as f:
+                f.write(data)
+            os.replace(f.name, self._entry_path(key))
+        except OSError:
+            # The cache is an optimization, a read-only or full disk must not break parsing
+            pass
+
+    def clear(self) -> None:
+        for entry in self.directory.glob("*.pkl"):
+            entry.unlink(missing_ok=True)
+
+
+def get_disk_cache(directory: Path | str | None = None) -> DiskCache:
+    return DiskCache(directory if directory is not None else default_disk_cache_dir())
+
+
+def clear_disk_cache(directory: Path | str | None = None) -> None:
+    """Removes all the entries of the on-disk cache used by `parse_config(..., disk_cache=...)`.
+
+    Args:
+        directory (Path | str | None, optional): cache directory. Defaults to None,
+            i.e. the default directory (see `default_disk_cache_dir`).
+    """
+    get_disk_cache(directory).clear()
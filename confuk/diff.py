@@ -0,0 +1,113 @@
+"""Structural diffs of parsed configs.
+
+`diff(a, b)` tells which dotted keys were added, removed or changed between two
+configs, e.g. to restart only the parts of a service whose settings changed.
+"""
+from dataclasses import fields, is_dataclass
+from typing import *
+from collections.abc import Mapping
+
+from omegaconf import OmegaConf, DictConfig as OmegaConfigDict
+from pydantic import BaseModel
+
+from .frozen import FrozenConfig
+
+__all__ = ["ConfigDiff", "diff"]
+
+_MISSING = object()
+
+
+class ConfigDiff(NamedTuple):
+    """The differences between two configs, by dotted key, see `diff`.
+
+    A section that is only present in one of the configs is reported once, under its
+    own key, rather than key by key. A diff is falsy when the configs are equal.
+    """
+    # Values of the keys only present in the second config:
+    added: Dict[str, Any]
+    # Values of the keys only present in the first config:
+    removed: Dict[str, Any]
+    # `(old, new)` values of the keys present in both configs:
+    changed: Dict[str, Tuple[Any, Any]]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    @property
+    def paths(self) -> List[str]:
+        """All the dotted keys in the diff."""
+        return [*self.added, *self.removed, *self.changed]
+
+
+def _as_mapping(config: Any) -> Mapping:
+    """Returns the values of a config in any of the formats `parse_config` returns as a mapping."""
+    match config:
+        case OmegaConfigDict():
+            return OmegaConf.to_container(config, resolve=True)
+        case BaseModel():
+            return config.model_dump()
+        case FrozenConfig() | dict():
+            return config
+        case Mapping():
+            # Lazy and shared configs, comparing their views would decode them over and over:
+            to_dict = getattr(config, "to_dict", None)
+            return to_dict() if to_dict is not None else config
+        case _ if is_dataclass(config) and not isinstance(config, type):
+            return {f.name: getattr(config, f.name) for f in fields(config)}
+        case _ if hasattr(config, "__dict__"):
+            # Instances of the classes passed as `cfg_class`:
+            return vars(config)
+        case _:
+            raise TypeError(f"Can't diff a config of type {type(config).__name__}")
+
+
+def _walk(a: Mapping, b: Mapping, prefix: str, out: ConfigDiff) -> None:
+    for key, old in a.items():
+        new = b.get(key, _MISSING)
+        if new is _MISSING:
+            out.removed[f"{prefix}{key}"] = old
+        elif old is new:
+            # Sections shared between the configs, e.g. coming from the same import
+            continue
+        elif isinstance(old, Mapping) and isinstance(new, Mapping):
+            # Equality is checked in C, identical sections are never walked in Python:
+            if old != new:
+                _walk(old, new, f"{prefix}{key}.", out)
+        elif old != new:
+            out.changed[f"{prefix}{key}"] = (old, new)
+    for key, new in b.items():
+        if key not in a:
+            out.added[f"{prefix}{key}"] = new
+
+
+def diff(a: Any, b: Any) -> ConfigDiff:
+    """Compares two configs key by key.
+
+    Sections equal in both configs are skipped as a whole: sections which are the same
+    object in both configs (e.g. the sections a `sweep` variant doesn't override) are
+    skipped without looking at them and the rest are compared with a single (C-level)
+    equality check before descending into them. Separately parsed configs never share
+    sections, so they always take the equality check. Lists are compared as values,
+    like in `flatten`.
+
+    Args:
+        a: The old config, in any of the formats returned by `parse_config` (a dictionary,
+            `EasyDict`, OmegaConf `DictConfig`, `FrozenConfig`, pydantic model or another
+            config class), a `LazyConfig` or a `SharedConfig`. OmegaConf configs are
+            resolved first.
+        b: The new config, in any of those formats.
+
+    Returns:
+        A `ConfigDiff` with the added, removed and changed dotted keys.
+
+    Raises:
+        TypeError: If either of the configs is of an unsupported type.
+    """
+    a, b = _as_mapping(a), _as_mapping(b)
+    # Frozen configs only compare cheaply with other frozen configs:
+    if isinstance(a, FrozenConfig) != isinstance(b, FrozenConfig):
+        a, b = (c.to_dict() if isinstance(c, FrozenConfig) else c for c in (a, b))
+    out = ConfigDiff({}, {}, {})
+    if a is not b:
+        _walk(a, b, "", out)
+    return out
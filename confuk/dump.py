@@ -1,9 +1,11 @@
 import json
 import jsonpickle
 import pickle
+import threading
 import toml
 from omegaconf import DictConfig as OmegaConfDictConfig, OmegaConf
 from ruamel.yaml import YAML
+from .frozen import FrozenConfig
 from .parse import ConfigDict
 from pathlib import Path
 
@@ -13,15 +15,25 @@ SupportedDumpFormats = [
     "toml"
 ]
 
+_local = threading.local()
+
+
+def _yaml_dumper() -> YAML:
+    """Returns the `YAML` instance of the current thread, see `confuk.backends._ruamel_loader`."""
+    yaml = getattr(_local, "yaml", None)
+    if yaml is None:
+        yaml = _local.yaml = YAML(typ="safe")
+    return yaml
+
+
 def _dump_toml(config: ConfigDict, dump_path: Path):
     with open(dump_path, 'w') as f:
         toml.dump(config, f)
 
 
 def _dump_yaml(config: ConfigDict, dump_path: Path):
-    yaml = YAML(typ="safe")
     with open(dump_path, "w") as f:
-        yaml.dump(config, f)
+        _yaml_dumper().dump(config, f)
 
 
 def _dump_json(config: ConfigDict, dump_path: Path):
@@ -53,6 +65,8 @@ def dump_config(config: ConfigDict, path: Path | str, create_parents: bool = Tru
 
     if isinstance(config, OmegaConfDictConfig):
         config = _omegaconf_container(config)
+    elif isinstance(config, FrozenConfig):
+        config = config.to_dict()
 
     match path.suffix.lower():
         case ".json":
@@ -0,0 +1,162 @@
+"""Canonical fingerprints of parsed configs.
+
+`fingerprint(cfg)` is a hex digest of the resolved values of a config which does not
+depend on the order of the keys nor on the format the config was parsed into: a
+dictionary, an `EasyDict`, a `DictConfig`, a `FrozenConfig` or a pydantic model with
+the same values all get the same fingerprint. Digests are computed with BLAKE2 over a
+canonical encoding, never with `hash()`, so they are stable across processes, machines
+and Python versions and can be stored, e.g. to skip configs that were already run.
+
+A `Fingerprinter` remembers the digest of every section it has seen, by identity, so
+configs sharing section objects (e.g. the variants yielded by `sweep`, which share the
+sections they don't override) are fingerprinted incrementally. Separately parsed
+configs never share sections, for them it is no faster than `fingerprint`.
+"""
+import datetime
+import hashlib
+import json
+from dataclasses import fields, is_dataclass
+from pathlib import PurePath
+from typing import *
+from collections.abc import Mapping
+
+from omegaconf import OmegaConf, DictConfig as OmegaConfigDict, ListConfig
+from pydantic import BaseModel
+
+__all__ = ["Fingerprinter", "fingerprint"]
+
+# Bump whenever the encoding changes, so that stored fingerprints are never mistaken for new ones:
+FINGERPRINT_VERSION = 1
+_DIGEST_SIZE = 16
+_PERSON = b"confuk%d" % FINGERPRINT_VERSION
+
+# Encoded by `json` as they are:
+_PLAIN = frozenset({str, int, float, bool, type(None)})
+
+
+def _tagged(value: Any) -> Any:
+    """Encodes the values `json` doesn't support as objects, which can't be mistaken for sections (see `_encode`)."""
+    match value:
+        case datetime.datetime() | datetime.date() | datetime.time():
+            return {"#t": value.isoformat()}
+        case bytes():
+            return {"#b": value.hex()}
+        case PurePath():
+            return str(value)
+        case _:
+            raise TypeError(f"Can't fingerprint a value of type {type(value).__name__}")
+
+
+# Floats are written with `repr`, which gives the shortest exact representation:
+_json = json.JSONEncoder(ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=_tagged)
+
+
+class Fingerprinter:
+    """Computes fingerprints of configs, remembering the digests of their sections.
+
+    Sections are remembered by identity, so calling the same `Fingerprinter` on many
+    configs which share section objects (like the variants yielded by `sweep`) hashes
+    every shared section only once. Configs returned by `parse_config` or
+    `parse_configs` are independent copies, equal sections of theirs are hashed
+    every time. The remembered sections are kept alive and must not be modified while
+    the `Fingerprinter` is in use, call `clear()` (or use a new `Fingerprinter`) if
+    they are.
+    """
+
+    def __init__(self):
+        # The sections themselves are kept, so that their ids are never reused:
+        self._digests: Dict[int, Tuple[Any, str]] = {}
+
+    def __call__(self, config: Any) -> str:
+        """Returns the fingerprint of `config` as a hex string, see `fingerprint`."""
+        match config:
+            case OmegaConfigDict() | ListConfig():
+                config = OmegaConf.to_container(config, resolve=True)
+            case dict() | list() | tuple() | BaseModel():
+                pass
+            case _ if hasattr(config, "to_dict"):
+                # Lazy and shared configs, walking their views would decode them over and over:
+                config = config.to_dict()
+            case Mapping():
+                pass
+            case _:
+                config = _fields(config)
+        return self._encode(config)["#"]
+
+    def clear(self) -> None:
+        """Forgets the digests of all the sections seen so far."""
+        self._digests.clear()
+
+    def _encode(self, value: Any) -> Any:
+        """Returns `value` itself if `json` can encode it, otherwise `{"#": <digest of the section>}`.
+
+        A section is encoded by `json` with its nested sections replaced by their digests,
+        so it's never mistaken for a value, and hashed. Only the scalars in a section are
+        looked at in Python, `json` does the rest in C.
+        """
+        if type(value) in _PLAIN:
+            return value
+        cached = self._digests.get(id(value))
+        if cached is not None:
+            return cached[1]
+        match value:
+            case Mapping():
+                shallow = {k: v if type(v) in _PLAIN else self._encode(v) for k, v in value.items()}
+                tag = "d"
+            case BaseModel():
+                shallow = {k: self._encode(getattr(value, k)) for k in type(value).model_fields}
+                tag = "d"
+            case list() | tuple():
+                shallow = [v if type(v) in _PLAIN else self._encode(v) for v in value]
+                tag = "l"
+            case set() | frozenset():
+                shallow = sorted(_json.encode(self._encode(v)) for v in value)
+                tag = "s"
+            case OmegaConfigDict() | ListConfig():
+                return self._encode(OmegaConf.to_container(value, resolve=True))
+            case _ if is_dataclass(value) and not isinstance(value, type):
+                return self._encode(_fields(value))
+            case _:
+                # Encoded (or rejected) by `_tagged`
+                return value
+        if tag == "d" and not all(type(k) is str for k in shallow):
+            # `json` would turn the keys into strings, so `1` and `"1"` would be the same key:
+            shallow = sorted([_json.encode(k), v] for k, v in shallow.items())
+            tag = "m"
+        payload = (tag + _json.encode(shallow)).encode("utf-8", "surrogatepass")
+        encoded = {"#": hashlib.blake2b(payload, digest_size=_DIGEST_SIZE, person=_PERSON).hexdigest()}
+        self._digests[id(value)] = (value, encoded)
+        return encoded
+
+
+def _fields(config: Any) -> Dict[str, Any]:
+    if is_dataclass(config) and not isinstance(config, type):
+        return {f.name: getattr(config, f.name) for f in fields(config)}
+    if hasattr(config, "__dict__"):
+        # Instances of the classes passed as `cfg_class`:
+        return vars(config)
+    raise TypeError(f"Can't fingerprint a config of type {type(config).__name__}")
+
+
+def fingerprint(config: Any) -> str:
+    """Computes a canonical fingerprint of the resolved values of a config.
+
+    The fingerprint does not depend on the order of keys (or of the items of sets)
+    and is the same for every format the same values can be parsed into: lists and
+    tuples are equivalent, so are mappings of all kinds and pydantic models. It does
+    distinguish between e.g. `1`, `1.0`, `True` and `"1"`.
+
+    To fingerprint many configs that share sections, use one `Fingerprinter` for all of them.
+
+    Args:
+        config: A config in any of the formats returned by `parse_config` (OmegaConf
+            configs are resolved first), a `LazyConfig` or a `SharedConfig`.
+
+    Returns:
+        A hex string of 32 characters.
+
+    Raises:
+        TypeError: If the config holds values of unsupported types. Strings, numbers,
+            booleans, `None`, bytes, dates and times and paths are supported.
+    """
+    return Fingerprinter()(config)
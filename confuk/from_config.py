@@ -22,10 +22,12 @@ Intended to live in ``confuk`` so you never hand-write a constructor full of
 from __future__ import annotations
 
 import typing
+import weakref
 from dataclasses import fields, is_dataclass
-from typing import Any, Type, TypeVar, get_args, get_origin
+from collections.abc import Mapping
+from typing import Any, Callable, Type, TypeVar, get_args, get_origin
 
-from omegaconf import DictConfig, ListConfig, OmegaConf
+from omegaconf import MISSING, DictConfig, ListConfig, MissingMandatoryValue, OmegaConf
 
 __all__ = ["from_config", "ConfigMixin", "config_dataclass"]
 
@@ -69,35 +71,211 @@ def _unwrap_optional(tp: Any) -> Any:
 # --------------------------------------------------------------------------- #
 # Value conversion
 # --------------------------------------------------------------------------- #
-def _convert(value: Any, tp: Any) -> Any:
-    """Convert one config value according to the declared field type ``tp``."""
+def _keep(value: Any) -> Any:
+    return value
+
+
+def _to_native(value: Any) -> Any:
+    # Any OmegaConf container -> native Python, resolving interpolations.
+    if isinstance(value, (DictConfig, ListConfig)):
+        return OmegaConf.to_container(value, resolve=True)
+    # Plain scalar (interpolations already resolved on access).
+    return value
+
+
+def _compile_converter(tp: Any) -> Callable[[Any], Any]:
+    """Return a function converting config values according to the declared field type ``tp``.
+
+    All the inspection of ``tp`` happens here, once, so that converting a value
+    only checks what kind of container it is.
+    """
     # The field explicitly asked for a raw OmegaConf container: don't touch it.
     if tp in (DictConfig, ListConfig):
-        return value
+        return _keep
 
     tp = _unwrap_optional(tp)
 
     # Nested dataclass -> recurse.
-    if is_dataclass(tp) and isinstance(value, DictConfig):
-        return from_config(tp, value)
+    if is_dataclass(tp):
+        def convert_dataclass(value: Any) -> Any:
+            if isinstance(value, DictConfig):
+                return _build(tp, _plan_for(tp), value)
+            return _to_native(value)
+        return convert_dataclass
 
     # Sequence of dataclasses, e.g. list[Layer] / tuple[Layer, ...] -> recurse per item.
     origin = get_origin(tp)
-    if origin in (list, tuple) and isinstance(value, ListConfig):
+    if origin in (list, tuple):
         args = get_args(tp)
         elem_tp = _unwrap_optional(args[0]) if args else Any
         if is_dataclass(elem_tp):
-            items = [from_config(elem_tp, v) for v in value]
-            return tuple(items) if origin is tuple else items
+            def convert_sequence(value: Any) -> Any:
+                if isinstance(value, ListConfig):
+                    plan = _plan_for(elem_tp)
+                    items = [
+                        _build(elem_tp, plan, v if isinstance(v, DictConfig) else OmegaConf.create(v))
+                        for v in value
+                    ]
+                    return tuple(items) if origin is tuple else items
+                return _to_native(value)
+            return convert_sequence
 
-    # Any remaining OmegaConf container -> native Python, resolving interpolations.
-    if isinstance(value, (DictConfig, ListConfig)):
-        return OmegaConf.to_container(value, resolve=True)
+    return _to_native
 
-    # Plain scalar (interpolations already resolved on access).
+
+# --------------------------------------------------------------------------- #
+# Native conversion (plain dicts and lists, no OmegaConf nodes)
+# --------------------------------------------------------------------------- #
+class _NeedsOmegaConf(Exception):
+    """A value read by the native path holds an interpolation (or an OmegaConf node)."""
+
+
+def _is_missing_native(value: Any) -> bool:
+    return isinstance(value, str) and value == MISSING
+
+
+def _copy_native(value: Any) -> Any:
+    """Native counterpart of ``OmegaConf.to_container``: a fresh copy of the containers."""
+    if isinstance(value, str):
+        if "${" in value:
+            raise _NeedsOmegaConf()
+        return value
+    if isinstance(value, (DictConfig, ListConfig)):
+        raise _NeedsOmegaConf()
+    if isinstance(value, Mapping):
+        return {k: _copy_native(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_copy_native(v) for v in value]
     return value
 
 
+def _compile_native_converter(tp: Any) -> Callable[[Any], Any]:
+    """Like ``_compile_converter``, for values of plain dicts and lists."""
+    # The field explicitly asked for a raw OmegaConf container: build one. Checked before
+    # unwrapping ``Optional``, like in ``_compile_converter``, so both paths give the same types.
+    if tp in (DictConfig, ListConfig):
+        def convert_raw(value: Any) -> Any:
+            value = _copy_native(value)
+            return OmegaConf.create(value) if isinstance(value, (dict, list)) else value
+        return convert_raw
+
+    tp = _unwrap_optional(tp)
+
+    if is_dataclass(tp):
+        def convert_dataclass(value: Any) -> Any:
+            if isinstance(value, Mapping) and not isinstance(value, DictConfig):
+                return _build_native(tp, _plan_for(tp), value)
+            return _copy_native(value)
+        return convert_dataclass
+
+    origin = get_origin(tp)
+    if origin in (list, tuple):
+        args = get_args(tp)
+        elem_tp = _unwrap_optional(args[0]) if args else Any
+        if is_dataclass(elem_tp):
+            def convert_sequence(value: Any) -> Any:
+                if isinstance(value, (list, tuple)):
+                    plan = _plan_for(elem_tp)
+                    items = [
+                        _build_native(elem_tp, plan, v)
+                        if isinstance(v, Mapping) and not isinstance(v, DictConfig)
+                        else _build(elem_tp, plan, OmegaConf.create(_copy_native(v)))
+                        for v in value
+                    ]
+                    return tuple(items) if origin is tuple else items
+                return _copy_native(value)
+            return convert_sequence
+
+    return _copy_native
+
+
+# --------------------------------------------------------------------------- #
+# Construction plans
+# --------------------------------------------------------------------------- #
+class _Plan:
+    """Everything ``from_config`` needs to know about a dataclass, worked out once.
+
+    Holds the ``init`` fields paired with their compiled converters (for OmegaConf
+    nodes and for plain values) and the names of all the fields (for ``strict``). Defaults are left to the dataclass ``__init__``.
+    Plans don't refer to their own class, so that caching them keeps no class alive.
+    """
+
+    __slots__ = ("fields", "known", "complete")
+
+    def __init__(self, cls: type):
+        try:
+            hints = typing.get_type_hints(cls)
+            self.complete = True
+        except Exception:
+            hints = _resolve_hints(cls)
+            # Forward references may still become resolvable, so such plans aren't cached:
+            self.complete = False
+        self.fields = tuple(
+            (f.name, _compile_converter(tp), _compile_native_converter(tp))
+            for f, tp in ((f, hints.get(f.name, f.type)) for f in fields(cls))
+            if f.init  # not a constructor argument otherwise
+        )
+        self.known = frozenset(f.name for f in fields(cls))
+
+
+_plans: "weakref.WeakKeyDictionary[type, _Plan]" = weakref.WeakKeyDictionary()
+
+
+def _plan_for(cls: type) -> _Plan:
+    plan = _plans.get(cls)
+    if plan is None:
+        plan = _Plan(cls)
+        if plan.complete:
+            _plans[cls] = plan
+    return plan
+
+
+def _build(cls: type, plan: _Plan, config: DictConfig, strict: bool = False) -> Any:
+    kwargs: dict[str, Any] = {}
+    # Unlike `name in config`, the keys view doesn't resolve the values:
+    present = config.keys()
+    for name, convert, _ in plan.fields:
+        # Skip absent or MISSING ("???") values so the field default applies.
+        if name not in present:
+            continue
+        try:
+            value = config[name]
+        except MissingMandatoryValue:
+            continue
+        kwargs[name] = convert(value)
+
+    if strict:
+        unknown = [k for k in config.keys() if k not in plan.known]
+        if unknown:
+            raise ValueError(
+                f"Unknown config keys for {cls.__name__}: {sorted(unknown)}"
+            )
+
+    return cls(**kwargs)
+
+
+def _build_native(cls: type, plan: _Plan, config: Mapping, strict: bool = False) -> Any:
+    """``_build`` for plain mappings, raises ``_NeedsOmegaConf`` on interpolations."""
+    kwargs: dict[str, Any] = {}
+    for name, _, convert in plan.fields:
+        # Skip absent or MISSING ("???") values so the field default applies.
+        if name not in config:
+            continue
+        value = config[name]
+        if _is_missing_native(value):
+            continue
+        kwargs[name] = convert(value)
+
+    if strict:
+        unknown = [k for k in config.keys() if k not in plan.known]
+        if unknown:
+            raise ValueError(
+                f"Unknown config keys for {cls.__name__}: {sorted(unknown)}"
+            )
+
+    return cls(**kwargs)
+
+
 # --------------------------------------------------------------------------- #
 # Public API
 # --------------------------------------------------------------------------- #
@@ -106,8 +284,10 @@ def from_config(cls: Type[T], config: Any, *, strict: bool = False) -> T:
 
     Args:
         cls: A dataclass type.
-        config: An ``OmegaConf.DictConfig`` (or anything ``OmegaConf.create`` can
-            wrap, e.g. a plain ``dict``).
+        config: An ``OmegaConf.DictConfig`` or a plain mapping (e.g. the output of
+            ``parse_config(..., "dict")``). Plain mappings are read directly, unless one
+            of the values read holds an interpolation, in which case ``config`` is
+            wrapped with ``OmegaConf.create`` first.
         strict: If ``True``, raise ``ValueError`` when ``config`` carries keys that
             are not fields of ``cls``. Default ``False`` (extra keys ignored).
 
@@ -122,31 +302,18 @@ def from_config(cls: Type[T], config: Any, *, strict: bool = False) -> T:
     if not is_dataclass(cls):
         raise TypeError(f"{cls!r} is not a dataclass")
 
-    if not isinstance(config, DictConfig):
-        config = OmegaConf.create(config)
+    plan = _plan_for(cls)
+    if isinstance(config, DictConfig):
+        return _build(cls, plan, config, strict)
 
-    hints = _resolve_hints(cls)
-    kwargs: dict[str, Any] = {}
+    if isinstance(config, Mapping):
+        # Plain values are read directly, OmegaConf is only needed to resolve interpolations:
+        try:
+            return _build_native(cls, plan, config, strict)
+        except _NeedsOmegaConf:
+            pass
 
-    for f in fields(cls):
-        if not f.init:
-            continue  # not a constructor argument
-        # Skip absent or MISSING ("???") values so the field default applies.
-        # The `in` check short-circuits, keeping `is_missing` safe.
-        if f.name not in config or OmegaConf.is_missing(config, f.name):
-            continue
-        tp = hints.get(f.name, f.type)
-        kwargs[f.name] = _convert(config[f.name], tp)
-
-    if strict:
-        known = {f.name for f in fields(cls)}
-        unknown = [k for k in config.keys() if k not in known]
-        if unknown:
-            raise ValueError(
-                f"Unknown config keys for {cls.__name__}: {sorted(unknown)}"
-            )
-
-    return cls(**kwargs)
+    return _build(cls, plan, OmegaConf.create(config), strict)
 
 
 class ConfigMixin:
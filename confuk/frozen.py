@@ -0,0 +1,191 @@
+"""Immutable, hashable configs.
+
+`parse_config(path, "frozen")` returns a `FrozenConfig`: a tree of tuples in which
+every mapping is an instance of a tuple subclass generated for its keys (much like a
+`namedtuple`), lists become tuples and sets become frozensets. A mapping thus costs
+no more than a tuple of its values, attribute access is a C-level tuple lookup, and
+the whole tree is hashable and can be shared between threads without copying.
+"""
+import threading
+from typing import *
+from collections.abc import ItemsView, KeysView, Mapping, ValuesView
+
+try:
+    # The descriptor `namedtuple` uses for its fields, reads the tuple slot directly:
+    from _collections import _tuplegetter
+except ImportError:
+    def _tuplegetter(index: int, doc: str) -> property:
+        return property(lambda self: tuple.__getitem__(self, index), doc=doc)
+
+__all__ = ["FrozenConfig", "freeze"]
+
+
+class FrozenConfig(tuple):
+    """Immutable mapping stored as a tuple of its values, see `freeze`.
+
+    Supports both item access (`cfg["training"]["lr"]`) and attribute access
+    (`cfg.training.lr`), as well as the read-only `Mapping` methods. Keys which are
+    not identifiers, start with an underscore or clash with the methods of `tuple` and
+    `Mapping` (e.g. `count`, `keys`) only support item access. Use `to_dict()` to get
+    plain dictionaries and lists back.
+    """
+
+    __slots__ = ()
+
+    # Set on the subclass generated for every distinct sequence of keys:
+    _fields: ClassVar[Tuple[Hashable, ...]] = ()
+    _positions: ClassVar[Dict[Hashable, int]] = {}
+    # The keys in an order which doesn't depend on the order of `_fields` and the positions
+    # of the values in that order, or `None` if it's the order of `_fields` (see `_shape`):
+    _canonical_fields: ClassVar[Tuple[Hashable, ...]] = ()
+    _canonical_order: ClassVar[Tuple[int, ...] | None] = None
+
+    def __getitem__(self, key: Hashable) -> Any:
+        try:
+            return tuple.__getitem__(self, self._positions[key])
+        except (KeyError, TypeError):
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._fields)
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            return key in self._positions
+        except TypeError:
+            return False
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FrozenConfig):
+            if type(self) is type(other):
+                # Same keys in the same order:
+                return tuple.__eq__(self, other)
+            # Like dictionaries, configs with the same items in a different order are equal:
+            positions = other._positions
+            if len(self._fields) != len(other._fields) or any(k not in positions for k in self._fields):
+                return False
+            return all(v == tuple.__getitem__(other, positions[k]) for k, v in zip(self._fields, tuple.__iter__(self)))
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other.items())
+        if isinstance(other, tuple):
+            # `tuple.__eq__` would compare the values only:
+            return False
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self) -> int:
+        order = self._canonical_order
+        if order is None:
+            return hash((self._canonical_fields, tuple.__hash__(self)))
+        return hash((self._canonical_fields, hash(tuple([tuple.__getitem__(self, i) for i in order]))))
+
+    def __repr__(self) -> str:
+        items = ", ".join(f"{k!r}: {v!r}" for k, v in zip(self._fields, tuple.__iter__(self)))
+        return f"FrozenConfig({{{items}}})"
+
+    def __reduce__(self):
+        return _build, (self._fields, tuple(tuple.__iter__(self)))
+
+    def __copy__(self) -> "FrozenConfig":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenConfig":
+        return self
+
+    def keys(self) -> KeysView:
+        return KeysView(self)
+
+    def values(self) -> ValuesView:
+        return ValuesView(self)
+
+    def items(self) -> ItemsView:
+        return ItemsView(self)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> Dict[Hashable, Any]:
+        """Converts the config back into plain dictionaries and lists."""
+        return {k: _thaw(v) for k, v in zip(self._fields, tuple.__iter__(self))}
+
+
+Mapping.register(FrozenConfig)
+
+_reserved = frozenset(dir(FrozenConfig))
+_shapes: Dict[Tuple[Hashable, ...], Type[FrozenConfig]] = {}
+_shapes_lock = threading.Lock()
+
+
+def _shape(fields: Tuple[Hashable, ...]) -> Type[FrozenConfig]:
+    """Returns the `FrozenConfig` subclass for the given keys, creating it on first use.
+    There is exactly one such class per sequence of keys, since equality relies on it.
+
+    Every class also knows a canonical order of its keys, the same for all the orders of
+    the same keys, which the hash is computed in.
+    """
+    try:
+        return _shapes[fields]
+    except KeyError:
+        pass
+    # Keys of different types can't be compared, hence sorting by the type first:
+    order = tuple(sorted(range(len(fields)), key=lambda i: (type(fields[i]).__qualname__, repr(fields[i]))))
+    namespace = {
+        "__slots__": (),
+        "_fields": fields,
+        "_positions": {k: i for i, k in enumerate(fields)},
+        "_canonical_fields": tuple(fields[i] for i in order),
+        "_canonical_order": None if order == tuple(range(len(fields))) else order,
+    }
+    for i, key in enumerate(fields):
+        if isinstance(key, str) and key.isidentifier() and not key.startswith("_") and key not in _reserved:
+            namespace[key] = _tuplegetter(i, f"Value of `{key}`")
+    with _shapes_lock:
+        return _shapes.setdefault(fields, type("FrozenConfig", (FrozenConfig,), namespace))
+
+
+def _build(fields: Tuple[Hashable, ...], values: Tuple[Any, ...]) -> FrozenConfig:
+    return tuple.__new__(_shape(fields), values)
+
+
+def _thaw(value: Any) -> Any:
+    match value:
+        case FrozenConfig():
+            return value.to_dict()
+        case tuple():
+            return [_thaw(v) for v in value]
+        case frozenset():
+            return set(value)
+        case _:
+            return value
+
+
+def freeze(config: Mapping) -> FrozenConfig:
+    """Converts a config (a dictionary, `EasyDict` or any other mapping) into a `FrozenConfig`.
+
+    Nested mappings are converted recursively, lists and tuples become tuples and sets
+    become frozensets. Any other values are kept as they are, so the result is only
+    hashable as long as they are.
+    """
+    if isinstance(config, FrozenConfig):
+        return config
+    return _build(tuple(config.keys()), tuple(_freeze_value(v) for v in config.values()))
+
+
+def _freeze_value(value: Any) -> Any:
+    match value:
+        case FrozenConfig():
+            return value
+        case Mapping():
+            return freeze(value)
+        case list() | tuple():
+            return tuple(_freeze_value(v) for v in value)
+        case set() | frozenset():
+            return frozenset(_freeze_value(v) for v in value)
+        case _:
+            return value
@@ -0,0 +1,365 @@
+"""Lazy config loading.
+
+`parse_config(path, lazy=True)` returns a `LazyConfig` instead of a dictionary. Only
+the file that was asked for is read upfront, every imported file is read, parsed and
+interpolated the first time a key is looked up that it could contribute to.
+
+Lookups follow the same override order as `confuk.persistent.merge` does when the
+config is parsed eagerly: `post` imports (last one first), then the values of the
+file itself, then `pre` imports (last one first). The first source that has a
+non-mapping value for a key wins, so e.g. reading `training.lr` never touches a big
+catalog imported *before* the file that defines `training.lr`. Mappings are merged
+across all the sources, so listing the keys of a section reads every file that could
+contribute to it.
+
+References to other keys (`${some.key}`) are resolved lazily as well, in the same
+scope in which eager parsing would resolve them. Anything more involved (custom
+resolvers, relative references, parameterized sections) makes the config fall back
+to an eager parse, which is then reused for all subsequent lookups.
+
+Large JSON files are memory-mapped rather than read (see `confuk.lazy_json`), so
+within such a file only the subtrees that are looked up get decoded.
+"""
+import re
+from collections.abc import Mapping
+from pathlib import Path
+from typing import *
+
+from .parse import (
+    ConfigDict,
+    _PARAMETERIZED_SECTION_PATTERN,
+    _SpecialVariableInterpolator,
+    _build_leaf_repl_dict,
+    _build_repl_dict,
+    _copy_containers,
+    _ParseContext,
+    _import_paths,
+    _load_config_file,
+    _parse_context,
+    _parse_leaf_config,
+)
+from .cache import record_dependency
+from .lazy_json import mmap_json
+
+__all__ = ["LazyConfig", "parse_config_lazy"]
+
+_MISSING = object()
+_SHADOWED = object()
+_MAPPING = object()
+
+_REFERENCE = re.compile(r"\$\{([^${}]*)\}")
+_SIMPLE_REFERENCE = re.compile(r"[A-Za-z_][\w-]*(?:\.[\w-]+)*")
+
+
+def _is_value_key(key: Any) -> bool:
+    """Tells whether a top-level key of a file holds a value, rather than its imports or a template."""
+    if key in ("pre", "post"):
+        return False
+    # Templates are only reachable through resolvers, which fall back to eager parsing anyway:
+    return not (isinstance(key, str) and _PARAMETERIZED_SECTION_PATTERN.match(key))
+
+
+class _NeedsEagerParse(Exception):
+    """Raised when a value can only be resolved by parsing the whole config."""
+
+
+class _View:
+    """A file of the import graph merged with its imports, with or without its `post` imports."""
+
+    def __init__(self, layer: "_Layer", with_post: bool):
+        self.layer = layer
+        self.with_post = with_post
+
+    def _sources(self) -> Iterator[Union["_View", "_Layer"]]:
+        """Yields the sources of values from the highest to the lowest precedence."""
+        layer = self.layer
+        layer.load()
+        if self.with_post:
+            for view in reversed(layer.post):
+                yield view
+        yield layer
+        for view in reversed(layer.pre):
+            yield view
+
+    def lookup(self, keys: Tuple[str, ...]) -> Any:
+        for source in self._sources():
+            found = source.lookup(keys)
+            if found is _MISSING:
+                continue
+            return found
+        return _MISSING
+
+    def probe(self, keys: Tuple[str, ...]) -> Any:
+        """Like `lookup` but does not resolve values, only tells whether there is one."""
+        for source in self._sources():
+            found = source.probe(keys)
+            if found is _MISSING:
+                continue
+            return found
+        return _MISSING
+
+    def keys(self, keys: Tuple[str, ...]) -> List[str]:
+        """Lists the keys of the mapping under `keys` in the order eager merging would produce."""
+        out = {}
+        for source in reversed(list(self._sources())):
+            found = source.probe(keys)
+            if found is _MAPPING:
+                out.update(dict.fromkeys(source.keys(keys)))
+            elif found is not _MISSING:
+                # A non-mapping with a higher precedence replaces everything below it:
+                out = {}
+        return list(out)
+
+
+class _Layer:
+    """The values of a single config file, read on first use."""
+
+    def __init__(self,
+                 loader: "_LazyLoader",
+                 path: Path,
+                 chain: Tuple[Path, ...],
+                 scope: _View | None = None,
+                 deferred_scope: _View | None = None):
+        self.path = path
+        self.loader = loader
+        self.chain = chain
+        # Scope in which the values of this file are interpolated. A file imported
+        # in `post` is interpolated by the file that merges it in last, any other
+        # file by itself, before its own `post` imports are merged in:
+        self.scope = scope if scope is not None else _View(self, with_post=False)
+        # Scope in which the values merged in by the `post` imports of this file are interpolated:
+        self.deferred_scope = deferred_scope if deferred_scope is not None else _View(self, with_post=True)
+        self.own: ConfigDict | None = None
+        self.pre: List[_View] = []
+        self.post: List[_View] = []
+        self.interpolator = _SpecialVariableInterpolator(_build_repl_dict(self.scope.layer.path))
+
+    def load(self) -> None:
+        if self.own is not None:
+            return
+        raw = self.loader.read(self.path)
+        self.pre = [_View(self.loader.layer(p, self.chain, None, self.scope), with_post=True)
+                    for p in _import_paths("pre", raw, self.path) or []]
+        self.post = [_View(self.loader.layer(p, self.chain, self.deferred_scope, self.deferred_scope), with_post=True)
+                     for p in _import_paths("post", raw, self.path) or []]
+        # Kept as it was read, values of memory-mapped JSON files are only decoded once they are looked up:
+        self.own = raw
+
+    def _navigate(self, keys: Tuple[str, ...]) -> Any:
+        if keys and not _is_value_key(keys[0]):
+            return _MISSING
+        node = self.own
+        for key in keys:
+            if not isinstance(node, Mapping):
+                return _SHADOWED
+            if key not in node:
+                return _MISSING
+            node = node[key]
+        return node
+
+    def probe(self, keys: Tuple[str, ...]) -> Any:
+        self.load()
+        node = self._navigate(keys)
+        if node is _MISSING or node is _SHADOWED:
+            return node
+        return _MAPPING if isinstance(node, Mapping) else node
+
+    def lookup(self, keys: Tuple[str, ...]) -> Any:
+        node = self.probe(keys)
+        if node is _MISSING or node is _SHADOWED or node is _MAPPING:
+            return node
+        return self.loader.resolve(self, node)
+
+    def keys(self, keys: Tuple[str, ...]) -> List[str]:
+        node = self._navigate(keys)
+        if not isinstance(node, Mapping):
+            return []
+        return [k for k in node.keys() if keys or _is_value_key(k)]
+
+
+class _LazyLoader:
+    """Shared state of one lazily loaded config: the files read so far and the eager fallback."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._files: Dict[Path, ConfigDict] = {}
+        self._layers: Dict[Tuple[Path, int | None, int | None], _Layer] = {}
+        self._resolving: List[Tuple[int, Tuple[str, ...]]] = []
+        self._eager: ConfigDict | None = None
+        # Files are read long after the config was requested, `${cwd}` refers to the working directory at that point:
+        self.context = _ParseContext()
+        with _parse_context(self.context):
+            self._leaf_interpolator = _SpecialVariableInterpolator(_build_leaf_repl_dict(path))
+            self.root = _Layer(self, path, (path.resolve(),))
+        self.view = _View(self.root, with_post=True)
+
+    def read(self, path: Path) -> ConfigDict:
+        resolved = path.resolve()
+        if resolved not in self._files:
+            if path.suffix.lower() == ".json":
+                record_dependency(path)
+                self._files[resolved] = mmap_json(path)
+                return self._files[resolved]
+            config_dict, post_fn = _load_config_file(path)
+            if post_fn is not None and resolved == self.root.chain[0]:
+                # `post` functions of Python configs work on the complete config:
+                raise _NeedsEagerParse()
+            self._files[resolved] = config_dict
+        return self._files[resolved]
+
+    def layer(self,
+              path: Path,
+              chain: Tuple[Path, ...],
+              scope: _View | None,
+              deferred_scope: _View) -> _Layer:
+        resolved = path.resolve()
+        if resolved in chain:
+            cycle = chain[chain.index(resolved):] + (resolved,)
+            raise ValueError("Circular import detected: " + " -> ".join(str(p) for p in cycle))
+        key = (resolved, None if scope is None else id(scope), id(deferred_scope))
+        if key not in self._layers:
+            with _parse_context(self.context):
+                self._layers[key] = _Layer(self, path, chain + (resolved,), scope, deferred_scope)
+        return self._layers[key]
+
+    def eager(self) -> ConfigDict:
+        if self._eager is None:
+            self._eager = _parse_leaf_config(self.path, resolver=self.context.imports)
+        return self._eager
+
+    def resolve(self, layer: _Layer, value: Any) -> Any:
+        """Interpolates a value defined in `layer` the way eager parsing would."""
+        value = self._leaf_interpolator(layer.interpolator(value))
+        return self._resolve_references(layer.scope, value)
+
+    def _resolve_references(self, scope: _View, value: Any) -> Any:
+        match value:
+            case str() if "${" in value:
+                return self._resolve_string(scope, value)
+            case dict():
+                return {k: self._resolve_references(scope, v) for k, v in value.items()}
+            case list():
+                return [self._resolve_references(scope, v) for v in value]
+            case _:
+                return value
+
+    def _resolve_string(self, scope: _View, value: str) -> Any:
+        references = _REFERENCE.findall(value)
+        if "\\${" in value or not references or not all(_SIMPLE_REFERENCE.fullmatch(r) for r in references):
+            raise _NeedsEagerParse()
+        if value == f"${{{references[0]}}}":
+            return self._resolve_reference(scope, references[0])
+        return _REFERENCE.sub(lambda m: str(self._resolve_reference(scope, m.group(1))), value)
+
+    def _resolve_reference(self, scope: _View, reference: str) -> Any:
+        keys = tuple(reference.split("."))
+        marker = (id(scope), keys)
+        if marker in self._resolving:
+            raise ValueError(f"Circular interpolation of `{reference}` in {scope.layer.path}")
+        self._resolving.append(marker)
+        try:
+            found = scope.lookup(keys)
+            if found is _MISSING or found is _SHADOWED:
+                raise KeyError(f"Interpolation key `{reference}` not found in {scope.layer.path}")
+            if found is _MAPPING:
+                return self._materialize(scope, keys)
+            return found
+        finally:
+            self._resolving.pop()
+
+    def _materialize(self, view: _View, keys: Tuple[str, ...]) -> ConfigDict:
+        out = {}
+        for key in view.keys(keys):
+            found = view.lookup(keys + (key,))
+            out[key] = self._materialize(view, keys + (key,)) if found is _MAPPING else found
+        return out
+
+    def get(self, keys: Tuple[str, ...]) -> Any:
+        if self._eager is None:
+            try:
+                found = self.view.lookup(keys)
+            except _NeedsEagerParse:
+                return self._get_eager(keys)
+            if found is _MAPPING:
+                return LazyConfig(self, keys)
+            return _MISSING if found is _SHADOWED else found
+        return self._get_eager(keys)
+
+    def _get_eager(self, keys: Tuple[str, ...]) -> Any:
+        node = self.eager()
+        for key in keys:
+            if not isinstance(node, dict) or key not in node:
+                return _MISSING
+            node = node[key]
+        return LazyConfig(self, keys) if isinstance(node, dict) else node
+
+    def keys(self, keys: Tuple[str, ...]) -> List[str]:
+        if self._eager is None:
+            try:
+                return self.view.keys(keys)
+            except _NeedsEagerParse:
+                pass
+        node = self.eager()
+        for key in keys:
+            node = node[key]
+        return list(node.keys())
+
+
+class LazyConfig(Mapping):
+    """Read-only view of a config whose imports are only parsed when they are needed.
+
+    Supports both item access (`cfg["training"]["lr"]`) and attribute access
+    (`cfg.training.lr`). Nested sections are returned as `LazyConfig` views as well,
+    use `to_dict()` to get a plain dictionary.
+    """
+
+    __slots__ = ("_loader", "_keys")
+
+    def __init__(self, loader: _LazyLoader, keys: Tuple[str, ...] = ()):
+        self._loader = loader
+        self._keys = keys
+
+    def __getitem__(self, key: str) -> Any:
+        found = self._loader.get(self._keys + (key,))
+        if found is _MISSING:
+            raise KeyError(key)
+        return found
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(f"{'.'.join(self._keys + (name,))} not found in {self._loader.path}") from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._loader.keys(self._keys))
+
+    def __len__(self) -> int:
+        return len(self._loader.keys(self._keys))
+
+    def __repr__(self) -> str:
+        where = ".".join(self._keys)
+        return f"LazyConfig({str(self._loader.path)!r}{', ' + repr(where) if where else ''})"
+
+    def to_dict(self) -> ConfigDict:
+        """Parses the whole config (if that has not happened yet) and returns
+        a copy of this section of it as a plain dictionary.
+        """
+        node = self._loader.eager()
+        for key in self._keys:
+            node = node[key]
+        # The eager parse backs all subsequent lookups, so it must not be handed out:
+        return _copy_containers(node)
+
+
+def parse_config_lazy(config_file_path: Path | str) -> LazyConfig:
+    """Returns a `LazyConfig` view of the config file, see `parse_config(..., lazy=True)`."""
+    config_file_path = Path(config_file_path)
+    loader = _LazyLoader(config_file_path)
+    try:
+        loader.root.load()
+    except _NeedsEagerParse:
+        loader.eager()
+    return LazyConfig(loader)
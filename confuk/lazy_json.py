@@ -0,0 +1,137 @@
+"""Memory-mapped JSON objects, decoded one subtree at a time.
+
+`mmap_json(path)` maps the file into memory and returns a read-only `Mapping` of its
+top-level object. Nothing is decoded upfront: the first time the keys of an object
+are needed, only that object is scanned for the byte spans of its values (nested
+values are skipped over, not decoded). Nested objects are returned as further
+`JSONObjectView`s of the same mapping and every other value is decoded from its
+span when it is first accessed.
+
+Strings, numbers and literals are skipped by the regex engine, only the brackets of
+nested arrays and objects take a step in Python. Indexing a 17 MiB object holding a
+list of 2M numbers takes about a third of what `json.loads` does, whereas a list of
+500k small objects takes about as long to skip as to decode.
+
+Since the pages of the mapping belong to the page cache, processes reading the same
+file share them, and each process only holds the subtrees it has actually accessed.
+"""
+import json
+import mmap
+import re
+from collections.abc import Mapping
+from pathlib import Path
+from typing import *
+
+from .backends import parse_bytes
+
+__all__ = ["JSONObjectView", "mmap_json"]
+
+# Files smaller than this are decoded at once, mapping them doesn't pay off:
+MMAP_JSON_MIN_SIZE = 1 << 20
+
+# A string with escapes, unrolled so that the regex engine never backtracks into it:
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+# A member of an object up to the start of its value:
+_MEMBER = re.compile(rb"[ \t\r\n]*(" + _STRING + rb")[ \t\r\n]*:[ \t\r\n]*")
+# Everything up to and including the next bracket, strings are skipped as a whole:
+_BRACKET = re.compile(rb'[^"\[\]{}]*(?:' + _STRING + rb'[^"\[\]{}]*)*[\[\]{}]')
+# Everything up to the next comma or bracket, i.e. a scalar value with the whitespace around it:
+_SCALAR = re.compile(rb'[^"\[\]{},]*(?:' + _STRING + rb'[^"\[\]{},]*)*')
+_WHITESPACE = re.compile(rb"[ \t\r\n]*")
+_OPENING = frozenset(b"{[")
+
+
+class JSONObjectView(Mapping):
+    """Read-only view of a JSON object within a memory-mapped file, see `mmap_json`."""
+
+    __slots__ = ("_buffer", "_start", "_end", "_spans", "_values")
+
+    def __init__(self, buffer: mmap.mmap, start: int, end: int):
+        # `start` points at the opening brace, `end` right after the closing one
+        self._buffer = buffer
+        self._start = start
+        self._end = end
+        self._spans: Dict[str, Tuple[int, int]] | None = None
+        self._values: Dict[str, Any] = {}
+
+    def _index(self) -> Dict[str, Tuple[int, int]]:
+        if self._spans is not None:
+            return self._spans
+        buffer, end, spans = self._buffer, self._end, {}
+        pos = self._start + 1
+        while (member := _MEMBER.match(buffer, pos, end)) is not None:
+            value_start = pos = member.end()
+            if buffer[pos] in _OPENING:
+                pos = _skip_container(buffer, pos, end)
+            pos = _SCALAR.match(buffer, pos, end).end()
+            spans[json.loads(member.group(1))] = (value_start, pos)
+            if buffer[pos] != ord(","):
+                break
+            pos += 1
+        self._spans = spans
+        return spans
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        start, end = self._index()[key]
+        if self._buffer[start] == ord("{"):
+            value = JSONObjectView(self._buffer, start, _rstrip(self._buffer, start, end))
+        else:
+            value = parse_bytes("json", self._buffer[start:end])
+        self._values[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index())
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index()
+
+    def __repr__(self) -> str:
+        return f"JSONObjectView(keys={list(self._index())!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Decodes the whole object."""
+        return parse_bytes("json", self._buffer[self._start:self._end])
+
+
+def _skip_container(buffer: mmap.mmap, start: int, end: int) -> int:
+    """Returns the position right after the array or object starting at `start`.
+    Only brackets take a step of the loop, strings and scalars are skipped by the regex engine.
+    """
+    depth, pos = 0, start
+    while True:
+        pos = _BRACKET.match(buffer, pos, end).end()
+        depth += 1 if buffer[pos - 1] in _OPENING else -1
+        if depth == 0:
+            return pos
+
+
+def _rstrip(buffer: mmap.mmap, start: int, end: int) -> int:
+    while end > start and buffer[end - 1] in b" \t\r\n":
+        end -= 1
+    return end
+
+
+def mmap_json(path: Path | str) -> JSONObjectView | Dict[str, Any]:
+    """Maps a JSON file into memory and returns a lazily decoded view of its top-level object.
+    Files smaller than `MMAP_JSON_MIN_SIZE` (or not holding an object) are simply decoded.
+    """
+    with open(path, "rb") as f:
+        size = f.seek(0, 2)
+        if size == 0 or size < MMAP_JSON_MIN_SIZE:
+            f.seek(0)
+            return parse_bytes("json", f.read())
+        # The mapping stays valid after the file is closed:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    start = _WHITESPACE.match(buffer).end()
+    end = _rstrip(buffer, start, len(buffer))
+    if buffer[start] != ord("{"):
+        return parse_bytes("json", buffer[:])
+    return JSONObjectView(buffer, start, end)
@@ -14,10 +14,12 @@ def main():
 @main.command()
 @click.argument('config_file', type=click.Path(exists=True, path_type=Path))
 @click.option('-t', '--tree', is_flag=True, help="Print in a tree format")
-def parse(config_file: Path, tree: bool):
+@click.option('--cache', is_flag=True,
+              help="Reuse the result of an earlier run from the on-disk cache ($CONFUK_CACHE_DIR or ~/.cache/confuk)")
+def parse(config_file: Path, tree: bool, cache: bool):
     console = Console()
     console.print(f"[blue]{config_file}[/blue]")
-    cfg = parse_config(config_file)
+    cfg = parse_config(config_file, disk_cache=cache)
     display_in_console(cfg, tree, unpack=True, md=True)
 
 
@@ -1,47 +1,70 @@
 import sys
 import argparse
 import functools
-from .parse import parse_config, SupportedConfigFormat, ConfigDict
+from itertools import chain
+from .parse import parse_config, SupportedConfigFormat, ConfigDict, _ParseContext, _parse_leaf_config
+from .persistent import assoc_in, get_in
+from .sweep import _has_interpolation, _resolve_overrides
 from pathlib import Path
 from typing import *
 from rich.console import Console
-from omegaconf import OmegaConf
 
 
-def _load_and_override_config(config_path, config_format, named_overrides: dict, positional_overrides, verbose, console):
-    """Load config from path, apply named and positional overrides, return in the target format."""
+def _load_and_override_config(config_path, config_format, named_overrides: dict, positional_overrides, verbose, console,
+                              disk_cache: bool | Path | str = False):
+    """Load config from path, apply named and positional overrides, return in the target format.
+
+    Overrides are applied to the parsed dictionary with `assoc_in`, which copies only the
+    sections on the path to the overridden key, and only the overridden values are
+    resolved afterwards (see `confuk.sweep`), so no OmegaConf config is built on the way.
+    Overrides with interpolations are resolved in the scope of the parse, so they can use the
+    parameterized sections of the config, e.g. `model=${layer:2}`.
+    """
     if verbose:
         console.print(f"Fetching config: {config_path}")
-    cfg = parse_config(Path(config_path), "o")
+    context = None
+    values = chain(named_overrides.values(), (arg.partition("=")[2] for arg in positional_overrides))
+    if any(isinstance(value, str) and "${" in value for value in values):
+        # Only a parse in this context keeps the parameterized sections, a cached config comes without them:
+        context = _ParseContext()
+        cfg = _parse_leaf_config(Path(config_path), context=context)
+    else:
+        cfg = parse_config(Path(config_path), disk_cache=disk_cache)
     if verbose:
         console.print(f"[green]Parsing of config at {config_path} succeeded[/green]")
 
+    overridden = []
+
     # Named overrides: arg name -> value (from argparse namespace or click kwargs)
     # Only applies when the key already exists in the config.
     for key, value in named_overrides.items():
         if value is None:
             continue
-        existing = OmegaConf.select(cfg, key)
+        existing = get_in(cfg, key.split("."), None)
         if existing is not None:
             if verbose:
                 console.print(f"Updating {key} with {value}")
             type_ = type(existing)
             if type_ is not type(None):
                 value = type_(value)
-            OmegaConf.update(cfg, key, value)
+            cfg = assoc_in(cfg, key.split("."), value)
+            overridden.append(key)
 
     # Positional key=value overrides (original confuk syntax)
     for arg in positional_overrides:
         key, value = arg.split("=")
         if verbose:
             console.print(f"Updating {key} with {value}")
-        type_ = type(OmegaConf.select(cfg, key))
+        type_ = type(get_in(cfg, key.split("."), None))
         if type_ is not type(None):
             value = type_(value)
-        OmegaConf.update(cfg, key, value)
+        cfg = assoc_in(cfg, key.split("."), value)
+        overridden.append(key)
 
-    cfg_primitive = OmegaConf.to_container(cfg, resolve=True)
-    return parse_config(cfg_primitive, config_format)
+    pending = [key for key in overridden if _has_interpolation(get_in(cfg, key.split(".")))]
+    if pending:
+        cfg = _resolve_overrides(cfg, pending, context)
+    return parse_config(cfg, config_format)
 
 
 def _reserve_config_arg(parser: argparse.ArgumentParser):
@@ -59,7 +82,8 @@ def main(config: Path | str,
          config_format: SupportedConfigFormat,
          verbose=False,
          program_description="",
-         parser: "argparse.ArgumentParser | None" = None):
+         parser: "argparse.ArgumentParser | None" = None,
+         disk_cache: bool | Path | str = False):
     """
     Decorator that injects a parsed config object into a `main` function.
 
@@ -72,6 +96,8 @@ def main(config: Path | str,
     - A minimal parser with `-c`/`--config`, `-v`/`--verbose`, and positional
       `key=value` overrides is created automatically.
     - The decorated function is called as `original_main(cfg)`.
+
+    With `disk_cache` the parsed config is cached on disk between runs, see `parse_config`.
     """
 
     console = Console()
@@ -95,7 +121,8 @@ def main(config: Path | str,
                 ns_dict = {k: v for k, v in vars(parsed).items() if k not in reserved}
                 positional = getattr(parsed, 'overrides', ())
 
-                cfg = _load_and_override_config(config_, config_format, ns_dict, positional, verbose_, console)
+                cfg = _load_and_override_config(config_, config_format, ns_dict, positional, verbose_, console,
+                                                disk_cache)
                 return original_main(cfg, parsed)
 
             else:
@@ -113,7 +140,8 @@ def main(config: Path | str,
 
                 config_ = parsed.config if parsed.config is not None else config
 
-                cfg = _load_and_override_config(config_, config_format, {}, parsed.overrides, parsed.verbose, console)
+                cfg = _load_and_override_config(config_, config_format, {}, parsed.overrides, parsed.verbose, console,
+                                                disk_cache)
                 return original_main(cfg)
 
         return _main
@@ -163,7 +191,8 @@ def click_option(*args, cfg_path: str | None = None, **kwargs):
 
 def click_main(config: Path | str,
                config_format: SupportedConfigFormat,
-               verbose=False):
+               verbose=False,
+               disk_cache: bool | Path | str = False):
     """
     Decorator for click commands that injects a parsed config as the first argument.
 
@@ -183,6 +212,7 @@ def click_main(config: Path | str,
       the option name, if such a key exists in the config.
     - The original callback is called as ``original_callback(cfg, **kwargs)`` where
       ``kwargs`` contains all click options (excluding ``config``).
+    - With ``disk_cache`` the parsed config is cached on disk between runs, see ``parse_config``.
     """
     try:
         import click
@@ -227,7 +257,8 @@ def click_main(config: Path | str,
                 for k, v in kwargs.items()
                 if v is not None
             }
-            cfg = _load_and_override_config(config_, config_format, named_overrides, (), verbose, console)
+            cfg = _load_and_override_config(config_, config_format, named_overrides, (), verbose, console,
+                                            disk_cache)
             return original_callback(cfg, **kwargs)
 
         click_cmd.callback = new_callback
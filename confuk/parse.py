@@ -1,25 +1,36 @@
 import re
-import toml
-import json
 import importlib.util
+import contextvars
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain, repeat
 from typing import *
 from inspect import signature
 from pydantic import BaseModel
 from pathlib import Path
 from easydict import EasyDict as edict
 from omegaconf import OmegaConf, DictConfig as OmegaConfigDict
-from ruamel.yaml import YAML
-from copy import deepcopy
+from .backends import get_parser_backend, parse_bytes
+from .frozen import FrozenConfig, freeze
+from .persistent import merge
+from .cache import (DiskCache, get_disk_cache, get_parse_cache, is_cacheable, record_dependency, record_dynamic_value,
+                    track_dependencies)
 
 CfgClass = Type[Any]
 PydanticCfgClass = Type[BaseModel]
 ConfigDict = Dict[str, Any]
 SupportedCfgLiterals = Literal[
-    "dict", "d"
-    "attr", "edict", "ed"
-    "omega", "omegaconf", "o"
+    "dict", "d",
+    "attr", "edict", "ed",
+    "omega", "omegaconf", "o",
+    "frozen",
 ]
 SupportedConfigFormat = SupportedCfgLiterals | CfgClass | PydanticCfgClass | None
+ParallelImports = Literal["thread", "process"] | Executor | None
+
+_PARAMETERIZED_SECTION_PATTERN = re.compile(r'^(\w+)\(([\w\s,]+)\)$')
 
 
 def _repls_with_lr_delimiters(repls: Dict[str, Any], lr_delimiters: Tuple[str, str] = ("{", "}")):
@@ -38,7 +49,7 @@ def _build_repl_dict_without_delimiters(config_file_path: Path) -> Dict[str, Any
         "$this_filename": resolved_cfg_file_path.name,
         "$this_filename_stem": resolved_cfg_file_path.stem,
         "$this_filename_suffix": resolved_cfg_file_path.suffix.replace(".", ""),
-        "$cwd": Path.cwd()
+        "$cwd": _current_cwd()
     }
 
 
@@ -64,67 +75,345 @@ def _variable_interpolation(ipt: str, key: str, repl_dict: Dict[str, Any]):
     raise KeyError(f"{key} not found in the dictionary provided. Keys that exist: {tuple(repl_dict.keys())}")
 
 
+@lru_cache(maxsize=None)
+def _compile_repl_pattern(keys: Tuple[str, ...]) -> re.Pattern:
+    """Compiles one regex matching any of the special variables in `keys`.
+    Longer keys come first, so that e.g. `$this_dirname` is not consumed as `$this_dir`.
+    """
+    return re.compile("|".join(re.escape(k) for k in sorted(keys, key=len, reverse=True)))
+
+
+class _SpecialVariableInterpolator:
+    """Replaces all the special variables from a repl dict in a single walk over the config.
+
+    Containers are only rebuilt when something inside them changed, everything
+    else is shared with the input.
+    """
+
+    def __init__(self, repls: Dict[str, Any]):
+        self._repls = {k: str(v) for k, v in repls.items()}
+        self._pattern = _compile_repl_pattern(tuple(self._repls.keys()))
+
+    def _repl(self, match: re.Match) -> str:
+        return self._repls[match.group(0)]
+
+    def __call__(self, obj: Any) -> Any:
+        match obj:
+            case str():
+                return self._pattern.sub(self._repl, obj) if "$" in obj else obj
+            case dict():
+                out = None
+                for k, v in obj.items():
+                    new_v = self(v)
+                    if new_v is not v:
+                        if out is None:
+                            out = dict(obj)
+                        out[k] = new_v
+                return obj if out is None else out
+            case list():
+                out = None
+                for i, v in enumerate(obj):
+                    new_v = self(v)
+                    if new_v is not v:
+                        if out is None:
+                            out = list(obj)
+                        out[i] = new_v
+                return obj if out is None else out
+            case _:
+                return obj
+
+
 def _handle_import_path(config_file_path_path: Path, import_path: Path | str) -> Path:
-    repls = _build_repl_dict(config_file_path_path)
-    for key in repls.keys():
-        import_path = _variable_interpolation(import_path, key, repls)
+    import_path = _SpecialVariableInterpolator(_build_repl_dict(config_file_path_path))(str(import_path))
     if import_path == config_file_path_path:
         raise ValueError("Import path cannot be the same as the current file")
     return Path(import_path)
 
 
-def _handle_imports(imports_list: List[Path], skip_variable_interpolation: bool = False) -> ConfigDict:
+class _ImportResolver:
+    """Resolves the import graph of a single parse.
+
+    Every node of the graph is parsed (and interpolated) exactly once, no matter
+    how many paths lead to it, e.g. a base config shared by several imported
+    configs (a diamond). The results handed out are shared between the importers,
+    so they must be treated as read-only, which `confuk.persistent.merge` guarantees.
+    A node that used parameterized sections defined outside of it (e.g. by an earlier
+    sibling of its importer) is only reused where the same sections are in scope,
+    otherwise it's parsed again.
+
+    Circular imports are reported with the whole chain of files involved.
+
+    If an `executor` is provided, the files are read and parsed on it ahead of time:
+    as soon as a file is loaded, all the files it imports are submitted as well, so
+    siblings are read concurrently. Imports are still merged one after another in the
+    declared order, so the result does not depend on which file is read first.
+    """
+
+    def __init__(self, executor: Executor | None = None, cwd: Path | None = None):
+        # The results depend on the working directory (`${cwd}`), so it's fixed upfront:
+        self.cwd = Path.cwd() if cwd is None else cwd
+        self._parsed: Dict[Tuple[Path, bool], Tuple[ConfigDict, Callable[[ConfigDict], None] | None]] = {}
+        self._stack: List[Path] = []
+        self._templates: Dict[Tuple[Path, bool], TemplateLog] = {}
+        # Parameterized sections a node used, but which were defined outside of it:
+        self._uses: Dict[Tuple[Path, bool], TemplateLog] = {}
+        # The file each parameterized section was defined in:
+        self._definers: Dict[_TemplateResolver, Path] = {}
+        self.graph: Dict[Path, List[Path]] = {}
+        self._executor = executor
+        self._loading: Dict[Path, Future] = {}
+        # Files are submitted from the callbacks of the executor as well:
+        self._loading_lock = threading.Lock()
+        # Workers do not inherit context variables, dependencies are recorded on submission instead:
+        self._context = contextvars.copy_context()
+
+    def _prefetch(self, config_file_path: Path) -> None:
+        resolved = config_file_path.resolve()
+        with self._loading_lock:
+            # Python configs are executed in this process, their `post` functions cannot be sent back from a worker:
+            if resolved in self._loading or resolved.suffix.lower() == ".py":
+                return
+            self._context.copy().run(record_dependency, resolved)
+            try:
+                future = self._executor.submit(_load_config_file, resolved)
+            except RuntimeError:
+                # Executor is shutting down, the file will be loaded on demand:
+                return
+            self._loading[resolved] = future
+        future.add_done_callback(lambda f: self._prefetch_imports(f, resolved))
+
+    def _prefetch_imports(self, future: Future, config_file_path: Path) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        config_dict, _ = future.result()
+        try:
+            paths = (_import_paths("pre", config_dict, config_file_path) or []) \
+                + (_import_paths("post", config_dict, config_file_path) or [])
+        except Exception:
+            # Surfaces again, in order, when the file is handled on the main thread
+            return
+        for path in paths:
+            self._prefetch(path)
+
+    def preload(self, loaded: Dict[Path, Tuple[ConfigDict, Callable[[ConfigDict], None] | None]]) -> None:
+        """Hands over files that were already loaded elsewhere, keyed by their resolved paths."""
+        for path, result in loaded.items():
+            future = Future()
+            future.set_result(result)
+            self._loading[path] = future
+
+    def closure(self, config_file_path: Path) -> Set[Path]:
+        """Resolved paths of `config_file_path` and of every file it imports, directly or not,
+        as recorded by the parses so far.
+        """
+        closure: Set[Path] = set()
+        pending = [config_file_path.resolve()]
+        while pending:
+            path = pending.pop()
+            if path not in closure:
+                closure.add(path)
+                pending.extend(self.graph.get(path, ()))
+        return closure
+
+    def invalidate(self, paths: Iterable[Path]) -> Set[Path]:
+        """Forgets the parse results of `paths` and of every file depending on them, directly or
+        not, so that parsing again re-reads just those files and reuses the rest of the graph.
+        A file depends on the files it imports and on the files defining the parameterized
+        sections it used. Returns the resolved paths of the invalidated files.
+        """
+        importers: Dict[Path, Set[Path]] = {}
+        for importer, imported in self.graph.items():
+            for path in imported:
+                importers.setdefault(path, set()).add(importer)
+        for (user, _), uses in self._uses.items():
+            for _, template in uses:
+                if template in self._definers:
+                    importers.setdefault(self._definers[template], set()).add(user)
+        stale: Set[Path] = set()
+        pending = [Path(p).resolve() for p in paths]
+        while pending:
+            path = pending.pop()
+            if path not in stale:
+                stale.add(path)
+                pending.extend(importers.get(path, ()))
+        for key in [key for key in self._parsed if key[0] in stale]:
+            del self._parsed[key]
+            self._templates.pop(key, None)
+            self._uses.pop(key, None)
+        for path in stale:
+            # Recorded again once the file is parsed:
+            self.graph.pop(path, None)
+            self._loading.pop(path, None)
+        for template in [t for t, path in self._definers.items() if path in stale]:
+            del self._definers[template]
+        return stale
+
+    def load(self, config_file_path: Path) -> tuple[ConfigDict, Callable[[ConfigDict], None] | None]:
+        if self._executor is not None:
+            self._prefetch(config_file_path)
+        future = self._loading.get(config_file_path.resolve())
+        if future is None:
+            return _load_config_file(config_file_path)
+        return future.result()
+
+    def parse(self, config_file_path: Path, skip_variable_interpolation: bool = False):
+        if _current_parse_context.get() is None:
+            with _parse_context(_ParseContext(self)):
+                return self.parse(config_file_path, skip_variable_interpolation)
+        resolved = config_file_path.resolve()
+        if resolved in self._stack:
+            chain = self._stack[self._stack.index(resolved):] + [resolved]
+            raise ValueError("Circular import detected: " + " -> ".join(str(p) for p in chain))
+        if self._stack:
+            self.graph.setdefault(self._stack[-1], []).append(resolved)
+        key = (resolved, skip_variable_interpolation)
+        scope = _current_parse_context.get().templates
+        if key in self._parsed and scope.provides(self._uses[key]):
+            # The parameterized sections are registered as a side effect of parsing:
+            scope.replay(self._templates[key])
+            # The importers depend on the sections the node used as well:
+            scope.uses.extend(self._uses[key])
+            return self._parsed[key]
+        self._stack.append(resolved)
+        start, uses_start = len(scope.log), len(scope.uses)
+        try:
+            self._parsed[key] = _parse_config_dict(config_file_path, skip_variable_interpolation, self)
+        finally:
+            self._stack.pop()
+        self._templates[key] = scope.log[start:]
+        defined = {resolver for _, resolver in self._templates[key]}
+        for resolver in defined:
+            # The sections of the imports are claimed by the imports, which finish first:
+            self._definers.setdefault(resolver, resolved)
+        self._uses[key] = list(dict.fromkeys(use for use in scope.uses[uses_start:] if use[1] not in defined))
+        return self._parsed[key]
+
+
+class _ParseContext:
+    """Everything a parse depends on, apart from the files themselves.
+
+    - `cwd`: the working directory substituted for `${cwd}`, fixed when the parse starts,
+    - `templates`: the parameterized sections defined so far (see `_TemplateScope`),
+    - `imports`: the import resolver with the memoized parse results of the imports.
+
+    The context of the running parse is held in a context variable, so parses running
+    concurrently in threads or tasks, or started from within a Python config, never
+    share any state. Nothing the pipeline depends on is global anymore, apart from the
+    process-wide parse cache and the OmegaConf template dispatchers, which are both
+    thread-safe.
+    """
+
+    def __init__(self, imports: _ImportResolver | None = None):
+        self.imports = imports if imports is not None else _ImportResolver()
+        self.templates = _TemplateScope()
+
+    @property
+    def cwd(self) -> Path:
+        return self.imports.cwd
+
+
+_current_parse_context: contextvars.ContextVar[_ParseContext | None] = contextvars.ContextVar(
+    "confuk_parse_context", default=None
+)
+
+
+@contextmanager
+def _parse_context(context: _ParseContext | None = None):
+    """Activates `context` within the block. Without one, the context of the running
+    parse is reused, or a new one is created if there is none.
+    """
+    if context is None:
+        context = _current_parse_context.get()
+        if context is not None:
+            yield context
+            return
+        context = _ParseContext()
+    token = _current_parse_context.set(context)
+    try:
+        yield context
+    finally:
+        _current_parse_context.reset(token)
+
+
+def _current_cwd() -> Path:
+    context = _current_parse_context.get()
+    return context.cwd if context is not None else Path.cwd()
+
+
+@contextmanager
+def _import_executor(parallel: ParallelImports):
+    """Provides the executor used to load imports for the `parallel` option of `parse_config`.
+    Executors created here are shut down afterwards, the ones passed in are left alone.
+    """
+    match parallel:
+        case None | Executor():
+            yield parallel
+        case "thread" | "process":
+            executor = ThreadPoolExecutor() if parallel == "thread" else ProcessPoolExecutor()
+            try:
+                yield executor
+            finally:
+                executor.shutdown(cancel_futures=True)
+        case _:
+            raise ValueError(f"Unsupported value of `parallel`: {parallel}. Use 'thread', 'process' or an Executor.")
+
+
+def _handle_imports(imports_list: List[Path],
+                    skip_variable_interpolation: bool = False,
+                    resolver: _ImportResolver | None = None) -> ConfigDict:
+    resolver = resolver if resolver is not None else _ImportResolver()
     out = {}
     for import_ in imports_list:
-        import_dict, _ = _parse_config_dict(import_, skip_variable_interpolation)
-        out = _recursive_dict_update(out, import_dict)
+        import_dict, _ = resolver.parse(import_, skip_variable_interpolation)
+        out = merge(out, import_dict)
     return out
 
 
-def _recursive_dict_update(d: ConfigDict, u: ConfigDict) -> ConfigDict:
-    for k, v in u.items():
-        if isinstance(v, dict):
-            d[k] = _recursive_dict_update(d.get(k, {}), v)
-        else:
-            d[k] = v
-    return d
-
-
-def _handle_pre_or_postamble(which: Literal["pre", "post"], config_dict: ConfigDict, config_file_path: Path) -> ConfigDict:
+def _import_paths(which: Literal["pre", "post"], config_dict: ConfigDict, config_file_path: Path) -> List[Path] | None:
+    """Returns the interpolated paths listed under `<which>.imports` or `None` if there is no such list."""
     if which in config_dict.keys():
         pre = config_dict[which]
         if "imports" in pre.keys():
-            imports = pre["imports"]
-            imports_ = []
-            for value in imports:
-                imports_.append(_handle_import_path(config_file_path, value))
-            # At this point `imports` contains actual paths. Note that
-            # in `post` we need to defer variable interpolation until the entire config
-            # is built up, hence `skip_variable_interpolation=True`
-            cfg_dict_from_imports = _handle_imports(imports_, True if which == "post" else False)
-            # Override values from imports with those from the `config_dict`:
-            cfg_dict_from_imports = _recursive_dict_update(cfg_dict_from_imports, config_dict) if which == "pre" else _recursive_dict_update(config_dict, cfg_dict_from_imports)
-            return cfg_dict_from_imports
+            return [_handle_import_path(config_file_path, value) for value in pre["imports"]]
+    return None
+
+
+def _handle_pre_or_postamble(which: Literal["pre", "post"],
+                             config_dict: ConfigDict,
+                             config_file_path: Path,
+                             resolver: _ImportResolver | None = None) -> ConfigDict:
+    imports_ = _import_paths(which, config_dict, config_file_path)
+    if imports_ is None:
         return config_dict
-    return config_dict
+    # At this point `imports` contains actual paths. Note that
+    # in `post` we need to defer variable interpolation until the entire config
+    # is built up, hence `skip_variable_interpolation=True`
+    cfg_dict_from_imports = _handle_imports(imports_, True if which == "post" else False, resolver)
+    # Override values from imports with those from the `config_dict`:
+    cfg_dict_from_imports = merge(cfg_dict_from_imports, config_dict) if which == "pre" else merge(config_dict, cfg_dict_from_imports)
+    return cfg_dict_from_imports
 
 
 def _remove_pre_or_postamble(which: Literal["pre", "post"], config_dict: ConfigDict) -> ConfigDict:
-    if "pre" in config_dict.keys():
-        del config_dict["pre"]
+    if which in config_dict.keys():
+        return {k: v for k, v in config_dict.items() if k != which}
     return config_dict
 
 
-def _handle_preamble(config_dict: ConfigDict, config_file_path: Path) -> ConfigDict:
-    return _handle_pre_or_postamble("pre", config_dict, config_file_path)
+def _handle_preamble(config_dict: ConfigDict,
+                     config_file_path: Path,
+                     resolver: _ImportResolver | None = None) -> ConfigDict:
+    return _handle_pre_or_postamble("pre", config_dict, config_file_path, resolver)
 
 
 def _remove_preamble(config_dict: ConfigDict) -> ConfigDict:
     return _remove_pre_or_postamble("pre", config_dict)
 
 
-def _handle_postamble(config_dict: ConfigDict, config_file_path: Path) -> ConfigDict:
-    return _handle_pre_or_postamble("post", config_dict, config_file_path)
+def _handle_postamble(config_dict: ConfigDict,
+                      config_file_path: Path,
+                      resolver: _ImportResolver | None = None) -> ConfigDict:
+    return _handle_pre_or_postamble("post", config_dict, config_file_path, resolver)
 
 
 def _remove_postamble(config_dict: ConfigDict) -> ConfigDict:
@@ -155,37 +444,105 @@ def replacer(config_dict: ConfigDict, old_value: Any, new_value: Any):
 def _interpolate_special_variables(config_dict: ConfigDict,
                                    config_path: Path,
                                    repl_dict_fn: Callable[[Path], Dict[Any, Any]] = _build_repl_dict):
-    repls = repl_dict_fn(config_path)
-    config_dict_ = deepcopy(config_dict)
-    for k, v in repls.items():
-        config_dict_ = replacer(config_dict_, k, v)
-    return config_dict_
+    """Interpolates the special variables (`${this_dir}` etc.) in one pass over `config_dict`.
+    The result shares all unchanged subtrees with `config_dict`.
+    """
+    return _SpecialVariableInterpolator(repl_dict_fn(config_path))(config_dict)
 
 
 def _handle_variable_interpolation(config_dict: ConfigDict,
-                                   config_path: Path):
+                                   config_path: Path,
+                                   as_node: bool = False) -> ConfigDict | OmegaConfigDict:
+    """Interpolates the special variables and resolves everything else with `omegaconf`.
+
+    The config is turned into an OmegaConf node tree exactly once. With `as_node` the
+    resolved node tree is returned as-is, otherwise it is converted back to a container.
+    """
     # Lazy, but we borrow this from `omegaconf`, which is
     # the most brilliant package for configuration and
     # we support it as an output, so might as well use
     # existing solutions to old problems, except we need to
     # interpolate a couple of our own tags:
     config = _interpolate_special_variables(config_dict, config_path)
-
-    # Extract parameterized sections after imports are resolved:
+    if not as_node and _is_resolved(config):
+        # OmegaConf would hand back an equal copy. The tree is returned as it is instead,
+        # so it keeps sharing its subtrees with the imports (see `confuk.persistent`):
+        return config
+
+    # Extract parameterized sections after imports are resolved
+    # and register resolvers for them. The extraction removes them
+    # from a copy, the input may be shared with other parse results:
+    config = dict(config)
+    called = _resolver_calls(config)
     parameterized = _extract_parameterized_sections(config)
-    
-    # Dict to config instance:
-    config = OmegaConfigDict(config)
-    config = OmegaConf.create(config)
-    config = OmegaConf.to_container(config, resolve=False)
+    with _parse_context() as context:
+        _register_parameterized_resolvers(parameterized)
+        if not called.issubset(context.templates.templates):
+            # Resolvers other than the parameterized sections (`${oc.env:...}` etc.)
+            # can give a different value every time, so the result can't be cached:
+            record_dynamic_value()
 
-    # Register resolvers:
-    _register_parameterized_resolvers(parameterized)
+        # Resolve all interpolations
+        config = OmegaConf.create(config)
+        if as_node:
+            OmegaConf.resolve(config)
+            return config
+        return OmegaConf.to_container(config, resolve=True)
 
-    # Resolve all interpolations
-    config = OmegaConf.create(config)
-    config = OmegaConf.to_container(config, resolve=True)
-    return config
+
+_RESOLVER_CALL_PATTERN = re.compile(r"\$\{\s*([A-Za-z_][\w.\-]*)\s*:")
+
+
+def _resolver_calls(config_dict: Any, names: Set[str] | None = None) -> Set[str]:
+    """Names of the resolvers called anywhere in a config, e.g. `{"oc.env"}` for `${oc.env:HOME}`."""
+    names = set() if names is None else names
+    match config_dict:
+        case str():
+            if "${" in config_dict:
+                names.update(_RESOLVER_CALL_PATTERN.findall(config_dict))
+        case dict():
+            for v in config_dict.values():
+                _resolver_calls(v, names)
+        case list():
+            for v in config_dict:
+                _resolver_calls(v, names)
+    return names
+
+
+_RESOLVED_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+
+def _is_resolved(config_dict: Any) -> bool:
+    """Tells whether resolving a config with OmegaConf would give back an equal config, i.e.
+    there's nothing to interpolate, no parameterized sections and no values OmegaConf
+    converts or rejects. Only plain dictionaries, lists and scalars qualify.
+    """
+    type_ = type(config_dict)
+    if type_ is str:
+        return "${" not in config_dict
+    if type_ is dict:
+        return all(type(k) is str and not _PARAMETERIZED_SECTION_PATTERN.match(k) for k in config_dict) \
+            and all(_is_resolved(v) for v in config_dict.values())
+    if type_ is list:
+        return all(_is_resolved(v) for v in config_dict)
+    # Subclasses (e.g. `EasyDict`s in Python configs) are converted by OmegaConf:
+    return type_ in _RESOLVED_SCALARS
+
+
+def _needs_variable_interpolation(config_dict: Any) -> bool:
+    """Tells whether another pass of `_handle_variable_interpolation` would change anything,
+    i.e. whether there are parameterized sections or strings with `${...}` left in the config.
+    """
+    match config_dict:
+        case str():
+            return "${" in config_dict
+        case dict():
+            return any(isinstance(k, str) and _PARAMETERIZED_SECTION_PATTERN.match(k) for k in config_dict) \
+                or any(_needs_variable_interpolation(v) for v in config_dict.values())
+        case list():
+            return any(_needs_variable_interpolation(v) for v in config_dict)
+        case _:
+            return False
 
 
 def _handle_leaf_node_interpolation(config_dict: ConfigDict, config_path: Path):
@@ -193,24 +550,21 @@ def _handle_leaf_node_interpolation(config_dict: ConfigDict, config_path: Path):
     return config
 
 
+def _read_bytes(config_file_path: Path) -> bytes:
+    with open(config_file_path, "rb") as f:
+        return f.read()
+
+
 def _parse_toml(config_file_path: Path) -> ConfigDict:
-    with open(config_file_path, 'r') as file:
-        cfg = toml.load(file)
-    return cfg
+    return parse_bytes("toml", _read_bytes(config_file_path))
 
 
 def _parse_yaml(config_file_path: Path) -> ConfigDict:
-    yaml = YAML(typ="safe")
-    with open(config_file_path, "r") as f:
-        yaml_str = f.read()
-        cfg = yaml.load(yaml_str)
-    return cfg
+    return parse_bytes("yaml", _read_bytes(config_file_path))
 
 
 def _parse_json(config_file_path: Path) -> ConfigDict:
-    with open(config_file_path, "r") as f:
-        cfg = json.load(f)
-    return cfg
+    return parse_bytes("json", _read_bytes(config_file_path))
 
 
 def import_arbitrary_python_file(path: Path):
@@ -233,45 +587,144 @@ def _parse_python(path: Path) -> tuple[ConfigDict, Callable[[ConfigDict], None]
     return cfg_obj, post_fn
 
 
-def _parse_config_dict(config_file_path: Path, skip_variable_interpolation: bool = False) -> ConfigDict:
-
+def _load_config_file(config_file_path: Path) -> tuple[ConfigDict, Callable[[ConfigDict], None] | None]:
+    """Reads a single config file into a dictionary, without handling
+    imports or interpolation. Python configs may also return a `post` function.
+    """
+    record_dependency(config_file_path)
     match config_file_path.suffix.lower():
         case ".toml":
-            config_dict, post_fn = _parse_toml(config_file_path), None
+            return _parse_toml(config_file_path), None
         case ".yaml":
-            config_dict, post_fn = _parse_yaml(config_file_path), None
+            return _parse_yaml(config_file_path), None
         case ".json":
-            config_dict, post_fn = _parse_json(config_file_path), None
+            return _parse_json(config_file_path), None
         case ".py":
-            config_dict, post_fn = _parse_python(config_file_path)
+            return _parse_python(config_file_path)
         case _:
             if not config_file_path.exists():
                 raise ValueError(f"{config_file_path} does not exist")
             raise ValueError(f"{config_file_path.suffix.upper()} config format is not supported")
 
-    config_dict = _handle_preamble(config_dict, config_file_path)
+
+def _parse_config_dict(config_file_path: Path,
+                       skip_variable_interpolation: bool = False,
+                       resolver: _ImportResolver | None = None) -> ConfigDict:
+    if resolver is None:
+        # Entry point of a parse, all the imports below share one resolver:
+        return _ImportResolver().parse(config_file_path, skip_variable_interpolation)
+
+    config_dict, post_fn = resolver.load(config_file_path)
+    config_dict = _handle_preamble(config_dict, config_file_path, resolver)
     config_dict = _remove_preamble(config_dict)
     if not skip_variable_interpolation:
         config_dict = _handle_variable_interpolation(config_dict, config_file_path)
-    config_dict = _handle_postamble(config_dict, config_file_path)
+    config_dict = _handle_postamble(config_dict, config_file_path, resolver)
     config_dict = _remove_postamble(config_dict)
     # config_dict = _handle_variable_interpolation(config_dict, config_file_path)
     return config_dict, post_fn
 
 
-def _parse_leaf_config_dict(config_file_path: Path) -> ConfigDict:
-    config_dict, post_fn = _parse_config_dict(config_file_path)
-    # This interpolates deferred imports and deferred varialbes
-    # when we reach the leaf node in the import stack:
-    config_dict = _handle_leaf_node_interpolation(config_dict, config_file_path)
-    # After the `post` pass, some of the deferred-value variables will
-    # not yet be interpolated so we do another pass of `_handle_variable_interpolation`:
-    config_dict = _handle_variable_interpolation(config_dict, config_file_path)
+def _parse_leaf_config(config_file_path: Path,
+                       as_node: bool = False,
+                       executor: Executor | None = None,
+                       resolver: _ImportResolver | None = None,
+                       context: _ParseContext | None = None) -> ConfigDict | OmegaConfigDict:
+    """Parses a config file with all its imports.
+
+    Parameterized sections defined anywhere in the import graph are only visible to this
+    parse. Pass a new `context` to keep them, e.g. to resolve overrides that use them
+    after the parse has returned (see `_load_and_override_config`).
+    """
+    if context is None:
+        context = _ParseContext(resolver if resolver is not None else _ImportResolver(executor))
+    resolver = context.imports
+    with _parse_context(context):
+        config_dict, post_fn = resolver.parse(config_file_path)
+        # This interpolates deferred imports and deferred varialbes
+        # when we reach the leaf node in the import stack:
+        config_dict = _handle_leaf_node_interpolation(config_dict, config_file_path)
+        # After the `post` pass, some of the deferred-value variables will
+        # not yet be interpolated so we do another pass of `_handle_variable_interpolation`.
+        # When an OmegaConf node is requested, it's built in that same pass:
+        if as_node and post_fn is None:
+            return _handle_variable_interpolation(config_dict, config_file_path, as_node=True)
+        if _needs_variable_interpolation(config_dict):
+            config_dict = _handle_variable_interpolation(config_dict, config_file_path)
+        else:
+            # Without the OmegaConf pass the result still shares subtrees with the imports:
+            config_dict = _copy_containers(config_dict)
     if post_fn is not None:
         post_fn(config_dict)
+    return _dict_to_omegaconfig(config_dict) if as_node else config_dict
+
+
+def _copy_containers(obj: Any) -> Any:
+    """Copies the dictionaries and lists of a config, the values themselves are shared."""
+    match obj:
+        case dict():
+            return {k: _copy_containers(v) for k, v in obj.items()}
+        case list():
+            return [_copy_containers(v) for v in obj]
+        case _:
+            return obj
+
+
+def _parse_leaf_configs(config_file_paths: List[Path], as_node: bool = False) -> List[ConfigDict | OmegaConfigDict]:
+    """Parses several leaf configs with one resolver, so every import they share is parsed once."""
+    resolver = _ImportResolver()
+    return [_parse_leaf_config(path, as_node=as_node, resolver=resolver) for path in config_file_paths]
+
+
+def _parse_leaf_config_dict(config_file_path: Path) -> ConfigDict:
+    return _parse_leaf_config(config_file_path)
+
+
+def _parse_leaf_config_dict_cached(config_file_path: Path,
+                                   executor: Executor | None = None,
+                                   memory: bool = True,
+                                   disk_cache: DiskCache | None = None) -> ConfigDict:
+    """Same as `_parse_leaf_config_dict` but goes through the process-wide parse cache
+    (if `memory` is set) and the `disk_cache` (if provided), in that order.
+    Configs whose import graph contains Python files or which call OmegaConf resolvers
+    (other than parameterized sections) are never cached, since those can compute their
+    values dynamically, e.g. from environment variables.
+    """
+    cache = get_parse_cache()
+    cwd = Path.cwd()
+    key = _cache_key(config_file_path, cwd)
+    config_dict = cache.get(key) if memory else None
+    if config_dict is None and disk_cache is not None:
+        config_dict = disk_cache.get(key)
+    if config_dict is not None:
+        return config_dict
+    with track_dependencies() as deps:
+        config_dict = _parse_leaf_config(config_file_path, resolver=_ImportResolver(executor, cwd))
+    if is_cacheable(deps):
+        if memory:
+            cache.put(key, deps, config_dict)
+        if disk_cache is not None:
+            disk_cache.put(key, deps, config_dict)
     return config_dict
 
 
+def _cache_key(config_file_path: Path, cwd: Path) -> Tuple[Path, Path, Tuple[str, ...]]:
+    """Key of a config in the parse caches. The same file gives different configs in different
+    working directories (`${cwd}`) and, in corner cases, with different parser backends.
+    """
+    return config_file_path.resolve(), cwd, tuple(get_parser_backend(fmt) for fmt in ("toml", "yaml", "json"))
+
+
+def _disk_cache(disk_cache: bool | Path | str) -> DiskCache | None:
+    match disk_cache:
+        case False | None:
+            return None
+        case True:
+            return get_disk_cache()
+        case _:
+            return get_disk_cache(disk_cache)
+
+
 def _dict_to_kwarg_constructor(config_dict: ConfigDict, cfg_class: CfgClass) -> CfgClass:
     config = cfg_class(**config_dict)
     return config
@@ -282,6 +735,10 @@ def _parse_config_kwarg_constructor(config_file_path: Path, cfg_class: CfgClass)
     return _dict_to_kwarg_constructor(config_dict, cfg_class)
 
 
+def _dict_to_dict(config_dict: ConfigDict) -> ConfigDict:
+    return dict(config_dict)
+
+
 def _dict_to_pydantic(config_dict: ConfigDict, cfg_class: CfgClass) -> CfgClass:
     return _dict_to_kwarg_constructor(config_dict, cfg_class)
 
@@ -304,8 +761,15 @@ def _dict_to_omegaconfig(config_dict: ConfigDict) -> OmegaConfigDict:
 
 
 def _parse_omegaconfig(config_file_path: Path) -> OmegaConfigDict:
-    config_dict = _parse_leaf_config_dict(config_file_path)
-    return _dict_to_omegaconfig(config_dict)
+    return _parse_leaf_config(config_file_path, as_node=True)
+
+
+def _dict_to_frozen(config_dict: ConfigDict) -> FrozenConfig:
+    return freeze(config_dict)
+
+
+def _parse_config_frozen(config_file_path: Path) -> FrozenConfig:
+    return freeze(_parse_leaf_config_dict(config_file_path))
 
 
 def _extract_parameterized_sections(config: Dict[str, Any]) -> Dict[str, tuple]:
@@ -316,11 +780,10 @@ def _extract_parameterized_sections(config: Dict[str, Any]) -> Dict[str, tuple]:
         Dict mapping section names to (params, content) tuples
     """
     parameterized = {}
-    pattern = r'^(\w+)\(([\w\s,]+)\)$'
     
     keys_to_remove = []
     for key in list(config.keys()):
-        match = re.match(pattern, key)
+        match = _PARAMETERIZED_SECTION_PATTERN.match(key) if isinstance(key, str) else None
         if match:
             section_name = match.group(1)
             params_str = match.group(2)
@@ -337,88 +800,183 @@ def _extract_parameterized_sections(config: Dict[str, Any]) -> Dict[str, tuple]:
     return parameterized
 
 
-def _substitute_parameters_only(
-    obj: Any, 
-    param_bindings: Dict[str, str]
-) -> Any:
+_CONSTANT, _STRING, _DICT, _LIST = range(4)
+
+
+def _compile_template(template: Any, pattern: re.Pattern, index: Dict[str, int]) -> Tuple[int, Any]:
+    """Compiles a template into a substitution plan: a tree of `(kind, value)` nodes in which
+    strings are pre-split at the parameter references and subtrees without any are constants.
     """
-    Recursively substitute ONLY the parameter variables, leaving global
-    interpolations intact for later resolution.
-    
-    Args:
-        obj: The object to process (dict, list, str, or primitive)
-        param_bindings: Mapping of parameter names to their values
-        
-    Returns:
-        Object with parameters substituted but global vars preserved
+    match template:
+        case str():
+            parts = pattern.split(template)
+            if len(parts) == 1:
+                return _CONSTANT, template
+            # Every odd part is the name of a parameter, stored as its position in the arguments:
+            return _STRING, tuple(part if i % 2 == 0 else index[part] for i, part in enumerate(parts))
+        case dict():
+            items = tuple((k, _compile_template(v, pattern, index)) for k, v in template.items())
+            if all(kind == _CONSTANT for _, (kind, _) in items):
+                return _CONSTANT, template
+            return _DICT, items
+        case list():
+            items = tuple(_compile_template(v, pattern, index) for v in template)
+            if all(kind == _CONSTANT for kind, _ in items):
+                return _CONSTANT, template
+            return _LIST, items
+        case _:
+            return _CONSTANT, template
+
+
+def _instantiate_template(plan: Tuple[int, Any], args: Tuple[str, ...]) -> Any:
+    kind, value = plan
+    if kind == _CONSTANT:
+        return value
+    if kind == _STRING:
+        return "".join([part if part.__class__ is str else args[part] for part in value])
+    if kind == _DICT:
+        return {k: _instantiate_template(v, args) for k, v in value}
+    return [_instantiate_template(v, args) for v in value]
+
+
+class _TemplateResolver:
+    """OmegaConf resolver of a single parameterized section.
+
+    The template is compiled once into a substitution plan, so a call only joins the
+    pre-split strings with the arguments. Only the parameters are substituted, global
+    variable interpolations are left intact for later resolution. Results are memoized
+    per tuple of arguments and shared between identical calls, so they must not be
+    mutated (OmegaConf copies them into its own nodes anyway).
     """
-    if isinstance(obj, dict):
-        return {
-            k: _substitute_parameters_only(v, param_bindings) 
-            for k, v in obj.items()
-        }
-    elif isinstance(obj, list):
-        return [
-            _substitute_parameters_only(item, param_bindings) 
-            for item in obj
-        ]
-    elif isinstance(obj, str):
-        # Only substitute parameters that are in param_bindings
-        # Leave other interpolations like ${order} untouched
-        result = obj
-        for param_name, param_value in param_bindings.items():
-            # Match ${param_name} specifically
-            pattern = r'\$\{' + re.escape(param_name) + r'\}'
-            result = re.sub(pattern, param_value, result)
-        return result
-    else:
-        # Primitives pass through unchanged
-        return obj
+
+    def __init__(self, params: List[str], template: Any):
+        self.params = params
+        pattern = re.compile(r"\$\{(" + "|".join(re.escape(p) for p in params) + r")\}")
+        self.plan = _compile_template(template, pattern, {p: i for i, p in enumerate(params)})
+        self._memo: Dict[Tuple[str, ...], Any] = {}
+
+    def __call__(self, *args):
+        if len(args) != len(self.params):
+            raise ValueError(
+                f"Expected {len(self.params)} arguments, got {len(args)}"
+            )
+        key = tuple(str(arg) for arg in args)
+        try:
+            return self._memo[key]
+        except KeyError:
+            result = self._memo[key] = _instantiate_template(self.plan, key)
+            return result
+
+
+TemplateLog = List[Tuple[str, _TemplateResolver]]
+
+
+class _TemplateScope:
+    """Parameterized sections visible to a single parse.
+
+    Every section is registered in OmegaConf once per process, as a dispatcher which
+    looks the section up in the scope of the parse that is currently resolving it
+    (see `_ParseContext`). Concurrent parses, in threads or tasks, thus never see each
+    other's sections. The `log` lists the registrations in order, so that the sections
+    defined while parsing an import can be registered again when its memoized result
+    is reused (see `_ImportResolver.parse`). `uses` lists the sections that were
+    resolved, so that a memoized result is only reused where the sections it was
+    built with are still the ones in scope.
+    """
+
+    def __init__(self):
+        self.templates: Dict[str, _TemplateResolver] = {}
+        self.log: TemplateLog = []
+        self.uses: TemplateLog = []
+
+    def register(self, name: str, resolver: _TemplateResolver) -> None:
+        _ensure_template_dispatcher(name)
+        self.templates[name] = resolver
+        self.log.append((name, resolver))
+
+    def replay(self, log: TemplateLog) -> None:
+        for name, resolver in log:
+            self.register(name, resolver)
+
+    def resolve(self, name: str) -> _TemplateResolver | None:
+        resolver = self.templates.get(name)
+        if resolver is not None:
+            self.uses.append((name, resolver))
+        return resolver
+
+    def provides(self, uses: TemplateLog) -> bool:
+        """Tells whether every section in `uses` is in scope under the same name."""
+        return all(self.templates.get(name) is resolver for name, resolver in uses)
+
+
+_template_dispatchers: Set[str] = set()
+_template_dispatchers_lock = threading.Lock()
+
+
+def _ensure_template_dispatcher(name: str) -> None:
+    if name in _template_dispatchers:
+        return
+    with _template_dispatchers_lock:
+        if name in _template_dispatchers:
+            return
+
+        def dispatch(*args):
+            context = _current_parse_context.get()
+            resolver = context.templates.resolve(name) if context is not None else None
+            if resolver is None:
+                raise ValueError(f"Parameterized section `{name}` is not defined in this config")
+            return resolver(*args)
+
+        OmegaConf.register_new_resolver(name, dispatch, replace=True)
+        _template_dispatchers.add(name)
 
 
 def _register_parameterized_resolvers(
     parameterized_sections: Dict[str, tuple]
 ) -> None:
     """
-    Register OmegaConf resolvers for each parameterized section.
+    Register resolvers for each parameterized section in the `_TemplateScope` of the running parse.
     These resolvers only substitute local parameters, leaving global
     variable interpolations for later resolution.
     """
-    
-    def create_resolver(params: List[str], template: Any):
-        def resolver(*args):
-            if len(args) != len(params):
-                raise ValueError(
-                    f"Expected {len(params)} arguments, got {len(args)}"
-                )
-            
-            # Create parameter bindings
-            param_bindings = {param: str(arg) for param, arg in zip(params, args)}
-            
-            # Substitute ONLY the parameters, leaving global vars as-is
-            result = _substitute_parameters_only(template, param_bindings)
-            
-            return result
-        
-        return resolver
-    
+    context = _current_parse_context.get()
+    if context is None:
+        raise RuntimeError("Parameterized sections can only be registered within a `_parse_context`")
     for section_name, (params, template) in parameterized_sections.items():
-        OmegaConf.register_new_resolver(
-            section_name,
-            create_resolver(params, template),
-            replace=True
-        )
+        context.templates.register(section_name, _TemplateResolver(params, template))
 
 
 def parse_config(config_file_path_or_dict: Path | ConfigDict | str,
-                 cfg_class: SupportedConfigFormat = None):
+                 cfg_class: SupportedConfigFormat = None,
+                 use_cache: bool = False,
+                 lazy: bool = False,
+                 parallel: ParallelImports = None,
+                 disk_cache: bool | Path | str = False):
     """Takes a path object to a toml file and returns a config object.
 
     Args:
         config_file_path (Path | ConfigDict): path to the toml file or an existing `ConfigDict` instance
         cfg_class (SupportedConfigFormat, optional): config loader class. Defaults to None.
             If set to `"attr"`, the config will be loaded as an `easydict` object instead
-            of a conventional dictionary.
+            of a conventional dictionary. `"frozen"` returns an immutable, hashable
+            `FrozenConfig` with attribute access (see `confuk.frozen`).
+        use_cache (bool, optional): if set, the parsed config is kept in a process-wide
+            LRU cache and reused as long as none of the files in its import graph
+            changed (see `confuk.cache`). Defaults to False.
+        lazy (bool, optional): if set, a read-only `LazyConfig` view is returned instead,
+            which parses the imported files only when their values are first accessed
+            (see `confuk.lazy`). Only the dict and attribute-access outputs support
+            this mode. Defaults to False.
+        parallel (ParallelImports, optional): if set, the imported files are read and parsed
+            concurrently: `"thread"` uses a thread pool (good for slow, e.g. network, file
+            systems), `"process"` a process pool (good for big YAML files) and an existing
+            `Executor` is simply reused. Imports are merged in the declared order either way.
+            Defaults to None, i.e. files are read one after another.
+        disk_cache (bool | Path | str, optional): if set, the parsed config is also stored on disk
+            and reused by other processes as long as the contents of the files in its import graph
+            don't change. `True` uses the default directory (`$CONFUK_CACHE_DIR` or `~/.cache/confuk`),
+            a path selects a different one. Entries are pickles, so the directory must not be writable
+            by anyone else. Defaults to False.
 
     Returns:
         An instance of the class used to load the config
@@ -466,19 +1024,79 @@ def parse_config(config_file_path_or_dict: Path | ConfigDict | str,
                     case _:
                         raise TypeError(f"Function {dict_fn.__name__} has {num_params_for_dict_fn }, this type of signature is unsupported.")
 
+    if lazy and isinstance(config_file_path_or_dict, (Path, str)):
+        if cfg_class not in (None, "dict", "d", "attr", "edict", "ed"):
+            raise ValueError(f"Lazy loading only supports dict and attribute access, got `cfg_class={cfg_class}`")
+        # Imported here because `confuk.lazy` builds on top of this module:
+        from .lazy import parse_config_lazy
+        return parse_config_lazy(config_file_path_or_dict)
+
+    if (use_cache or disk_cache or parallel is not None) and isinstance(config_file_path_or_dict, (Path, str)):
+        # The dict is parsed upfront, so only the conversion
+        # to the requested output format is left to do:
+        with _import_executor(parallel) as executor:
+            if use_cache or disk_cache:
+                # A cache hit is already a fresh copy:
+                config_file_path_or_dict = _parse_leaf_config_dict_cached(Path(config_file_path_or_dict), executor,
+                                                                          bool(use_cache), _disk_cache(disk_cache))
+            else:
+                config_file_path_or_dict = _parse_leaf_config(Path(config_file_path_or_dict), executor=executor)
+
     match cfg_class:
         case None | "dict" | "d":
-            return _handle_dict_or_path(config_file_path_or_dict, dict, _parse_leaf_config_dict)
+            return _handle_dict_or_path(config_file_path_or_dict, _dict_to_dict, _parse_leaf_config_dict)
         case "attr" | "edict" | "ed":
             return _handle_dict_or_path(config_file_path_or_dict, _dict_to_easydict, _parse_config_easydict)
         case "omega" | "omegaconf" | "o":
             return _handle_dict_or_path(config_file_path_or_dict, _dict_to_omegaconfig, _parse_omegaconfig)
+        case "frozen":
+            return _handle_dict_or_path(config_file_path_or_dict, _dict_to_frozen, _parse_config_frozen)
         case BaseModel():
             return _handle_dict_or_path(config_file_path_or_dict, _dict_to_pydantic, _parse_config_pydantic)
         case _:
             return _handle_dict_or_path(config_file_path_or_dict, _dict_to_kwarg_constructor, _parse_config_kwarg_constructor)
 
 
+def parse_configs(config_file_paths: Iterable[Path | str],
+                  cfg_class: SupportedConfigFormat = None,
+                  parallel: ParallelImports = None,
+                  chunksize: int | None = None) -> Iterator[Any]:
+    """Parses many configs at once, yielding them one by one in the order of `config_file_paths`.
+
+    Files imported by several of the configs (e.g. the same base configs imported by every
+    config of a sweep) are read and parsed only once, unless they use parameterized sections
+    which the configs define differently, in which case they're parsed again. The configs are built on top of the
+    shared imports without copying them upfront (see `confuk.persistent`) and every yielded config
+    is independent of the others, so mutating one of them is safe.
+
+    Args:
+        config_file_paths (Iterable[Path | str]): paths to the config files
+        cfg_class (SupportedConfigFormat, optional): config loader class, same as in `parse_config`. Defaults to None.
+        parallel (ParallelImports, optional): `"process"` spreads the configs across a process pool,
+            in chunks which share the parsed imports, `"thread"` does the same with a thread pool and an
+            existing `Executor` is used as-is. Defaults to None, i.e. everything happens in this process.
+        chunksize (int | None, optional): number of configs parsed by a single worker task. Defaults to None,
+            which splits the configs into four chunks per worker.
+
+    Returns:
+        Iterator over the parsed configs, as instances of the class used to load the config
+    """
+    config_file_paths = [Path(p) for p in config_file_paths]
+    as_node = cfg_class in ("omega", "omegaconf", "o")
+    with _import_executor(parallel) as executor:
+        if executor is None:
+            resolver = _ImportResolver()
+            configs = (_parse_leaf_config(path, as_node=as_node, resolver=resolver) for path in config_file_paths)
+        else:
+            if chunksize is None:
+                workers = getattr(executor, "_max_workers", None) or 1
+                chunksize = max(1, -(-len(config_file_paths) // (workers * 4)))
+            chunks = [config_file_paths[i:i + chunksize] for i in range(0, len(config_file_paths), chunksize)]
+            configs = chain.from_iterable(executor.map(_parse_leaf_configs, chunks, repeat(as_node)))
+        for config in configs:
+            yield config if as_node else parse_config(config, cfg_class)
+
+
 def flatten(config_dict: OmegaConfigDict | ConfigDict,
             parent_key: str = "",
             filter_: Iterable[str] | None = None,
@@ -0,0 +1,134 @@
+"""Asyncio flavour of `parse_config`.
+
+Nothing here blocks the event loop: files are read and decoded on an executor, all
+the files of the import graph are loaded concurrently, and the merging and
+interpolation, which are CPU-bound, run on the executor as well. The result is
+exactly what `parse_config` returns for the same arguments.
+"""
+import asyncio
+import contextvars
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import *
+
+from .cache import get_parse_cache, is_cacheable, record_dependency, track_dependencies
+from .parse import (
+    ConfigDict,
+    SupportedConfigFormat,
+    _ImportResolver,
+    _cache_key,
+    _import_paths,
+    _load_config_file,
+    _parse_leaf_config,
+    parse_config,
+)
+
+__all__ = ["parse_config_async"]
+
+
+async def _run(executor: Executor | None, fn: Callable, *args) -> Any:
+    """Runs `fn` on the executor. Thread-based executors see the context variables
+    of the calling task, so that dependencies get recorded for the parse cache.
+    """
+    loop = asyncio.get_running_loop()
+    if isinstance(executor, ProcessPoolExecutor):
+        return await loop.run_in_executor(executor, partial(fn, *args))
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(executor, partial(context.run, fn, *args))
+
+
+async def _load_import_graph(config_file_path: Path, executor: Executor | None) -> Dict[Path, Any]:
+    """Reads and decodes every file reachable from `config_file_path` concurrently.
+
+    Files that fail to load are left out, they are loaded again (and fail in the
+    same way as with `parse_config`) when the imports are merged.
+    """
+    loaded: Dict[Path, Any] = {}
+    tasks: Dict[Path, asyncio.Task] = {}
+
+    async def load(path: Path):
+        if isinstance(executor, ProcessPoolExecutor):
+            # Workers in other processes cannot see the dependencies being tracked here:
+            record_dependency(path)
+        if path.suffix.lower() == ".py":
+            # Python configs are executed in-process when the imports are merged
+            record_dependency(path)
+            return
+        config_dict, post_fn = await _run(executor, _load_config_file, path)
+        loaded[path] = (config_dict, post_fn)
+        for import_path in (_import_paths("pre", config_dict, path) or []) + (_import_paths("post", config_dict, path) or []):
+            schedule(import_path.resolve())
+
+    def schedule(path: Path):
+        if path not in tasks:
+            tasks[path] = asyncio.ensure_future(load(path))
+
+    schedule(config_file_path.resolve())
+    # Imports are discovered as files get loaded, so keep waiting until nothing new shows up:
+    while pending := [task for task in tasks.values() if not task.done()]:
+        await asyncio.wait(pending)
+    for task in tasks.values():
+        # Mark the exceptions as retrieved, they are raised again when merging:
+        task.exception()
+    return loaded
+
+
+def _parse_preloaded(config_file_path: Path, loaded: Dict[Path, Any], as_node: bool, cwd: Path):
+    resolver = _ImportResolver(cwd=cwd)
+    resolver.preload(loaded)
+    return _parse_leaf_config(config_file_path, as_node=as_node, resolver=resolver)
+
+
+async def _parse_leaf_config_async(config_file_path: Path, as_node: bool, executor: Executor | None, cwd: Path):
+    loaded = await _load_import_graph(config_file_path, executor)
+    # The resolver holds the loaded files, so it has to stay in this process:
+    merge_executor = None if isinstance(executor, ProcessPoolExecutor) else executor
+    return await _run(merge_executor, _parse_preloaded, config_file_path, loaded, as_node, cwd)
+
+
+async def _parse_leaf_config_dict_cached_async(config_file_path: Path, executor: Executor | None, cwd: Path) -> ConfigDict:
+    cache = get_parse_cache()
+    key = _cache_key(config_file_path, cwd)
+    # Checking an entry stats all the files of its import graph:
+    config_dict = await asyncio.to_thread(cache.get, key)
+    if config_dict is not None:
+        return config_dict
+    with track_dependencies() as deps:
+        config_dict = await _parse_leaf_config_async(config_file_path, False, executor, cwd)
+    if is_cacheable(deps):
+        cache.put(key, deps, config_dict)
+    return config_dict
+
+
+async def parse_config_async(config_file_path_or_dict: Path | ConfigDict | str,
+                             cfg_class: SupportedConfigFormat = None,
+                             use_cache: bool = False,
+                             executor: Executor | None = None):
+    """Asynchronous version of `parse_config` for use inside of `asyncio` applications.
+
+    Args:
+        config_file_path_or_dict (Path | ConfigDict | str): path to the config file or an existing `ConfigDict` instance
+        cfg_class (SupportedConfigFormat, optional): config loader class, same as in `parse_config`. Defaults to None.
+        use_cache (bool, optional): whether to use the process-wide parse cache, same as in `parse_config`.
+            Defaults to False.
+        executor (Executor | None, optional): executor to read and decode the files on. When a process
+            pool is provided, it's only used for decoding, the merging happens on the default executor
+            of the event loop. Defaults to None, i.e. the default executor of the event loop.
+
+    Returns:
+        An instance of the class used to load the config
+    """
+    if not isinstance(config_file_path_or_dict, (Path, str)):
+        return parse_config(config_file_path_or_dict, cfg_class)
+    config_file_path = Path(config_file_path_or_dict)
+    # The parse finishes on another thread, by which time the working directory may have changed:
+    cwd = Path.cwd()
+    if use_cache:
+        config_dict = await _parse_leaf_config_dict_cached_async(config_file_path, executor, cwd)
+    elif cfg_class in ("omega", "omegaconf", "o"):
+        return await _parse_leaf_config_async(config_file_path, True, executor, cwd)
+    else:
+        config_dict = await _parse_leaf_config_async(config_file_path, False, executor, cwd)
+    # Only the conversion to the requested output format is left, which doesn't touch any files:
+    return parse_config(config_dict, cfg_class)
@@ -0,0 +1,87 @@
+"""Persistent (copy-on-write) operations on config trees.
+
+Parsed configs are trees of dictionaries and lists (or of `FrozenConfig`s and tuples).
+The functions here never modify a tree: they return a new tree which copies only the
+containers on the paths that change and shares every other subtree with the input.
+Imports merged into many configs, the base of override variants (see `confuk.sweep`)
+and the parse results memoized for hot reloading (see `confuk.watch`) are thus shared
+rather than copied, as long as nothing mutates them in place, which the parse pipeline
+never does.
+"""
+from typing import *
+from collections.abc import Mapping
+
+from .frozen import FrozenConfig, _build, _freeze_value, freeze
+
+_MISSING = object()
+
+
+def merge(d: Dict[str, Any], u: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursively merges `u` into `d`, values from `u` take precedence.
+
+    Neither of the dictionaries is modified, only the dictionaries on the paths to the
+    keys present in both are copied, every other subtree of the result is shared with
+    `d` or `u`. The cost is thus proportional to the size of the overlap of the two
+    (and the width of the dictionaries on it), not to the size of the configs.
+    """
+    out = dict(d)
+    for k, v in u.items():
+        if isinstance(v, dict) and isinstance(out.get(k), dict):
+            out[k] = merge(out[k], v)
+        else:
+            out[k] = v
+    return out
+
+
+def get_in(node: Any, keys: Sequence[str], default: Any = _MISSING) -> Any:
+    """Returns the value under a path, e.g. `["optim", "lr"]`. Digits index into lists.
+
+    Raises:
+        KeyError: If there's no such value and no `default` is given.
+    """
+    for key in keys:
+        if isinstance(node, Mapping) and key in node:
+            node = node[key]
+        elif isinstance(node, (list, tuple)) and not isinstance(node, FrozenConfig) \
+                and key.isdigit() and int(key) < len(node):
+            node = node[int(key)]
+        elif default is _MISSING:
+            raise KeyError(".".join(keys))
+        else:
+            return default
+    return node
+
+
+def _replace(node: Any, key: str, value: Any) -> Any:
+    """Returns a copy of `node` with `key` set to `value`, sharing all the other values with it."""
+    match node:
+        case FrozenConfig():
+            values = list(tuple.__iter__(node))
+            if key in node:
+                values[node._positions[key]] = value
+                return _build(node._fields, tuple(values))
+            return _build(node._fields + (key,), tuple(values) + (value,))
+        case list() | tuple() if key.isdigit() and int(key) < len(node):
+            out = list(node)
+            out[int(key)] = value
+            return type(node)(out) if isinstance(node, tuple) else out
+        case Mapping():
+            out = dict(node)
+            out[key] = value
+            return out
+        case _:
+            raise TypeError(f"Can't set `{key}` in a value of type {type(node).__name__}")
+
+
+def assoc_in(node: Any, keys: Sequence[str], value: Any) -> Any:
+    """Returns a copy of `node` with the value under a path set, copying only the containers
+    on the path. Missing sections are created, digits index into lists. Values set in a
+    `FrozenConfig` are frozen.
+    """
+    key = keys[0]
+    if len(keys) == 1:
+        return _replace(node, key, _freeze_value(value) if isinstance(node, FrozenConfig) else value)
+    child = get_in(node, (key,), None)
+    if not isinstance(child, (Mapping, list, tuple)):
+        child = freeze({}) if isinstance(node, FrozenConfig) else {}
+    return _replace(node, key, assoc_in(child, keys[1:], value))
@@ -0,0 +1,262 @@
+"""Configs shared between processes through shared memory.
+
+`share_config(cfg)` serializes a resolved config into a shared memory segment once.
+The returned `SharedConfig` pickles down to the name of that segment, so sending it
+to worker processes (e.g. as a part of a `torch.utils.data.Dataset` or as an argument
+of a `multiprocessing.Pool` task) costs next to nothing. Each worker attaches to the
+segment on unpickling and reads it in place, decoding only the values it accesses,
+so the config is not copied into every worker.
+"""
+import json
+import struct
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import *
+from collections.abc import Mapping
+
+from easydict import EasyDict as edict
+from omegaconf import OmegaConf, DictConfig as OmegaConfigDict
+
+from .lazy import LazyConfig
+from .parse import ConfigDict, parse_config
+
+__all__ = ["SharedConfig", "share_config"]
+
+
+# The segment starts with the span of the index of the top-level mapping:
+_HEADER = struct.Struct("<QQ")
+
+
+_SCALAR, _MAPPING, _LIST = "s", "m", "l"
+_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def _encode(node: Mapping, out: bytearray) -> Tuple[int, int]:
+    """Appends a mapping to `out` and returns the span of its index.
+
+    The index of a mapping is a JSON array `[keys, kinds, values]`. Scalars are stored
+    in `values` as they are, lists and nested mappings are written to `out` first and
+    only their `[start, end]` spans are stored. Reading a value thus never requires
+    decoding anything but the index of its parent (and the value itself).
+    """
+    keys, kinds, values = [], [], []
+    for key, value in node.items():
+        keys.append(key)
+        if isinstance(value, Mapping):
+            kinds.append(_MAPPING)
+            values.append(_encode(value, out))
+        elif isinstance(value, (list, tuple)):
+            start = len(out)
+            out += _encoder.encode(value).encode()
+            kinds.append(_LIST)
+            values.append((start, len(out)))
+        else:
+            kinds.append(_SCALAR)
+            values.append(value)
+    start = len(out)
+    out += _encoder.encode((keys, "".join(kinds), values)).encode()
+    return start, len(out)
+
+
+class _Node:
+    """A mapping within a segment, its index is decoded on first use."""
+
+    __slots__ = ("buffer", "start", "end", "_index", "_values")
+
+    def __init__(self, buffer: memoryview, start: int, end: int):
+        self.buffer = buffer
+        self.start = start
+        self.end = end
+        self._index: Dict[str, Tuple[str, Any]] | None = None
+        self._values: Dict[str, Any] = {}
+
+    @property
+    def index(self) -> Dict[str, Tuple[str, Any]]:
+        if self._index is None:
+            keys, kinds, values = json.loads(bytes(self.buffer[self.start:self.end]))
+            self._index = dict(zip(keys, zip(kinds, values)))
+        return self._index
+
+    def __getitem__(self, key: str) -> Any:
+        kind, value = self.index[key]
+        if kind == _SCALAR:
+            return value
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        start, end = value
+        value = _Node(self.buffer, start, end) if kind == _MAPPING else json.loads(bytes(self.buffer[start:end]))
+        self._values[key] = value
+        return value
+
+    def to_dict(self) -> ConfigDict:
+        return {k: v.to_dict() if isinstance(v, _Node) else v for k, v in ((k, self[k]) for k in self.index)}
+
+
+class _Segment:
+    """A shared memory segment holding a serialized config, attached to by this process."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, size: int, owner: bool):
+        self.shm = shm
+        self.size = size
+        self.owner = owner
+        # On some platforms the segment is rounded up to whole pages:
+        self.buffer = shm.buf[:size]
+        self.root = _Node(self.buffer, *_HEADER.unpack_from(self.buffer))
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def close(self) -> None:
+        if self.root is None:
+            return
+        _segments.pop(self.name, None)
+        self.root = None
+        self.buffer.release()
+        self.shm.close()
+
+
+# Segments this process is attached to, so that every unpickled view of a segment shares one mapping:
+_segments: Dict[str, _Segment] = {}
+
+
+def _attach(name: str, size: int, keys: Tuple[str, ...]) -> "SharedConfig":
+    segment = _segments.get(name)
+    if segment is None:
+        try:
+            # Python 3.13+: attaching processes should not unlink the segment when they exit
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            shm = shared_memory.SharedMemory(name=name)
+        segment = _segments[name] = _Segment(shm, size, owner=False)
+    node = segment.root
+    for key in keys:
+        node = node[key]
+    return SharedConfig(segment, keys, node)
+
+
+def _with_attribute_access(value: Any) -> Any:
+    match value:
+        case dict():
+            return edict(value)
+        case list():
+            return [_with_attribute_access(v) for v in value]
+        case _:
+            return value
+
+
+class SharedConfig(Mapping):
+    """Read-only view of a config stored in shared memory, see `share_config`.
+
+    Supports both item access (`cfg["training"]["lr"]`) and attribute access
+    (`cfg.training.lr`). Nested sections are returned as `SharedConfig` views as well,
+    lists are decoded on access (with `EasyDict`s in place of any mappings in them).
+    Use `to_dict()` to get a plain dictionary.
+    """
+
+    __slots__ = ("_segment", "_keys", "_node")
+
+    def __init__(self, segment: _Segment, keys: Tuple[str, ...], node: _Node):
+        object.__setattr__(self, "_segment", segment)
+        object.__setattr__(self, "_keys", keys)
+        object.__setattr__(self, "_node", node)
+
+    def __getitem__(self, key: str) -> Any:
+        if self._segment.root is None:
+            raise ValueError("The shared config has been closed")
+        value = self._node[key]
+        if isinstance(value, _Node):
+            return SharedConfig(self._segment, self._keys + (key,), value)
+        return _with_attribute_access(value)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(f"{'.'.join(self._keys + (name,))} not found in the shared config") from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise TypeError("Shared configs are read-only")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._node.index)
+
+    def __len__(self) -> int:
+        return len(self._node.index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._node.index
+
+    def __repr__(self) -> str:
+        where = ".".join(self._keys)
+        return f"SharedConfig({self._segment.name!r}{', ' + repr(where) if where else ''})"
+
+    def __reduce__(self):
+        return _attach, (self._segment.name, self._segment.size, self._keys)
+
+    def __enter__(self) -> "SharedConfig":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        owner = self._segment.owner
+        self.close()
+        if owner:
+            self.unlink()
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory segment."""
+        return self._segment.name
+
+    def to_dict(self) -> ConfigDict:
+        """Decodes this section of the config into a plain dictionary."""
+        return self._node.to_dict()
+
+    def close(self) -> None:
+        """Detaches this process from the segment. Views of it can't be read afterwards."""
+        self._segment.close()
+
+    def unlink(self) -> None:
+        """Frees the segment. Only call it in the process that created it, once the workers are done."""
+        self._segment.shm.unlink()
+
+
+def share_config(cfg: ConfigDict | OmegaConfigDict | LazyConfig | Path | str) -> SharedConfig:
+    """Serializes a resolved config into a new shared memory segment.
+
+    Args:
+        cfg: A parsed config (a dictionary, `EasyDict`, OmegaConf `DictConfig` or
+            `LazyConfig`) or a path to a config file, which is parsed first.
+
+    Returns:
+        A `SharedConfig` view of the segment. The process that calls `share_config`
+        owns the segment: use the view as a context manager, or call `close()` and
+        `unlink()` on it once the workers are done with it.
+
+    Raises:
+        TypeError: If the config holds values which are not JSON-serializable.
+    """
+    match cfg:
+        case Path() | str():
+            container = parse_config(cfg)
+        case OmegaConfigDict():
+            container = OmegaConf.to_container(cfg, resolve=True)
+        case LazyConfig():
+            container = cfg.to_dict()
+        case Mapping():
+            container = cfg
+        case _:
+            raise TypeError(f"Can't share a config of type {type(cfg).__name__}")
+    payload = bytearray(_HEADER.size)
+    try:
+        _HEADER.pack_into(payload, 0, *_encode(container, payload))
+    except TypeError as e:
+        raise TypeError(f"Only JSON-serializable configs can be shared: {e}") from e
+    shm = shared_memory.SharedMemory(create=True, size=len(payload))
+    shm.buf[:len(payload)] = payload
+    segment = _segments[shm.name] = _Segment(shm, len(payload), owner=True)
+    return SharedConfig(segment, (), segment.root)
@@ -0,0 +1,168 @@
+"""Snapshots of selected config values, for reading them in hot loops.
+
+Reading `cfg.optim.lr` from an OmegaConf `DictConfig` goes through its node and
+interpolation machinery on every access. `snapshot(cfg, "optim.lr", ...)` resolves the
+selected dotted paths once and stores the values in instances of small classes with
+`__slots__` generated for those paths, so that `snap.optim.lr` is a plain attribute
+read. Values are re-read whenever the config is modified with `update_config`.
+"""
+import threading
+import weakref
+from typing import *
+from collections.abc import Mapping
+
+from omegaconf import OmegaConf, DictConfig as OmegaConfigDict, ListConfig as OmegaConfigList
+
+__all__ = ["Snapshot", "snapshot", "update_config", "refresh_snapshot"]
+
+_MISSING = object()
+
+
+class Snapshot:
+    """Base class of the generated snapshot classes, see `snapshot`."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise TypeError("Snapshots are read-only, use `confuk.update_config` to modify the config")
+
+    def __repr__(self) -> str:
+        items = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._names)
+        return f"Snapshot({items})"
+
+
+class _Plan:
+    """The config a snapshot reads and the (holder, attribute, path) of every value in it."""
+
+    def __init__(self, source: Any, leaves: List[Tuple[Snapshot, str, Tuple[str, ...]]]):
+        self.source = source
+        self.leaves = leaves
+
+    def refresh(self) -> None:
+        for holder, name, path in self.leaves:
+            object.__setattr__(holder, name, _read(self.source, path))
+
+
+# Snapshots are found through the root of the config they were taken of, as `update_config` gets the config only:
+_snapshots: Dict[int, "weakref.WeakSet[Snapshot]"] = {}
+_lock = threading.Lock()
+
+
+def _root(cfg: Any) -> Any:
+    # A section of a `DictConfig` knows its parent, so snapshots of it are updated along with the whole config:
+    return cfg._get_root() if isinstance(cfg, OmegaConfigDict) else cfg
+
+
+def _read(source: Any, path: Tuple[str, ...]) -> Any:
+    if isinstance(source, OmegaConfigDict):
+        value = OmegaConf.select(source, ".".join(path), default=_MISSING, throw_on_missing=True)
+        if value is _MISSING:
+            raise KeyError(".".join(path))
+        if isinstance(value, (OmegaConfigDict, OmegaConfigList)):
+            return OmegaConf.to_container(value, resolve=True)
+        return value
+    value = source
+    for key in path:
+        if not isinstance(value, Mapping) or key not in value:
+            raise KeyError(".".join(path))
+        value = value[key]
+    return value
+
+
+def _snapshot_class(names: Tuple[str, ...], root: bool) -> Type[Snapshot]:
+    # The root of a snapshot also holds its plan, paths can't clash with it as they can't start with "_":
+    slots = names + ("_plan", "__weakref__") if root else names
+    return type("Snapshot", (Snapshot,), {"__slots__": slots, "_names": names})
+
+
+def _build(tree: Dict[str, Any],
+           prefix: Tuple[str, ...],
+           leaves: List[Tuple[Snapshot, str, Tuple[str, ...]]],
+           root: bool = False) -> Snapshot:
+    node = _snapshot_class(tuple(tree), root)()
+    for name, subtree in tree.items():
+        if subtree is None:
+            leaves.append((node, name, prefix + (name,)))
+        else:
+            object.__setattr__(node, name, _build(subtree, prefix + (name,), leaves))
+    return node
+
+
+def snapshot(cfg: Any, *paths: str) -> Snapshot:
+    """Takes a snapshot of the values under the given dotted paths of a config.
+
+    Args:
+        cfg: A parsed config: an OmegaConf `DictConfig`, a dictionary, an `EasyDict` or
+            any other mapping (e.g. a `FrozenConfig`).
+        *paths: Dotted paths of the values to read, e.g. `"optim.lr"`. Every part of a
+            path has to be an identifier which does not start with an underscore.
+
+    Returns:
+        A read-only object which holds the resolved values as attributes mirroring
+        the paths, e.g. `snap.optim.lr`. The values are re-read when the config is
+        modified with `update_config`. Changes made to the config in any other way are
+        only picked up by `refresh_snapshot`.
+
+    Raises:
+        ValueError: If a path is invalid, or if one path is a prefix of another.
+        KeyError: If a path does not exist in the config.
+    """
+    tree: Dict[str, Any] = {}
+    for path in paths:
+        keys = path.split(".")
+        if not all(k.isidentifier() and not k.startswith("_") for k in keys):
+            raise ValueError(f"Invalid snapshot path `{path}`, every part of it has to be an identifier")
+        node = tree
+        for i, key in enumerate(keys):
+            last = i == len(keys) - 1
+            if key in node and (last or node[key] is None):
+                raise ValueError(f"Snapshot path `{path}` overlaps with another path")
+            node = node.setdefault(key, None if last else {})
+    leaves = []
+    snap = _build(tree, (), leaves, root=True)
+    plan = _Plan(cfg, leaves)
+    plan.refresh()
+    object.__setattr__(snap, "_plan", plan)
+    with _lock:
+        for key in [key for key, snapshots in _snapshots.items() if not snapshots]:
+            del _snapshots[key]
+        _snapshots.setdefault(id(_root(cfg)), weakref.WeakSet()).add(snap)
+    return snap
+
+
+def refresh_snapshot(snap: Snapshot) -> None:
+    """Re-reads all the values of a snapshot from its config."""
+    snap._plan.refresh()
+
+
+def update_config(cfg: Any, key: str, value: Any) -> None:
+    """Sets the value under a dotted key of a config and refreshes the snapshots taken of it.
+
+    Args:
+        cfg: An OmegaConf `DictConfig`, a dictionary or an `EasyDict`. Missing
+            intermediate sections are created.
+        key: Dotted key, e.g. `"optim.lr"`.
+        value: The new value.
+
+    Raises:
+        TypeError: If the config is read-only (e.g. a `FrozenConfig` or `LazyConfig`).
+    """
+    if isinstance(cfg, OmegaConfigDict):
+        OmegaConf.update(cfg, key, value)
+    elif isinstance(cfg, dict):
+        *parents, last = key.split(".")
+        node = cfg
+        for parent in parents:
+            if not isinstance(node.get(parent), dict):
+                node[parent] = {}
+            node = node[parent]
+        node[last] = value
+    else:
+        raise TypeError(f"Configs of type {type(cfg).__name__} can't be updated")
+    root = _root(cfg)
+    with _lock:
+        snapshots = list(_snapshots.get(id(root), ()))
+    for snap in snapshots:
+        # The id may have been reused by a new config once the snapshotted one was collected:
+        if _root(snap._plan.source) is root:
+            snap._plan.refresh()
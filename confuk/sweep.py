@@ -0,0 +1,173 @@
+"""Sweeps over overrides of one base config.
+
+`sweep(path, overrides)` parses the base config once and yields one variant per set of
+overrides. A variant is built by copying only the sections on the paths to the
+overridden keys (see `confuk.persistent`), every other section is shared with the base
+config and with the other variants, so a variant costs next to nothing no matter how big
+the base is.
+
+`grid` builds the override sets of a grid search over several keys.
+"""
+import itertools
+from pathlib import Path
+from typing import *
+from collections.abc import Mapping
+
+from omegaconf import OmegaConf, DictConfig as OmegaConfigDict
+
+from .frozen import FrozenConfig, freeze
+from .lazy import _REFERENCE, _SIMPLE_REFERENCE
+from .parse import ConfigDict, SupportedConfigFormat, _ParseContext, _parse_context, _parse_leaf_config, parse_config
+from .persistent import assoc_in, get_in
+
+__all__ = ["grid", "sweep"]
+
+Overrides = Mapping[str, Any]
+
+_MISSING = object()
+
+
+class _NeedsOmegaConf(Exception):
+    """Raised when an interpolation can only be resolved by OmegaConf."""
+
+
+def grid(axes: Mapping[str, Iterable[Any]]) -> Iterator[Dict[str, Any]]:
+    """Yields the override sets of a grid search, i.e. every combination of the values.
+
+    Args:
+        axes: The values to try, by dotted key, e.g. `{"optim.lr": [0.1, 0.01], "model.depth": [2, 4]}`.
+            The last key changes the fastest.
+
+    Returns:
+        Iterator over dictionaries mapping every dotted key to one of its values.
+    """
+    keys = list(axes)
+    for values in itertools.product(*(axes[k] for k in keys)):
+        yield dict(zip(keys, values))
+
+
+def _lookup(config: Mapping, path: str) -> Any:
+    value = get_in(config, path.split("."), _MISSING)
+    if value is _MISSING:
+        raise _NeedsOmegaConf(path)
+    return value
+
+
+def _has_interpolation(value: Any) -> bool:
+    match value:
+        case str():
+            return "${" in value
+        case Mapping():
+            return any(_has_interpolation(v) for v in value.values())
+        case list() | tuple():
+            return any(_has_interpolation(v) for v in value)
+        case _:
+            return False
+
+
+def _resolve(config: Mapping, value: Any, depth: int = 0) -> Any:
+    """Resolves references to other keys (`${optim.lr}`) in `value` by looking them up in
+    `config`. Anything else (resolvers, relative or escaped references) raises `_NeedsOmegaConf`.
+    """
+    if depth > 32:
+        # Most likely a cycle, OmegaConf reports those properly
+        raise _NeedsOmegaConf()
+    match value:
+        case str() if "${" in value:
+            references = _REFERENCE.findall(value)
+            if "\\${" in value or not references or not all(_SIMPLE_REFERENCE.fullmatch(r) for r in references):
+                raise _NeedsOmegaConf()
+            match = _REFERENCE.fullmatch(value)
+            if match is not None:
+                return _resolve(config, _lookup(config, match.group(1)), depth + 1)
+            return _REFERENCE.sub(lambda m: str(_resolve(config, _lookup(config, m.group(1)), depth + 1)), value)
+        case Mapping() if _has_interpolation(value):
+            return {k: _resolve(config, v, depth) for k, v in value.items()}
+        case list() | tuple() if _has_interpolation(value):
+            return [_resolve(config, v, depth) for v in value]
+        case _:
+            return value
+
+
+def _resolve_overrides(variant: Mapping, paths: List[str], context: _ParseContext | None = None) -> Mapping:
+    """Resolves the interpolations in the overridden values, the rest of the config is resolved already.
+
+    The parameterized sections of the config are only in scope of the parse that defined
+    them, so overrides using them (e.g. `${layer:2}`) need the `context` of that parse.
+    """
+    try:
+        resolved = [_resolve(variant, get_in(variant, path.split("."))) for path in paths]
+    except _NeedsOmegaConf:
+        with _parse_context(context):
+            cfg = OmegaConf.create(variant.to_dict() if isinstance(variant, FrozenConfig) else variant)
+            resolved = [OmegaConf.select(cfg, path, throw_on_missing=True) for path in paths]
+            resolved = [OmegaConf.to_container(v, resolve=True) if OmegaConf.is_config(v) else v for v in resolved]
+    for path, value in zip(paths, resolved):
+        variant = assoc_in(variant, path.split("."), value)
+    return variant
+
+
+def _base(config: Path | str | ConfigDict | OmegaConfigDict, frozen: bool) -> Tuple[Mapping, _ParseContext | None]:
+    """Returns the base config and, if it's parsed here, the context of the parse, which keeps
+    its parameterized sections for the overrides.
+    """
+    context = None
+    match config:
+        case Path() | str():
+            context = _ParseContext()
+            config = _parse_leaf_config(Path(config), context=context)
+        case OmegaConfigDict():
+            config = OmegaConf.to_container(config, resolve=True)
+        case FrozenConfig() | dict():
+            pass
+        case Mapping():
+            # e.g. lazy configs, every variant would read through the view otherwise
+            config = config.to_dict() if hasattr(config, "to_dict") else dict(config)
+        case _:
+            raise TypeError(f"Can't sweep over a config of type {type(config).__name__}")
+    if frozen:
+        return freeze(config), context
+    return (config.to_dict() if isinstance(config, FrozenConfig) else config), context
+
+
+def sweep(config: Path | str | ConfigDict | OmegaConfigDict,
+          overrides: Iterable[Overrides],
+          cfg_class: SupportedConfigFormat = None,
+          resolve: bool = True) -> Iterator[Any]:
+    """Yields a variant of a base config for every set of overrides, one at a time.
+
+    The base config is parsed (and resolved) once. Each variant copies only the sections
+    on the paths to its overridden keys, so variants share every untouched section with
+    the base config and with each other. Dictionary variants (the default) must thus be
+    treated as read-only, frozen variants (`cfg_class="frozen"`) are read-only anyway.
+    Other formats are converted from the variant, which copies it.
+
+    Like command-line overrides, the overrides are applied to the resolved base config,
+    i.e. values interpolated from an overridden key keep the value of the base config.
+
+    Args:
+        config: Path to the base config or the base config itself, parsed into any format.
+        overrides: Sets of overrides, one per variant, mapping dotted keys (e.g. `"optim.lr"`)
+            to their values. Missing sections are created. See `grid` for grid searches.
+            Consumed lazily, so it may be a generator.
+        cfg_class (SupportedConfigFormat, optional): format of the variants, same as in
+            `parse_config`. Defaults to None, i.e. dictionaries.
+        resolve (bool, optional): whether to resolve interpolations in the overridden values,
+            e.g. `{"optim.warmup_lr": "${optim.lr}"}`. Only the overridden values are resolved,
+            simple references to other keys without building an OmegaConf config. Parameterized
+            sections of a base config given as a path can be used as well. Defaults to True.
+
+    Returns:
+        Iterator over the variants, in the order of `overrides`.
+    """
+    frozen = cfg_class == "frozen"
+    base, context = _base(config, frozen)
+    for override_set in overrides:
+        variant = base
+        for key, value in override_set.items():
+            variant = assoc_in(variant, key.split("."), value)
+        if resolve:
+            pending = [key for key, value in override_set.items() if _has_interpolation(value)]
+            if pending:
+                variant = _resolve_overrides(variant, pending, context)
+        yield variant if frozen or cfg_class in (None, "dict", "d") else parse_config(variant, cfg_class)
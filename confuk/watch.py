@@ -0,0 +1,284 @@
+"""Hot reloading of configs.
+
+`watch_config(path, callback)` parses a config and keeps watching every file of its
+import graph. When any of them changes, the config is parsed again and the callback
+receives a `ConfigChange` with the new config and the keys that changed.
+
+Parsing again is incremental: the watcher keeps the `_ImportResolver` of the previous
+parse and only forgets the changed files and the files depending on them, i.e. importing
+them or using the parameterized sections they define (see `_ImportResolver.invalidate`),
+every other import is reused as it was parsed.
+
+On Linux the directories holding the files are watched with inotify, elsewhere (or
+when inotify is not available) the files are polled for changes of their size and
+modification time.
+"""
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import sys
+import threading
+from pathlib import Path
+from typing import *
+
+from .cache import FileSignature, _file_signature
+from .diff import ConfigDiff, diff
+from .parse import SupportedConfigFormat, _ImportResolver, _parse_leaf_config, parse_config
+
+__all__ = ["ConfigChange", "ConfigWatcher", "watch_config"]
+
+logger = logging.getLogger(__name__)
+
+class ConfigChange(NamedTuple):
+    """What a `ConfigWatcher` hands to its subscribers after a reload."""
+    # The new config, in the format the watcher was created with:
+    config: Any
+    # The keys that changed, see `confuk.diff`:
+    diff: ConfigDiff
+    # Resolved paths of the files that changed:
+    files: FrozenSet[Path]
+
+
+# --------------------------------------------------------------------------- #
+# Change notifications
+# --------------------------------------------------------------------------- #
+class _Poller:
+    """Wakes up every `interval` seconds, the watcher compares the file signatures itself."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._wakeup = threading.Event()
+
+    def watch(self, files: Iterable[Path]) -> None:
+        pass
+
+    def wait(self) -> None:
+        self._wakeup.wait(self.interval)
+        self._wakeup.clear()
+
+    def interrupt(self) -> None:
+        """Makes a pending `wait` return right away."""
+        self._wakeup.set()
+
+    def close(self) -> None:
+        pass
+
+
+class _Inotify(_Poller):
+    """Waits for inotify events in the directories of the watched files.
+
+    Editors often save by writing a new file and renaming it over the old one, so the
+    directories are watched rather than the files, for any file being written, moved in
+    or deleted. The interval still bounds the wait, in case a file is replaced in a way
+    that produces no event (e.g. its directory is replaced).
+    """
+
+    _MASK = 0x00000008 | 0x00000080 | 0x00000200  # IN_CLOSE_WRITE | IN_MOVED_TO | IN_DELETE
+    _NONBLOCK_CLOEXEC = os.O_NONBLOCK | os.O_CLOEXEC
+
+    def __init__(self, interval: float):
+        super().__init__(interval)
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(self._NONBLOCK_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        # Written to by `interrupt`, so that a blocked `wait` returns right away:
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        self._directories: Dict[Path, int] = {}
+
+    def watch(self, files: Iterable[Path]) -> None:
+        for directory in {f.parent for f in files} - self._directories.keys():
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self._MASK)
+            if wd >= 0:
+                self._directories[directory] = wd
+
+    def wait(self) -> None:
+        readable, _, _ = select.select([self._fd, self._wakeup_r], [], [], self.interval)
+        if self._fd in readable:
+            # The events only wake the watcher up, which files changed is told by their signatures:
+            try:
+                while os.read(self._fd, 1 << 16):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def interrupt(self) -> None:
+        os.write(self._wakeup_w, b"\0")
+
+    def close(self) -> None:
+        for fd in (self._fd, self._wakeup_r, self._wakeup_w):
+            os.close(fd)
+
+
+def _notifier(interval: float, use_inotify: bool) -> _Poller:
+    if use_inotify and sys.platform.startswith("linux"):
+        try:
+            return _Inotify(interval)
+        except (OSError, AttributeError):
+            # No inotify (e.g. some container runtimes) or no libc to load it from
+            pass
+    return _Poller(interval)
+
+
+# --------------------------------------------------------------------------- #
+# Watcher
+# --------------------------------------------------------------------------- #
+class ConfigWatcher:
+    """Keeps a parsed config up to date with the files of its import graph, see `watch_config`.
+
+    The current config is available as `config`. Callbacks added with `subscribe` are
+    called with a `ConfigChange` on the thread of the watcher after every reload that
+    changed the config. If a file can't be parsed (e.g. it's saved while half-edited),
+    the error is logged, the previous config is kept and the files keep being watched.
+
+    `start` and `stop` run the watcher in a background thread, it can also be used as
+    a context manager. `check` looks for changes once, on the calling thread.
+    """
+
+    def __init__(self,
+                 config_file_path: Path | str,
+                 cfg_class: SupportedConfigFormat = None,
+                 interval: float = 1.0,
+                 use_inotify: bool = True):
+        self.path = Path(config_file_path)
+        self._cfg_class = cfg_class
+        self._resolver = _ImportResolver()
+        self._config_dict = _parse_leaf_config(self.path, resolver=self._resolver)
+        self.config = parse_config(self._config_dict, cfg_class)
+        self._signatures = self._sign(self._resolver.closure(self.path))
+        self._subscribers: List[Callable[[ConfigChange], None]] = []
+        self._lock = threading.Lock()
+        # Held while reloading, `check` may be called while the background thread runs:
+        self._reload_lock = threading.Lock()
+        self._interval = interval
+        self._use_inotify = use_inotify
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._notifier: _Poller | None = None
+
+    @staticmethod
+    def _sign(files: Iterable[Path]) -> Dict[Path, FileSignature | None]:
+        return {path: _file_signature(path) for path in files}
+
+    @property
+    def files(self) -> FrozenSet[Path]:
+        """The resolved paths of the files being watched."""
+        return frozenset(self._signatures)
+
+    def subscribe(self, callback: Callable[[ConfigChange], None]) -> Callable[[ConfigChange], None]:
+        """Adds a callback to call after every reload. Returns the callback, so it can be used as a decorator."""
+        with self._lock:
+            self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: Callable[[ConfigChange], None]) -> None:
+        with self._lock:
+            self._subscribers.remove(callback)
+
+    def check(self) -> ConfigChange | None:
+        """Reloads the config if any of its files changed since the last check.
+
+        Returns:
+            The change delivered to the subscribers, or `None` if no file changed,
+            the config stayed the same or it could not be parsed.
+        """
+        with self._reload_lock:
+            change = self._reload()
+        if change is not None:
+            with self._lock:
+                subscribers = list(self._subscribers)
+            for callback in subscribers:
+                callback(change)
+        return change
+
+    def _reload(self) -> ConfigChange | None:
+        changed = frozenset(p for p, s in self._signatures.items() if _file_signature(p) != s)
+        if not changed:
+            return None
+        # Signed before parsing, so that a write racing with the parse is caught by the next check:
+        signatures = self._sign(changed)
+        self._resolver.invalidate(changed)
+        try:
+            config_dict = _parse_leaf_config(self.path, resolver=self._resolver)
+            config = parse_config(config_dict, self._cfg_class)
+        except Exception:
+            logger.exception("Reloading %s failed, keeping the previous config", self.path)
+            self._signatures.update(signatures)
+            return None
+        # Imports may have been added or removed:
+        files = self._resolver.closure(self.path)
+        self._signatures = {**self._sign(files - changed), **{p: signatures.get(p) for p in files & changed}}
+        if self._notifier is not None:
+            self._notifier.watch(files)
+        changes = diff(self._config_dict, config_dict)
+        if not changes:
+            return None
+        self._config_dict, self.config = config_dict, config
+        return ConfigChange(config, changes, changed)
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._notifier.wait()
+            if self._stopped.is_set():
+                break
+            try:
+                self.check()
+            except Exception:
+                # A failing callback must not stop the watcher:
+                logger.exception("Handling a change of %s failed", self.path)
+
+    def start(self) -> "ConfigWatcher":
+        """Starts watching in a background (daemon) thread."""
+        if self._thread is not None:
+            return self
+        self._stopped.clear()
+        self._notifier = _notifier(self._interval, self._use_inotify)
+        self._notifier.watch(self._signatures)
+        self._thread = threading.Thread(target=self._run, name=f"confuk-watch-{self.path.name}", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops the background thread and waits for it to finish."""
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._notifier.interrupt()
+        self._thread.join()
+        self._notifier.close()
+        self._thread = self._notifier = None
+
+    def __enter__(self) -> "ConfigWatcher":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def watch_config(config_file_path: Path | str,
+                 callback: Callable[[ConfigChange], None] | None = None,
+                 cfg_class: SupportedConfigFormat = None,
+                 interval: float = 1.0,
+                 use_inotify: bool = True) -> ConfigWatcher:
+    """Parses a config and starts watching the files of its import graph for changes.
+
+    Args:
+        config_file_path (Path | str): path to the config file
+        callback (Callable[[ConfigChange], None] | None, optional): called with a `ConfigChange`
+            after every reload that changed the config. More can be added with
+            `ConfigWatcher.subscribe`. Defaults to None.
+        cfg_class (SupportedConfigFormat, optional): config loader class, same as in `parse_config`.
+            Defaults to None.
+        interval (float, optional): how often (in seconds) the files are polled. With inotify,
+            this is only an upper bound on how long a missed event can go unnoticed. Defaults to 1.0.
+        use_inotify (bool, optional): whether to use inotify on Linux. Defaults to True.
+
+    Returns:
+        A started `ConfigWatcher`, call `stop()` on it (or use it as a context manager) when done.
+    """
+    watcher = ConfigWatcher(config_file_path, cfg_class, interval, use_inotify)
+    if callback is not None:
+        watcher.subscribe(callback)
+    return watcher.start()
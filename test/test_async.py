@@ -0,0 +1,68 @@
+import asyncio
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from omegaconf import DictConfig as OmegaConfigDict
+from confuk import parse_config, parse_config_async, invalidate_parse_cache
+from confuk.cache import get_parse_cache
+
+
+class TestParseConfigAsync(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.dir = Path(cls.tmp.name)
+        (cls.dir / "base.yaml").write_text("shared:\n  winner: base\n")
+        for i in range(4):
+            (cls.dir / f"part_{i}.yaml").write_text(
+                f"pre:\n  imports:\n    - ${{this_dir}}/base.yaml\nshared:\n  winner: {i}\npart_{i}: ${{this_filename_stem}}\n"
+            )
+        (cls.dir / "late.toml").write_text("late = \"${deferred}\"\n")
+        cls.leaf = cls.dir / "leaf.yaml"
+        cls.leaf.write_text("pre:\n  imports:\n"
+                            + "".join(f"    - ${{this_dir}}/part_{i}.yaml\n" for i in range(4))
+                            + "post:\n  imports:\n    - ${this_dir}/late.toml\ndeferred: yes\n")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_same_result_as_sync(self):
+        expected = parse_config(self.leaf)
+        self.assertEqual(asyncio.run(parse_config_async(self.leaf)), expected)
+        self.assertEqual(asyncio.run(parse_config_async(str(self.leaf), "attr")).shared.winner, 3)
+
+    def test_omegaconf_output(self):
+        cfg = asyncio.run(parse_config_async(self.leaf, "o"))
+        self.assertIsInstance(cfg, OmegaConfigDict)
+        self.assertTrue(cfg.late)
+
+    def test_concurrent_parses(self):
+        async def parse_many():
+            return await asyncio.gather(*(parse_config_async(self.leaf) for _ in range(8)))
+        results = asyncio.run(parse_many())
+        self.assertTrue(all(r == results[0] for r in results))
+
+    def test_process_executor(self):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            cfg = asyncio.run(parse_config_async(self.leaf, executor=executor))
+        self.assertEqual(cfg, parse_config(self.leaf))
+
+    def test_cache(self):
+        invalidate_parse_cache()
+        asyncio.run(parse_config_async(self.leaf, use_cache=True))
+        self.assertEqual(len(get_parse_cache()), 1)
+        get_parse_cache().invalidate(self.dir / "base.yaml")
+        self.assertEqual(len(get_parse_cache()), 0)
+
+    def test_missing_import(self):
+        broken = self.dir / "broken.yaml"
+        broken.write_text("pre:\n  imports:\n    - ${this_dir}/nope.yaml\n")
+        with self.assertRaises(FileNotFoundError):
+            asyncio.run(parse_config_async(broken))
+
+
+if __name__ == "__main__":
+    unittest.main()
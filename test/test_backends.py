@@ -0,0 +1,95 @@
+import math
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+from confuk import parse_config, register_parser, set_parser_backend
+from confuk import backends
+from confuk.backends import available_parser_backends, get_parser_backend
+
+
+class TestParserBackends(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        for fmt in ("toml", "yaml", "json"):
+            set_parser_backend(fmt, None)
+        self.tmp.cleanup()
+
+    def test_all_backends_agree(self):
+        for fmt in ("toml", "yaml", "json"):
+            path = Path(__file__).parent / f"test.{fmt}"
+            expected = parse_config(path)
+            for backend in available_parser_backends(fmt):
+                set_parser_backend(fmt, backend)
+                self.assertEqual(parse_config(path), expected, f"{fmt} parsed differently by {backend}")
+
+    def test_explicit_backend(self):
+        set_parser_backend("toml", "toml")
+        self.assertEqual(get_parser_backend("toml"), "toml")
+        set_parser_backend("toml", None)
+        self.assertEqual(get_parser_backend("toml"), available_parser_backends("toml")[0])
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            set_parser_backend("yaml", "nope")
+        with self.assertRaises(ValueError):
+            set_parser_backend("ini", None)
+
+    def test_register_preferred_parser(self):
+        calls = []
+
+        def parse(data: bytes):
+            calls.append(data)
+            return {"custom": True}
+
+        with mock.patch.dict(backends._backends):
+            register_parser("json", "custom", parse, preferred=True)
+            path = self.dir / "cfg.json"
+            path.write_text("{}")
+            self.assertEqual(parse_config(path), {"custom": True})
+            self.assertEqual(calls, [b"{}"])
+        self.assertNotIn("custom", available_parser_backends("json"))
+
+    def test_json_non_standard_values(self):
+        path = self.dir / "cfg.json"
+        path.write_text('{"lr": NaN}')
+        for backend in available_parser_backends("json"):
+            set_parser_backend("json", backend)
+            self.assertTrue(math.isnan(parse_config(path)["lr"]))
+
+
+class TestYamlInstances(unittest.TestCase):
+
+    def test_reused_within_thread(self):
+        self.assertIs(backends._ruamel_loader(), backends._ruamel_loader())
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(backends._ruamel_loader).result()
+        self.assertIsNot(other, backends._ruamel_loader())
+
+    def test_concurrent_loads(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = [Path(tmp) / f"cfg_{i}.yaml" for i in range(32)]
+            for i, path in enumerate(paths):
+                path.write_text(f"index: {i}\nitems: [{', '.join(str(j) for j in range(i))}]\n")
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(parse_config, paths))
+        for i, result in enumerate(results):
+            self.assertEqual(result, {"index": i, "items": list(range(i))})
+
+    def test_usable_after_error(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            broken, valid = Path(tmp) / "broken.yaml", Path(tmp) / "valid.yaml"
+            broken.write_text("a: [1,\n")
+            valid.write_text("a: [1]\n")
+            with self.assertRaises(Exception):
+                parse_config(broken)
+            self.assertEqual(parse_config(valid), {"a": [1]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+import confuk.parse
+from confuk import parse_config, parse_configs
+
+
+class TestParseConfigs(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.dir = Path(cls.tmp.name)
+        (cls.dir / "base.yaml").write_text("model:\n  layers: [64, 64]\n  act: relu\nname: base\n")
+        (cls.dir / "data.yaml").write_text("data:\n  root: ${this_dir}/data\n")
+        (cls.dir / "late.yaml").write_text("summary: ${name}-${lr}\n")
+        cls.leaves = []
+        for i in range(6):
+            leaf = cls.dir / f"leaf_{i}.yaml"
+            leaf.write_text("pre:\n  imports:\n    - ${this_dir}/base.yaml\n    - ${this_dir}/data.yaml\n"
+                            "post:\n  imports:\n    - ${this_dir}/late.yaml\n"
+                            f"name: ${{this_filename_stem}}\nlr: {i}\nmodel:\n  act: act_{i}\n")
+            cls.leaves.append(leaf)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_same_results_as_parse_config(self):
+        expected = [parse_config(leaf) for leaf in self.leaves]
+        self.assertEqual(list(parse_configs(self.leaves)), expected)
+        self.assertEqual(expected[3]["summary"], "leaf_3-3")
+        self.assertEqual(expected[3]["model"], {"layers": [64, 64], "act": "act_3"})
+
+    def test_shared_imports_parsed_once(self):
+        with mock.patch.object(confuk.parse, "_parse_yaml", wraps=confuk.parse._parse_yaml) as parse_yaml:
+            list(parse_configs(self.leaves))
+        base_reads = [c for c in parse_yaml.call_args_list if c.args[0].name == "base.yaml"]
+        self.assertEqual(len(base_reads), 1)
+
+    def test_results_are_independent(self):
+        first, second = list(parse_configs(self.leaves[:2]))
+        first["model"]["layers"].append(128)
+        first["data"]["root"] = "elsewhere"
+        self.assertEqual(second["model"]["layers"], [64, 64])
+        self.assertEqual(list(parse_configs(self.leaves[2:3]))[0]["model"]["layers"], [64, 64])
+
+    def test_streams_results(self):
+        with mock.patch.object(confuk.parse, "_parse_yaml", wraps=confuk.parse._parse_yaml) as parse_yaml:
+            configs = parse_configs(self.leaves, "attr")
+            self.assertEqual(parse_yaml.call_count, 0)
+            self.assertEqual(next(configs).model.act, "act_0")
+            self.assertLess(parse_yaml.call_count, 9)
+
+    def test_process_pool(self):
+        expected = [parse_config(leaf, "o") for leaf in self.leaves]
+        self.assertEqual(list(parse_configs(self.leaves, "o", parallel="process", chunksize=2)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
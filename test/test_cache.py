@@ -0,0 +1,162 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from confuk import parse_config, invalidate_parse_cache, set_parse_cache_size, clear_disk_cache
+from confuk import register_parser, set_parser_backend
+from confuk import backends
+from confuk import parse as confuk_parse
+from confuk.cache import get_parse_cache
+from omegaconf import DictConfig as OmegaConfigDict
+
+
+class TestParseCache(unittest.TestCase):
+
+    def setUp(self):
+        invalidate_parse_cache()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        (self.dir / "base.yaml").write_text("base:\n  value: 1\n")
+        self.leaf = self.dir / "leaf.yaml"
+        self.leaf.write_text("pre:\n  imports:\n    - ${this_dir}/base.yaml\nleaf: 2\n")
+
+    def tearDown(self):
+        invalidate_parse_cache()
+        set_parse_cache_size(128)
+        self.tmp.cleanup()
+
+    def _touch(self, path: Path, text: str):
+        # Bump mtime explicitly so that the test does not depend on timestamp granularity:
+        stat = os.stat(path)
+        path.write_text(text)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_hit_skips_parsers(self):
+        expected = {"base": {"value": 1}, "leaf": 2}
+        self.assertEqual(parse_config(self.leaf, use_cache=True), expected)
+        with mock.patch.object(confuk_parse, "_parse_yaml", side_effect=AssertionError("parser called")):
+            self.assertEqual(parse_config(self.leaf, use_cache=True), expected)
+            self.assertEqual(parse_config(self.leaf, "attr", use_cache=True).base.value, 1)
+            self.assertIsInstance(parse_config(self.leaf, "o", use_cache=True), OmegaConfigDict)
+
+    def test_hit_returns_fresh_copy(self):
+        first = parse_config(self.leaf, use_cache=True)
+        first["base"]["value"] = 42
+        self.assertEqual(parse_config(self.leaf, use_cache=True)["base"]["value"], 1)
+
+    def test_imported_file_change_invalidates(self):
+        parse_config(self.leaf, use_cache=True)
+        self._touch(self.dir / "base.yaml", "base:\n  value: 3\n")
+        self.assertEqual(parse_config(self.leaf, use_cache=True)["base"]["value"], 3)
+
+    def test_explicit_invalidation(self):
+        parse_config(self.leaf, use_cache=True)
+        self.assertEqual(len(get_parse_cache()), 1)
+        invalidate_parse_cache(self.dir / "base.yaml")
+        self.assertEqual(len(get_parse_cache()), 0)
+
+    def test_lru_eviction(self):
+        set_parse_cache_size(1)
+        other = self.dir / "other.yaml"
+        other.write_text("other: 1\n")
+        parse_config(self.leaf, use_cache=True)
+        parse_config(other, use_cache=True)
+        self.assertEqual(len(get_parse_cache()), 1)
+
+    def test_python_configs_are_not_cached(self):
+        parse_config(Path(__file__).parent / "python_config.py", use_cache=True)
+        self.assertEqual(len(get_parse_cache()), 0)
+
+    def test_resolver_calls_are_not_cached(self):
+        self.leaf.write_text("val: ${oc.env:CONFUK_TEST_VALUE}\nother: ${val}\n")
+        with mock.patch.dict(os.environ, {"CONFUK_TEST_VALUE": "two"}):
+            self.assertEqual(parse_config(self.leaf, use_cache=True)["val"], "two")
+        self.assertEqual(len(get_parse_cache()), 0)
+        with mock.patch.dict(os.environ, {"CONFUK_TEST_VALUE": "three"}):
+            self.assertEqual(parse_config(self.leaf, use_cache=True)["other"], "three")
+
+    def test_parameterized_sections_are_cached(self):
+        self.leaf.write_text("layer(n):\n  units: U_${n}\nmodel: ${layer:1}\nleaf: ${model}\n")
+        self.assertEqual(parse_config(self.leaf, use_cache=True)["leaf"], {"units": "U_1"})
+        self.assertEqual(len(get_parse_cache()), 1)
+
+    def test_parser_backend_is_part_of_the_key(self):
+        path = self.dir / "cfg.json"
+        path.write_text("{}")
+        with mock.patch.dict(backends._backends):
+            register_parser("json", "custom", lambda data: {"custom": True})
+            self.assertEqual(parse_config(path, use_cache=True), {})
+            set_parser_backend("json", "custom")
+            try:
+                self.assertEqual(parse_config(path, use_cache=True), {"custom": True})
+            finally:
+                set_parser_backend("json", None)
+
+
+class TestDiskCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.cache_dir = self.dir / "cache"
+        (self.dir / "base.yaml").write_text("base:\n  value: 1\n")
+        self.leaf = self.dir / "leaf.yaml"
+        self.leaf.write_text("pre:\n  imports:\n    - ${this_dir}/base.yaml\nleaf: 2\n")
+        self.expected = {"base": {"value": 1}, "leaf": 2}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _parse(self, *args):
+        return parse_config(self.leaf, *args, disk_cache=self.cache_dir)
+
+    def _assert_hit(self):
+        with mock.patch.object(confuk_parse, "_parse_yaml", side_effect=AssertionError("parser called")):
+            self.assertEqual(self._parse(), self.expected)
+            self.assertIsInstance(self._parse("o"), OmegaConfigDict)
+
+    def test_hit_skips_parsers(self):
+        self.assertEqual(self._parse(), self.expected)
+        self.assertEqual(len(list(self.cache_dir.glob("*.pkl"))), 1)
+        self._assert_hit()
+
+    def test_touched_file_with_same_contents_hits(self):
+        self._parse()
+        stat = os.stat(self.dir / "base.yaml")
+        os.utime(self.dir / "base.yaml", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self._assert_hit()
+
+    def test_changed_contents_invalidate(self):
+        self._parse()
+        (self.dir / "base.yaml").write_text("base:\n  value: 3\n")
+        self.assertEqual(self._parse()["base"]["value"], 3)
+
+    def test_corrupt_entry_is_a_miss(self):
+        self._parse()
+        for entry in self.cache_dir.glob("*.pkl"):
+            entry.write_bytes(b"garbage")
+        self.assertEqual(self._parse(), self.expected)
+
+    def test_default_directory(self):
+        with mock.patch.dict(os.environ, {"CONFUK_CACHE_DIR": str(self.cache_dir)}):
+            parse_config(self.leaf, disk_cache=True)
+            self.assertEqual(len(list(self.cache_dir.glob("*.pkl"))), 1)
+            clear_disk_cache()
+        self.assertEqual(list(self.cache_dir.glob("*.pkl")), [])
+
+    def test_python_configs_are_not_cached(self):
+        parse_config(Path(__file__).parent / "python_config.py", disk_cache=self.cache_dir)
+        self.assertFalse(self.cache_dir.exists())
+
+    def test_resolver_calls_are_not_cached(self):
+        self.leaf.write_text("val: ${oc.env:CONFUK_TEST_VALUE}\n")
+        with mock.patch.dict(os.environ, {"CONFUK_TEST_VALUE": "two"}):
+            self.assertEqual(self._parse()["val"], "two")
+        self.assertFalse(self.cache_dir.exists())
+        with mock.patch.dict(os.environ, {"CONFUK_TEST_VALUE": "three"}):
+            self.assertEqual(self._parse()["val"], "three")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from confuk import parse_config
+
+
+class TestConcurrentParsing(unittest.TestCase):
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        (self.dir / "elsewhere").mkdir()
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_cwd_fixed_when_parse_starts(self):
+        (self.dir / "chdir.py").write_text(f"import os\nos.chdir({str(self.dir / 'elsewhere')!r})\nconfig = {{}}\n")
+        (self.dir / "uses_cwd.yaml").write_text("imported_cwd: ${cwd}\n")
+        leaf = self.dir / "leaf.yaml"
+        leaf.write_text("pre:\n  imports:\n    - ${this_dir}/chdir.py\n    - ${this_dir}/uses_cwd.yaml\nown_cwd: ${cwd}\n")
+        cfg = parse_config(leaf)
+        self.assertEqual(cfg["imported_cwd"], self.cwd)
+        self.assertEqual(cfg["own_cwd"], self.cwd)
+
+    def test_lazy_cwd_fixed_when_requested(self):
+        (self.dir / "uses_cwd.yaml").write_text("imported_cwd: ${cwd}\n")
+        leaf = self.dir / "leaf.yaml"
+        leaf.write_text("pre:\n  imports:\n    - ${this_dir}/uses_cwd.yaml\n")
+        cfg = parse_config(leaf, lazy=True)
+        os.chdir(self.dir / "elsewhere")
+        self.assertEqual(cfg["imported_cwd"], self.cwd)
+
+    def test_reentrant_parse_from_python_config(self):
+        inner = self.dir / "inner.yaml"
+        inner.write_text("layer(n):\n  units: inner_${n}\nmodel: ${layer:1}\n")
+        (self.dir / "outer.py").write_text(
+            f"from confuk import parse_config\nconfig = {{'inner': parse_config({str(inner)!r})['model']}}\n"
+        )
+        leaf = self.dir / "leaf.yaml"
+        leaf.write_text("pre:\n  imports:\n    - ${this_dir}/outer.py\n"
+                        "layer(n):\n  units: outer_${n}\nmodel: ${layer:2}\n")
+        cfg = parse_config(leaf)
+        self.assertEqual(cfg["inner"], {"units": "inner_1"})
+        self.assertEqual(cfg["model"], {"units": "outer_2"})
+
+    def test_thread_pool(self):
+        (self.dir / "base.yaml").write_text("root: ${cwd}\nlayer(n):\n  units: base_${n}\n")
+        leaves = []
+        for i in range(16):
+            leaf = self.dir / f"leaf_{i}.yaml"
+            template = f"layer(n):\n  units: own_{i}_${{n}}\n" if i % 2 else ""
+            leaf.write_text(f"pre:\n  imports:\n    - ${{this_dir}}/base.yaml\n{template}model: ${{layer:{i}}}\n")
+            leaves.append(leaf)
+        expected = [parse_config(leaf) for leaf in leaves]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in range(5):
+                self.assertEqual(list(executor.map(parse_config, leaves)), expected)
+        self.assertEqual(expected[3]["model"]["units"], "own_3_3")
+        self.assertEqual(expected[4]["model"]["units"], "base_4")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import tempfile
+import unittest
+from pathlib import Path
+from pydantic import BaseModel
+from confuk import diff, parse_config, share_config
+
+
+class Optim(BaseModel):
+    lr: float
+    betas: list
+
+
+class Training(BaseModel):
+    optim: Optim
+    epochs: int
+
+
+class TestDiff(unittest.TestCase):
+
+    def setUp(self):
+        self.old = {"optim": {"lr": 0.1, "betas": [0.9, 0.99]}, "epochs": 10, "scaled": "${optim.lr}"}
+        self.new = {"optim": {"lr": 0.01, "betas": [0.9, 0.99]}, "epochs": 10, "scaled": "${optim.lr}"}
+
+    def test_changed_added_removed(self):
+        new = {"optim": {"lr": 0.1, "betas": [0.9, 0.999], "eps": 1e-8}, "data": {"path": "/data"}}
+        changes = diff(self.old, new)
+        self.assertEqual(changes.changed, {"optim.betas": ([0.9, 0.99], [0.9, 0.999])})
+        self.assertEqual(changes.added, {"optim.eps": 1e-8, "data": {"path": "/data"}})
+        self.assertEqual(changes.removed, {"epochs": 10, "scaled": "${optim.lr}"})
+        self.assertEqual(changes.paths, ["optim.eps", "data", "epochs", "scaled", "optim.betas"])
+
+    def test_equal_configs(self):
+        self.assertFalse(diff(self.old, dict(self.old)))
+        self.assertFalse(diff(self.old, self.old))
+        self.assertTrue(diff(self.old, self.new))
+
+    def test_section_replaced_by_value(self):
+        self.assertEqual(diff({"a": {"b": 1}}, {"a": 1}).changed, {"a": ({"b": 1}, 1)})
+
+    def test_output_formats(self):
+        for cfg_class in ("dict", "attr", "omega", "frozen"):
+            with self.subTest(cfg_class=cfg_class):
+                old, new = parse_config(self.old, cfg_class), parse_config(self.new, cfg_class)
+                expected = {"optim.lr": (0.1, 0.01)}
+                if cfg_class == "omega":
+                    # Interpolations are resolved first:
+                    expected["scaled"] = (0.1, 0.01)
+                self.assertEqual(diff(old, new).changed, expected)
+        self.assertEqual(diff(parse_config(self.old, "frozen"), self.new).changed, {"optim.lr": (0.1, 0.01)})
+
+    def test_pydantic(self):
+        old = Training(optim=Optim(lr=0.1, betas=[0.9]), epochs=1)
+        new = Training(optim=Optim(lr=0.1, betas=[0.9]), epochs=2)
+        self.assertEqual(diff(old, new).changed, {"epochs": (1, 2)})
+
+    def test_lazy_and_shared(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.yaml"
+            path.write_text("optim:\n  lr: 0.1\n  betas: [0.9, 0.99]\nepochs: 10\n")
+            lazy = parse_config(path, lazy=True)
+            with share_config(self.new) as shared:
+                self.assertEqual(diff(lazy, shared).changed, {"optim.lr": (0.1, 0.01)})
+
+    def test_unsupported(self):
+        with self.assertRaises(TypeError):
+            diff(self.old, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
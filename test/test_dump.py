@@ -1,5 +1,8 @@
-from confuk import dump_config
+from confuk import dump_config, parse_config
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from dataclasses import dataclass, field
 from omegaconf import DictConfig
 
@@ -27,6 +30,14 @@ class TestDumpConfig(unittest.TestCase):
         dump_config(self.omegaconf, "test/outputs/dump_omegaconf.yaml")
         dump_config(self.omegaconf, "test/outputs/dump_omegaconf.json")
 
+    def test_dump_yaml_from_threads(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = [Path(tmp) / f"dump_{i}.yaml" for i in range(32)]
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(lambda i: dump_config({"index": i, "items": list(range(i))}, paths[i]), range(32)))
+            for i, path in enumerate(paths):
+                self.assertEqual(parse_config(path), {"index": i, "items": list(range(i))})
+
 
 if __name__ == "__main__":
     unittest.main()
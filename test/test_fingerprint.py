@@ -0,0 +1,70 @@
+import datetime
+import importlib
+import unittest
+from pathlib import Path
+from unittest import mock
+from pydantic import BaseModel
+from confuk import fingerprint, Fingerprinter, parse_config
+
+fingerprint_module = importlib.import_module("confuk.fingerprint")
+
+
+class Optim(BaseModel):
+    lr: float
+    betas: list
+
+
+class Training(BaseModel):
+    optim: Optim
+    epochs: int
+
+
+class TestFingerprint(unittest.TestCase):
+
+    def setUp(self):
+        self.config = {"optim": {"lr": 0.1, "betas": [0.9, 0.99]}, "epochs": 10}
+
+    def test_stable(self):
+        # Must never change for the same encoding version, fingerprints get stored:
+        self.assertEqual(fingerprint(self.config), "6a5ccf1e005aa73b7d8172e754606d62")
+
+    def test_key_order_does_not_matter(self):
+        reordered = {"epochs": 10, "optim": {"betas": [0.9, 0.99], "lr": 0.1}}
+        self.assertEqual(fingerprint(reordered), fingerprint(self.config))
+        self.assertEqual(fingerprint({"s": {1, 2, 3}}), fingerprint({"s": {3, 2, 1}}))
+
+    def test_values_matter(self):
+        seen = {fingerprint(self.config)}
+        for lr in (1, 1.0, True, "0.1", None, [0.1], {"lr": 0.1}):
+            seen.add(fingerprint({"optim": {"lr": lr, "betas": [0.9, 0.99]}, "epochs": 10}))
+        self.assertEqual(len(seen), 8)
+        self.assertNotEqual(fingerprint({"a": [1, 2]}), fingerprint({"a": [2, 1]}))
+        self.assertNotEqual(fingerprint({"a": {"b": 1}}), fingerprint({"a.b": 1}))
+
+    def test_output_formats(self):
+        expected = fingerprint(self.config)
+        for cfg_class in ("attr", "omega", "frozen"):
+            self.assertEqual(fingerprint(parse_config(self.config, cfg_class)), expected)
+        self.assertEqual(fingerprint(Training(**self.config)), expected)
+        # Interpolations are resolved first:
+        self.assertEqual(fingerprint(parse_config({"a": 1, "b": "${a}"}, "omega")), fingerprint({"a": 1, "b": 1}))
+
+    def test_scalars(self):
+        fingerprint({"date": datetime.date(2024, 1, 1), "path": Path("/data"), "raw": b"\0"})
+        with self.assertRaises(TypeError):
+            fingerprint({"obj": object()})
+
+    def test_shared_sections_are_hashed_once(self):
+        base = {f"section_{i}": {"value": i} for i in range(10)}
+        variants = [{**base, "section_0": {"value": -i}} for i in range(5)]
+        fingerprinter = Fingerprinter()
+        with mock.patch.object(fingerprint_module.hashlib, "blake2b", wraps=fingerprint_module.hashlib.blake2b) as blake2b:
+            fingerprints = [fingerprinter(v) for v in variants]
+        # The root and 10 sections of the first variant, then a new root and `section_0` per variant:
+        self.assertEqual(blake2b.call_count, 11 + 4 * 2)
+        self.assertEqual(fingerprints, [fingerprint(v) for v in variants])
+        self.assertEqual(len(set(fingerprints)), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
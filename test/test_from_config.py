@@ -1,9 +1,13 @@
 import unittest
+import unittest.mock
 from dataclasses import dataclass, field
 from typing import Any, List, Optional, Tuple, Union
 
 from omegaconf import DictConfig, ListConfig, OmegaConf
 
+from confuk import parse_config
+
+import importlib
 from confuk.from_config import (
     ConfigMixin,
     _unwrap_optional,
@@ -12,6 +16,10 @@ from confuk.from_config import (
 )
 
 
+# `confuk.from_config` is shadowed by the function of the same name:
+from_config_module = importlib.import_module("confuk.from_config")
+
+
 # --------------------------------------------------------------------------- #
 # Shared fixtures
 # --------------------------------------------------------------------------- #
@@ -377,6 +385,124 @@ class TestConfigDataclass(unittest.TestCase):
             config_dataclass(NotDC)
 
 
+# --------------------------------------------------------------------------- #
+# Construction plans
+# --------------------------------------------------------------------------- #
+@dataclass
+class Forward:
+    later: "DefinedLater"
+
+
+class TestPlans(unittest.TestCase):
+
+    def test_plan_is_compiled_once_per_class(self):
+        @dataclass
+        class Container:
+            items: List[Item]
+            name: str = "c"
+
+        from_config(Container, {"items": [{"val": 1}]})
+        with unittest.mock.patch("typing.get_type_hints", side_effect=AssertionError("hints resolved again")):
+            result = from_config(Container, {"items": [{"val": 2}, {"val": 3}]})
+        self.assertEqual(result, Container([Item(2), Item(3)]))
+
+    def test_unresolved_hints_are_not_cached(self):
+        result = from_config(Forward, {"later": {"value": 1}})
+        self.assertEqual(result.later, {"value": 1})
+        self.assertNotIn(Forward, from_config_module._plans)
+
+    def test_plans_do_not_keep_classes_alive(self):
+        @dataclass
+        class Temporary:
+            x: int = 1
+
+        from_config(Temporary, {})
+        self.assertIn(Temporary, from_config_module._plans)
+        count = len(from_config_module._plans)
+        del Temporary
+        import gc
+        gc.collect()
+        self.assertLess(len(from_config_module._plans), count)
+
+
+# --------------------------------------------------------------------------- #
+# Plain dict fast path
+# --------------------------------------------------------------------------- #
+@dataclass
+class Layer:
+    units: int
+    act: str = "relu"
+    tags: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Model:
+    name: str
+    layers: List[Layer]
+    head: Optional[Layer] = None
+    extra: Any = None
+    raw: Optional[DictConfig] = None
+
+
+@dataclass
+class RawNode:
+    node: DictConfig
+
+
+class TestNativePath(unittest.TestCase):
+
+    def setUp(self):
+        self.config = {
+            "name": "mlp",
+            "layers": [{"units": 8, "tags": ["a"]}, {"units": 16, "act": "???"}],
+            "head": {"units": 2},
+            "extra": {"seed": [0, 1]},
+            "unused": "${does.not.exist}",
+        }
+
+    def _without_omegaconf(self):
+        return unittest.mock.patch.object(OmegaConf, "create", side_effect=AssertionError("OmegaConf used"))
+
+    def test_matches_omegaconf_path(self):
+        with self._without_omegaconf():
+            native = from_config(Model, self.config)
+        del self.config["unused"]
+        self.assertEqual(native, from_config(Model, OmegaConf.create(self.config)))
+        self.assertEqual(native.layers[1].act, "relu")
+
+    def test_parsed_configs(self):
+        for cfg_class in ("dict", "attr", "frozen"):
+            cfg = parse_config({k: v for k, v in self.config.items() if k != "unused"}, cfg_class)
+            with self._without_omegaconf():
+                self.assertEqual(from_config(Model, cfg).layers[0].tags, ["a"])
+
+    def test_values_are_copied(self):
+        result = from_config(Model, self.config)
+        result.extra["seed"].append(2)
+        self.assertEqual(self.config["extra"]["seed"], [0, 1])
+
+    def test_interpolations_fall_back_to_omegaconf(self):
+        self.config["name"] = "${head.units}"
+        self.assertEqual(from_config(Model, self.config).name, 2)
+
+    def test_raw_container_field(self):
+        # Only fields declared as exactly `DictConfig`/`ListConfig` are kept raw, on both paths:
+        self.config["raw"] = {"a": 1}
+        native = from_config(Model, self.config)
+        self.config["name"] = "${head.units}"
+        interpolated = from_config(Model, self.config)
+        self.assertEqual((type(native.raw), type(interpolated.raw)), (dict, dict))
+        config = {"node": {"a": 1}}
+        self.assertIsInstance(from_config(RawNode, config).node, DictConfig)
+        self.assertIsInstance(from_config(RawNode, OmegaConf.create(config)).node, DictConfig)
+
+    def test_missing_and_strict(self):
+        with self.assertRaises(TypeError):
+            from_config(Model, {"name": "???", "layers": []})
+        with self.assertRaises(ValueError):
+            from_config(Model, self.config, strict=True)
+
+
 # --------------------------------------------------------------------------- #
 # _unwrap_optional
 # --------------------------------------------------------------------------- #
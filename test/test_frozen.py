@@ -0,0 +1,85 @@
+import copy
+import pickle
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from confuk import parse_config, dump_config, FrozenConfig
+
+
+class TestFrozenConfig(unittest.TestCase):
+
+    def setUp(self):
+        self.path = Path(__file__).parent / "test.yaml"
+        self.config = {
+            "training": {"lr": 0.1, "layers": [{"units": 8}, {"units": 16}], "keys": 3, "1st": "a"},
+            "tags": {"a", "b"},
+            "name": "exp",
+        }
+        self.cfg = parse_config(self.config, "frozen")
+
+    def test_matches_dict(self):
+        self.assertIsInstance(self.cfg, FrozenConfig)
+        self.assertEqual(self.cfg, self.config)
+        self.assertEqual(self.cfg.to_dict(), self.config)
+        self.assertEqual(parse_config(self.path, "frozen"), parse_config(self.path))
+
+    def test_access(self):
+        cfg = self.cfg
+        self.assertEqual(cfg.training.lr, 0.1)
+        self.assertEqual(cfg["training"]["layers"][1].units, 16)
+        self.assertEqual(cfg.training["keys"], 3)
+        self.assertEqual(cfg.training["1st"], "a")
+        self.assertEqual(list(cfg.training.keys()), ["lr", "layers", "keys", "1st"])
+        self.assertEqual(cfg.get("missing", 1), 1)
+        self.assertIn("name", cfg)
+        with self.assertRaises(KeyError):
+            cfg["missing"]
+        with self.assertRaises(AttributeError):
+            cfg.missing
+
+    def test_immutable_and_hashable(self):
+        with self.assertRaises(AttributeError):
+            self.cfg.name = "other"
+        with self.assertRaises(TypeError):
+            self.cfg["name"] = "other"
+        self.assertEqual(hash(self.cfg), hash(parse_config(self.config, "frozen")))
+        self.assertEqual(len({self.cfg, parse_config(self.config, "frozen")}), 1)
+        self.assertIs(copy.deepcopy(self.cfg), self.cfg)
+
+    def test_keys_take_part_in_equality(self):
+        self.assertNotEqual(parse_config({"a": 1}, "frozen"), parse_config({"b": 1}, "frozen"))
+        self.assertNotEqual(parse_config({"a": 1}, "frozen"), (1,))
+
+    def test_key_order_does_not_matter(self):
+        a = parse_config({"a": 1, "b": {"c": 2, "d": [3]}}, "frozen")
+        b = parse_config({"b": {"d": [3], "c": 2}, "a": 1}, "frozen")
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(len({a, b}), 1)
+        self.assertEqual(b, a.to_dict())
+        self.assertNotEqual(a, parse_config({"b": {"d": [3], "c": 2}, "a": 2}, "frozen"))
+        self.assertNotEqual(a, parse_config({"b": {"d": [3], "c": 2}, "e": 1}, "frozen"))
+
+    def test_pickle(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.cfg)), self.cfg)
+
+    def test_shared_between_threads(self):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.cfg.training.layers[0].units)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [8] * 8)
+
+    def test_dump(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "out.yaml"
+            cfg = parse_config(self.path, "frozen")
+            dump_config(cfg, path)
+            self.assertEqual(parse_config(path), cfg)
+
+
+if __name__ == "__main__":
+    unittest.main()
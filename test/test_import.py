@@ -1,5 +1,8 @@
 from confuk import parse_config
+from confuk import parse as confuk_parse
 from pathlib import Path
+from unittest import mock
+import tempfile
 import unittest
 
 
@@ -32,5 +35,64 @@ class TestImport(unittest.TestCase):
         self.assertEqual(ed.some_key, "lol")
 
 
+class TestImportGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, name: str, text: str) -> Path:
+        path = self.dir / name
+        path.write_text(text)
+        return path
+
+    def test_diamond_import_is_parsed_once(self):
+        self._write("base.yaml", "shared:\n  value: 1\n  name: ${this_filename_stem}\n")
+        self._write("left.yaml", "pre:\n  imports:\n    - ${this_dir}/base.yaml\nleft: 1\n")
+        self._write("right.yaml", "pre:\n  imports:\n    - ${this_dir}/base.yaml\nright: 2\nshared:\n  value: 2\n")
+        leaf = self._write("leaf.yaml", "pre:\n  imports:\n    - ${this_dir}/left.yaml\n    - ${this_dir}/right.yaml\n")
+        with mock.patch.object(confuk_parse, "_parse_yaml", wraps=confuk_parse._parse_yaml) as parse_yaml:
+            cfg = parse_config(leaf)
+        parsed_files = [call.args[0].name for call in parse_yaml.call_args_list]
+        self.assertEqual(parsed_files.count("base.yaml"), 1)
+        self.assertEqual(cfg, {"shared": {"value": 2, "name": "base"}, "left": 1, "right": 2})
+
+    def test_shared_import_sees_the_sections_of_its_importer(self):
+        # `b.yaml` is imported twice, each time after a different definition of `layer`:
+        self._write("t1.yaml", "layer(n):\n  units: X_${n}\n")
+        self._write("t2.yaml", "layer(n):\n  units: Y_${n}\n")
+        self._write("b.yaml", "model: ${layer:1}\n")
+        self._write("l.yaml", "pre:\n  imports:\n    - ${this_dir}/t1.yaml\n    - ${this_dir}/b.yaml\n")
+        self._write("r.yaml", "pre:\n  imports:\n    - ${this_dir}/t2.yaml\n    - ${this_dir}/b.yaml\n")
+        leaf = self._write("leaf.yaml", "pre:\n  imports:\n    - ${this_dir}/l.yaml\n    - ${this_dir}/r.yaml\n")
+        self.assertEqual(parse_config(leaf), {"model": {"units": "Y_1"}})
+
+    def test_shared_import_is_reused_with_the_same_sections(self):
+        self._write("t.yaml", "layer(n):\n  units: X_${n}\n")
+        self._write("b.yaml", "model: ${layer:1}\n")
+        self._write("l.yaml", "pre:\n  imports:\n    - ${this_dir}/b.yaml\nleft: 1\n")
+        self._write("r.yaml", "pre:\n  imports:\n    - ${this_dir}/b.yaml\nright: 2\n")
+        leaf = self._write("leaf.yaml", "pre:\n  imports:\n    - ${this_dir}/t.yaml\n"
+                                        "    - ${this_dir}/l.yaml\n    - ${this_dir}/r.yaml\n")
+        with mock.patch.object(confuk_parse, "_parse_yaml", wraps=confuk_parse._parse_yaml) as parse_yaml:
+            cfg = parse_config(leaf)
+        parsed_files = [call.args[0].name for call in parse_yaml.call_args_list]
+        self.assertEqual(parsed_files.count("b.yaml"), 1)
+        self.assertEqual(cfg, {"model": {"units": "X_1"}, "left": 1, "right": 2})
+
+    def test_circular_import_reports_chain(self):
+        self._write("a.yaml", "pre:\n  imports:\n    - ${this_dir}/b.yaml\na: 1\n")
+        self._write("b.yaml", "pre:\n  imports:\n    - ${this_dir}/a.yaml\nb: 1\n")
+        with self.assertRaises(ValueError) as ctx:
+            parse_config(self.dir / "a.yaml")
+        message = str(ctx.exception)
+        self.assertIn("Circular import", message)
+        self.assertIn("a.yaml -> ", message)
+        self.assertIn("b.yaml -> ", message)
+
+
 if __name__ == "__main__":
     unittest.main()
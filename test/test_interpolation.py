@@ -1,6 +1,11 @@
-from confuk import parse_config
+from confuk import parse_config, parse_configs
+from confuk.parse import _interpolate_special_variables, _TemplateResolver
+from omegaconf import OmegaConf
 from pathlib import Path
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
 
 class TestImport(unittest.TestCase):
@@ -22,6 +27,31 @@ class TestImport(unittest.TestCase):
         # to a simple dict is `OmegaConf.to_container(config, resolve=True)`:
         self.assertEqual(str(ed), str(exp))
 
+    def test_omegaconf_output_is_resolved(self):
+        cfg = parse_config(self.path, "omega")
+        self.assertFalse(OmegaConf.is_interpolation(cfg.something_else, "value_str"))
+        self.assertEqual(cfg.something_else.value_str, "omg_lol")
+
+
+class TestSpecialVariableInterpolation(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.path = Path(__file__).parent / "test_interpolation.toml"
+
+    def test_all_markers_in_one_string(self):
+        cfg = _interpolate_special_variables({"a": ["${this_filename_stem}.$this_filename_suffix in $this_dirname"]},
+                                             self.path)
+        self.assertEqual(cfg["a"][0], f"test_interpolation.toml in {self.path.parent.name}")
+
+    def test_unchanged_subtrees_are_shared(self):
+        untouched = {"b": [1, 2, {"c": "no markers here"}]}
+        original = {"untouched": untouched, "touched": {"name": "${this_filename}"}}
+        cfg = _interpolate_special_variables(original, self.path)
+        self.assertIs(cfg["untouched"], untouched)
+        self.assertEqual(cfg["touched"]["name"], "test_interpolation.toml")
+        self.assertEqual(original["touched"]["name"], "${this_filename}")
+
 
 class TestParameterizedConfigs(unittest.TestCase):
 
@@ -90,5 +120,104 @@ class TestParameterizedConfigs(unittest.TestCase):
         self.assertEqual(cfg.variant_a.some_data, "awesome_data")
 
 
+class TestTemplateResolver(unittest.TestCase):
+
+    def setUp(self):
+        self.template = {
+            "path": "data/${experiment}/s_${crazy}${target}.pdb",
+            "constant": {"id": "h1", "tags": ["a", "b"]},
+            "items": [{"name": "${target}"}, "${order}"],
+        }
+        self.resolver = _TemplateResolver(["experiment", "crazy", "target"], self.template)
+
+    def test_substitutes_only_parameters(self):
+        result = self.resolver("exp1", "awesome", 3)
+        self.assertEqual(result["path"], "data/exp1/s_awesome3.pdb")
+        self.assertEqual(result["items"], [{"name": "3"}, "${order}"])
+
+    def test_constant_subtrees_shared(self):
+        self.assertIs(self.resolver("a", "b", "c")["constant"], self.template["constant"])
+
+    def test_memoized_per_arguments(self):
+        self.assertIs(self.resolver("a", "b", "c"), self.resolver("a", "b", "c"))
+        self.assertNotEqual(self.resolver("a", "b", "c"), self.resolver("a", "b", "d"))
+
+    def test_arguments_inserted_literally(self):
+        self.assertEqual(self.resolver(r"\1", "${target}", "x")["path"], r"data/\1/s_${target}x.pdb")
+
+    def test_argument_count(self):
+        with self.assertRaises(ValueError):
+            self.resolver("a")
+
+    def test_repeated_calls_in_config(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cfg.yaml"
+            path.write_text("layer(n, act):\n  units: ${n}\n  act: ${act}\n"
+                            "a: ${layer:64,relu}\nb: ${layer:64,relu}\nc: ${layer:32,relu}\n")
+            cfg = parse_config(path)
+        self.assertEqual(cfg["a"], {"units": "64", "act": "relu"})
+        self.assertEqual(cfg["a"], cfg["b"])
+        self.assertIsNot(cfg["a"], cfg["b"])
+        self.assertEqual(cfg["c"]["units"], "32")
+
+
+class TestTemplateScope(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.wide = self.dir / "wide.yaml"
+        self.wide.write_text("scoped_layer(n):\n  units: wide_${n}\nmodel: ${scoped_layer:1}\n")
+        self.narrow = self.dir / "narrow.yaml"
+        self.narrow.write_text("scoped_layer(n):\n  units: narrow_${n}\nmodel: ${scoped_layer:2}\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_concurrent_parses_do_not_clobber(self):
+        paths = [self.wide, self.narrow] * 50
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(parse_config, paths))
+        for path, result in zip(paths, results):
+            expected = "wide_1" if path == self.wide else "narrow_2"
+            self.assertEqual(result["model"]["units"], expected)
+
+    def test_not_visible_outside_of_parse(self):
+        parse_config(self.wide)
+        with self.assertRaises(Exception):
+            OmegaConf.create({"model": "${scoped_layer:1}"}).model
+
+    def test_registered_once(self):
+        parse_config(self.wide)
+        with mock.patch.object(OmegaConf, "register_new_resolver") as register:
+            parse_config(self.narrow)
+        register.assert_not_called()
+
+    def test_shared_imports_keep_their_sections(self):
+        base = self.dir / "base.yaml"
+        base.write_text("scoped_layer(n):\n  units: base_${n}\n")
+        overriding = self.dir / "overriding.yaml"
+        overriding.write_text("pre:\n  imports:\n    - ${this_dir}/base.yaml\n"
+                              "scoped_layer(n):\n  units: own_${n}\nmodel: ${scoped_layer:1}\n")
+        plain = self.dir / "plain.yaml"
+        plain.write_text("pre:\n  imports:\n    - ${this_dir}/base.yaml\nmodel: ${scoped_layer:1}\n")
+        first, second = parse_configs([overriding, plain])
+        self.assertEqual(first["model"]["units"], "own_1")
+        self.assertEqual(second["model"]["units"], "base_1")
+
+    def test_shared_imports_use_the_sections_of_each_config(self):
+        (self.dir / "t1.yaml").write_text("scoped_layer(n):\n  units: X_${n}\n")
+        (self.dir / "t2.yaml").write_text("scoped_layer(n):\n  units: Y_${n}\n")
+        (self.dir / "b.yaml").write_text("model: ${scoped_layer:1}\n")
+        leaves = []
+        for i, template in enumerate(("t1", "t2", "t1"), start=1):
+            leaf = self.dir / f"leaf{i}.yaml"
+            leaf.write_text(f"pre:\n  imports:\n    - ${{this_dir}}/{template}.yaml\n    - ${{this_dir}}/b.yaml\n")
+            leaves.append(leaf)
+        configs = list(parse_configs(leaves))
+        self.assertEqual([cfg["model"]["units"] for cfg in configs], ["X_1", "Y_1", "X_1"])
+        self.assertEqual(configs[1], parse_config(leaves[1]))
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
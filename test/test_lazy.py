@@ -0,0 +1,83 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from confuk import parse_config
+from confuk import parse as confuk_parse
+from confuk.lazy import LazyConfig
+
+
+class TestLazyConfig(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self._write("catalog.yaml", "datasets:\n  a:\n    path: ${this_dir}/a\n  b:\n    path: /b\n")
+        self._write("model.yaml", "training:\n  lr: 0.1\n  epochs: 10\n  scaled: ${training.epochs}\n"
+                                  "name: $[this_filename_stem]\n")
+        self._write("late.yaml", "training:\n  epochs: ${epochs}\n")
+        self.leaf = self._write("leaf.yaml", "pre:\n  imports:\n    - ${this_dir}/catalog.yaml\n"
+                                             "    - ${this_dir}/model.yaml\n"
+                                             "post:\n  imports:\n    - ${this_dir}/late.yaml\n"
+                                             "epochs: 20\ntraining:\n  lr: 0.01\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, name: str, text: str) -> Path:
+        path = self.dir / name
+        path.write_text(text)
+        return path
+
+    def _read_files(self):
+        return mock.patch.object(confuk_parse, "_parse_yaml", wraps=confuk_parse._parse_yaml)
+
+    def test_matches_eager_parse(self):
+        lazy = parse_config(self.leaf, lazy=True)
+        self.assertIsInstance(lazy, LazyConfig)
+        self.assertEqual(lazy, parse_config(self.leaf))
+        self.assertEqual(lazy.to_dict(), parse_config(self.leaf))
+
+    def test_to_dict_returns_a_copy(self):
+        cfg = parse_config(self.leaf, lazy=True)
+        section = cfg["training"].to_dict()
+        section["lr"] = 1.0
+        cfg.to_dict()["epochs"] = 0
+        self.assertEqual(cfg["training"]["lr"], 0.01)
+        self.assertEqual(cfg["epochs"], 20)
+        self.assertEqual(cfg.to_dict(), parse_config(self.leaf))
+
+    def test_unused_imports_are_not_read(self):
+        with self._read_files() as parse_yaml:
+            cfg = parse_config(self.leaf, "attr", lazy=True)
+            self.assertEqual(cfg.training.lr, 0.01)
+            self.assertEqual(cfg.training.epochs, 20)
+            self.assertEqual(cfg.name, "leaf")
+        read = {call.args[0].name for call in parse_yaml.call_args_list}
+        self.assertNotIn("catalog.yaml", read)
+
+    def test_imported_values_are_interpolated_in_their_own_file(self):
+        cfg = parse_config(self.leaf, lazy=True)
+        self.assertEqual(cfg["datasets"]["a"]["path"], f"{self.dir.resolve()}/a")
+        # Interpolated in `model.yaml`, before `late.yaml` overrides `training.epochs`:
+        self.assertEqual(cfg["training"]["scaled"], 10)
+
+    def test_resolvers_fall_back_to_eager_parse(self):
+        path = Path(__file__).parent / "test_parameterized.yaml"
+        cfg = parse_config(path, lazy=True)
+        self.assertEqual(cfg["custom_path_a"]["path"], "data/exp1/s_awesometg1.pdb")
+
+    def test_missing_key(self):
+        cfg = parse_config(self.leaf, lazy=True)
+        with self.assertRaises(KeyError):
+            cfg["nope"]
+        with self.assertRaises(AttributeError):
+            cfg.training.nope
+
+    def test_unsupported_output_format(self):
+        with self.assertRaises(ValueError):
+            parse_config(self.leaf, "omega", lazy=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
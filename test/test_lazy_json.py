@@ -0,0 +1,71 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from confuk import parse_config
+from confuk import lazy_json
+from confuk.lazy_json import JSONObjectView, mmap_json
+
+
+class TestMmapJson(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        patcher = mock.patch.object(lazy_json, "MMAP_JSON_MIN_SIZE", 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.data = {
+            "name": "tricky \"}{,:] \\ \u00e9",
+            "empty": {},
+            "nested": {"a": {"b": [1, {"c": "]"}], "d": None}, "e": 1.5e3},
+            "labels": [f"label_{i}" for i in range(100)],
+            "flag": True,
+        }
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _map(self, text: str):
+        path = self.dir / "data.json"
+        path.write_text(text)
+        return mmap_json(path)
+
+    def test_matches_json_loads(self):
+        for text in (json.dumps(self.data), json.dumps(self.data, indent=4)):
+            view = self._map(text)
+            self.assertIsInstance(view, JSONObjectView)
+            self.assertIsInstance(view["nested"], JSONObjectView)
+            self.assertEqual(view, self.data)
+            self.assertEqual(view.to_dict(), self.data)
+
+    def test_only_accessed_subtrees_are_decoded(self):
+        view = self._map(json.dumps(self.data))
+        with mock.patch.object(lazy_json, "parse_bytes", wraps=lazy_json.parse_bytes) as parse_bytes:
+            self.assertEqual(view["nested"]["a"]["d"], None)
+            self.assertEqual(list(view), list(self.data))
+        self.assertEqual([call.args[1] for call in parse_bytes.call_args_list], [b"null"])
+
+    def test_small_files_are_decoded(self):
+        with mock.patch.object(lazy_json, "MMAP_JSON_MIN_SIZE", 1 << 20):
+            self.assertIs(type(self._map(json.dumps(self.data))), dict)
+
+    def test_lazy_parse_merges_imports(self):
+        (self.dir / "base.yaml").write_text("nested:\n  a:\n    d: 0\n    f: base\nlr: 0.1\n")
+        (self.dir / "data.json").write_text(json.dumps(self.data))
+        leaf = self.dir / "leaf.yaml"
+        leaf.write_text("pre:\n  imports:\n    - ${this_dir}/base.yaml\n    - ${this_dir}/data.json\nlr: 0.01\n")
+        cfg = parse_config(leaf, lazy=True)
+        with mock.patch.object(lazy_json, "parse_bytes", wraps=lazy_json.parse_bytes) as parse_bytes:
+            self.assertEqual(cfg["nested"]["a"]["d"], None)
+        # Neither the sibling keys of the JSON file nor those of `nested.a` are decoded:
+        self.assertEqual([call.args[1] for call in parse_bytes.call_args_list], [b"null"])
+        self.assertEqual(cfg["nested"]["a"]["f"], "base")
+        self.assertEqual(cfg["nested"]["a"]["d"], None)
+        self.assertEqual(cfg["labels"][3], "label_3")
+        self.assertEqual(cfg, parse_config(leaf))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
+import tempfile
 import unittest
 from rich.console import Console
 from confuk import main, click_main, click_option
+from confuk.main_decorator import _load_and_override_config
 from confuk.parse import ConfigDict
 from pathlib import Path
 from typing import *
@@ -68,5 +70,28 @@ class TestRead(unittest.TestCase):
             assert e.args[0] == 0
 
 
+
+class TestOverrides(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "cfg.yaml"
+        self.path.write_text("layer(n):\n  units: U_${n}\nx: ${layer:1}\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_override_uses_parameterized_section(self):
+        cfg = _load_and_override_config(self.path, "o", {}, ["y=${layer:2}"], False, Console())
+        self.assertEqual(cfg.y, {"units": "U_2"})
+        self.assertEqual(cfg.x, {"units": "U_1"})
+
+    def test_override_uses_parameterized_section_with_disk_cache(self):
+        cache_dir = Path(self.tmp.name) / "cache"
+        _load_and_override_config(self.path, "d", {}, [], False, Console(), disk_cache=cache_dir)
+        cfg = _load_and_override_config(self.path, "d", {}, ["y=${layer:3}"], False, Console(), disk_cache=cache_dir)
+        self.assertEqual(cfg["y"], {"units": "U_3"})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,55 @@
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from confuk import parse_config, invalidate_parse_cache
+from confuk.cache import get_parse_cache
+
+
+class TestParallelImports(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.dir = Path(cls.tmp.name)
+        imports = []
+        for i in range(8):
+            # Every file overrides `shared.winner`, so the merge order is visible in the result:
+            (cls.dir / f"part_{i}.yaml").write_text(
+                f"pre:\n  imports:\n    - ${{this_dir}}/base.yaml\nshared:\n  winner: {i}\npart_{i}: ${{this_filename_stem}}\n"
+            )
+            imports.append(f"    - ${{this_dir}}/part_{i}.yaml\n")
+        (cls.dir / "base.yaml").write_text("shared:\n  winner: base\n  base: true\n")
+        (cls.dir / "late.toml").write_text("late = \"${deferred}\"\n")
+        cls.leaf = cls.dir / "leaf.yaml"
+        cls.leaf.write_text("pre:\n  imports:\n" + "".join(imports)
+                            + "post:\n  imports:\n    - ${this_dir}/late.toml\ndeferred: yes\n")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_same_result_as_serial(self):
+        expected = parse_config(self.leaf)
+        self.assertEqual(expected["shared"]["winner"], 7)
+        for parallel in ("thread", "process"):
+            self.assertEqual(parse_config(self.leaf, parallel=parallel), expected)
+
+    def test_reuses_executor(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            cfg = parse_config(self.leaf, "attr", parallel=executor)
+        self.assertEqual(cfg.part_3, "part_3")
+
+    def test_dependencies_recorded_for_cache(self):
+        invalidate_parse_cache()
+        parse_config(self.leaf, use_cache=True, parallel="thread")
+        get_parse_cache().invalidate(self.dir / "part_5.yaml")
+        self.assertEqual(len(get_parse_cache()), 0)
+
+    def test_invalid_option(self):
+        with self.assertRaises(ValueError):
+            parse_config(self.leaf, parallel="gpu")
+
+
+if __name__ == "__main__":
+    unittest.main()
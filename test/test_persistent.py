@@ -0,0 +1,86 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from confuk import parse_config
+from confuk.frozen import freeze
+from confuk import parse as confuk_parse
+from confuk.persistent import assoc_in, get_in, merge
+
+
+class TestPersistent(unittest.TestCase):
+
+    def setUp(self):
+        self.base = {"optim": {"lr": 0.1, "betas": [0.9, 0.99]}, "model": {"depth": 2, "blocks": {"width": 8}}}
+
+    def test_merge_shares_untouched_subtrees(self):
+        override = {"optim": {"lr": 0.01}, "data": {"path": "/data"}}
+        merged = merge(self.base, override)
+        self.assertEqual(merged["optim"], {"lr": 0.01, "betas": [0.9, 0.99]})
+        self.assertIs(merged["model"], self.base["model"])
+        self.assertIs(merged["optim"]["betas"], self.base["optim"]["betas"])
+        self.assertIs(merged["data"], override["data"])
+        self.assertEqual(self.base["optim"]["lr"], 0.1)
+
+    def test_get_in(self):
+        self.assertEqual(get_in(self.base, ["model", "blocks", "width"]), 8)
+        self.assertEqual(get_in(self.base, ["optim", "betas", "1"]), 0.99)
+        self.assertIsNone(get_in(self.base, ["optim", "betas", "2"], None))
+        with self.assertRaises(KeyError):
+            get_in(self.base, ["optim", "eps"])
+
+    def test_assoc_in_copies_only_the_path(self):
+        updated = assoc_in(self.base, ["model", "blocks", "width"], 16)
+        self.assertEqual(updated["model"]["blocks"]["width"], 16)
+        self.assertEqual(self.base["model"]["blocks"]["width"], 8)
+        self.assertIsNot(updated["model"], self.base["model"])
+        self.assertIs(updated["optim"], self.base["optim"])
+        self.assertEqual(updated["model"]["depth"], 2)
+
+    def test_assoc_in_lists_and_missing_sections(self):
+        updated = assoc_in(self.base, ["optim", "betas", "0"], 0.8)
+        self.assertEqual(updated["optim"]["betas"], [0.8, 0.99])
+        self.assertEqual(self.base["optim"]["betas"], [0.9, 0.99])
+        updated = assoc_in(self.base, ["sched", "warmup", "steps"], 100)
+        self.assertEqual(updated["sched"], {"warmup": {"steps": 100}})
+        self.assertNotIn("sched", self.base)
+
+    def test_assoc_in_frozen(self):
+        base = freeze(self.base)
+        updated = assoc_in(base, ["optim", "extra"], {"eps": [1e-8]})
+        self.assertEqual(updated.optim.extra.eps, (1e-8,))
+        self.assertEqual(updated.optim.lr, 0.1)
+        self.assertIs(updated.model, base.model)
+        self.assertNotIn("extra", base.optim)
+        self.assertEqual(hash(updated), hash(freeze(updated.to_dict())))
+
+    def test_parse_shares_imported_sections(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp) / "base.yaml"
+            base.write_text("model:\n  depth: 2\n  width: 8\noptim:\n  lr: 0.1\n")
+            a = Path(tmp) / "a.yaml"
+            a.write_text("pre:\n  imports:\n    - ${this_dir}/base.yaml\noptim:\n  lr: 0.01\n")
+            b = Path(tmp) / "b.yaml"
+            b.write_text("pre:\n  imports:\n    - ${this_dir}/base.yaml\noptim:\n  lr: 0.001\n")
+            resolver = confuk_parse._ImportResolver()
+            with mock.patch.object(confuk_parse.OmegaConf, "create", wraps=confuk_parse.OmegaConf.create) as create:
+                parsed_a, _ = resolver.parse(a, False)
+                parsed_b, _ = resolver.parse(b, False)
+            # Nothing to interpolate, so OmegaConf isn't involved:
+            self.assertEqual(create.call_count, 0)
+            self.assertIs(parsed_a["model"], parsed_b["model"])
+            self.assertEqual((parsed_a["optim"]["lr"], parsed_b["optim"]["lr"]), (0.01, 0.001))
+            # The results handed out by `parse_config` are still independent copies:
+            cfg = parse_config(a)
+            cfg["model"]["depth"] = 3
+            self.assertEqual(parse_config(a)["model"]["depth"], 2)
+
+    def test_interpolated_configs_still_resolved(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cfg.yaml"
+            path.write_text("optim:\n  lr: 0.1\n  warmup_lr: ${optim.lr}\n")
+            self.assertEqual(parse_config(path)["optim"]["warmup_lr"], 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import datetime
+import multiprocessing
+import pickle
+import unittest
+from pathlib import Path
+from confuk import parse_config, share_config, SharedConfig
+
+
+def _read_lr(cfg: SharedConfig) -> float:
+    return cfg.training.lr
+
+
+class TestSharedConfig(unittest.TestCase):
+
+    def setUp(self):
+        self.config = {
+            "training": {"lr": 0.1, "layers": [{"units": 8}, {"units": 16}]},
+            "name": "exp",
+        }
+        self.shared = share_config(self.config)
+
+    def tearDown(self):
+        self.shared.close()
+        self.shared.unlink()
+
+    def test_access(self):
+        cfg = self.shared
+        self.assertEqual(cfg, self.config)
+        self.assertEqual(cfg.training.lr, 0.1)
+        self.assertEqual(cfg["training"]["layers"][1].units, 16)
+        self.assertIsInstance(cfg.training, SharedConfig)
+        self.assertEqual(cfg.training.to_dict(), self.config["training"])
+        with self.assertRaises(AttributeError):
+            cfg.missing
+
+    def test_read_only(self):
+        with self.assertRaises(TypeError):
+            self.shared.name = "other"
+
+    def test_pickles_to_segment_name(self):
+        payload = pickle.dumps(self.shared.training)
+        self.assertNotIn(b"layers", payload)
+        self.assertEqual(pickle.loads(payload), self.config["training"])
+
+    def test_workers_read_segment(self):
+        with multiprocessing.get_context("spawn").Pool(2) as pool:
+            self.assertEqual(pool.map(_read_lr, [self.shared] * 4), [0.1] * 4)
+
+    def test_parsed_configs(self):
+        path = Path(__file__).parent / "test.yaml"
+        with share_config(path) as shared:
+            self.assertEqual(shared, parse_config(path))
+        with share_config(parse_config(path, "o")) as shared:
+            self.assertEqual(shared, parse_config(path))
+
+    def test_closed_config_cannot_be_read(self):
+        with share_config(self.config) as shared:
+            training = shared.training
+        with self.assertRaises(ValueError):
+            training["lr"]
+
+    def test_non_json_values(self):
+        with self.assertRaises(TypeError):
+            share_config({"date": datetime.date(2024, 1, 1)})
+
+
+if __name__ == "__main__":
+    unittest.main()
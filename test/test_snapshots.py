@@ -0,0 +1,66 @@
+import gc
+import unittest
+from confuk import parse_config, snapshot, update_config
+from confuk import snapshots as confuk_snapshots
+from confuk.snapshots import refresh_snapshot
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.config = {"optim": {"lr": 0.1, "scaled": "${optim.lr}", "betas": [0.9, 0.99]}, "batch_size": 32}
+
+    def test_reads_resolved_values(self):
+        for cfg_class in ("o", "dict", "attr", "frozen"):
+            cfg = parse_config(self.config, cfg_class)
+            snap = snapshot(cfg, "optim.lr", "optim.betas", "batch_size")
+            self.assertEqual((snap.optim.lr, list(snap.optim.betas), snap.batch_size), (0.1, [0.9, 0.99], 32))
+        cfg = parse_config(self.config, "o")
+        self.assertEqual(snapshot(cfg, "optim.scaled").optim.scaled, 0.1)
+        self.assertEqual(snapshot(cfg, "optim").optim, {"lr": 0.1, "scaled": 0.1, "betas": [0.9, 0.99]})
+
+    def test_update_config_refreshes(self):
+        cfg = parse_config(self.config, "o")
+        snap = snapshot(cfg, "optim.lr", "optim.scaled")
+        section = snapshot(cfg.optim, "lr")
+        update_config(cfg, "optim.lr", 0.01)
+        self.assertEqual((snap.optim.lr, snap.optim.scaled, section.lr), (0.01, 0.01, 0.01))
+
+        cfg = parse_config(self.config, "attr")
+        snap = snapshot(cfg, "optim.lr")
+        update_config(cfg, "optim.lr", 0.01)
+        self.assertEqual((snap.optim.lr, cfg.optim.lr), (0.01, 0.01))
+
+    def test_direct_changes_need_refresh(self):
+        cfg = parse_config(self.config)
+        snap = snapshot(cfg, "optim.lr")
+        cfg["optim"]["lr"] = 0.5
+        self.assertEqual(snap.optim.lr, 0.1)
+        refresh_snapshot(snap)
+        self.assertEqual(snap.optim.lr, 0.5)
+
+    def test_read_only(self):
+        snap = snapshot(parse_config(self.config), "optim.lr")
+        with self.assertRaises(TypeError):
+            snap.optim.lr = 1
+        with self.assertRaises(TypeError):
+            update_config(parse_config(self.config, "frozen"), "optim.lr", 1)
+
+    def test_invalid_paths(self):
+        cfg = parse_config(self.config)
+        with self.assertRaises(KeyError):
+            snapshot(cfg, "optim.missing")
+        with self.assertRaises(ValueError):
+            snapshot(cfg, "optim", "optim.lr")
+        with self.assertRaises(ValueError):
+            snapshot(cfg, "optim._plan")
+
+    def test_snapshots_are_collected(self):
+        cfg = parse_config(self.config)
+        snapshot(cfg, "optim.lr")
+        gc.collect()
+        self.assertEqual(len(confuk_snapshots._snapshots.get(id(cfg), ())), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from omegaconf import DictConfig as OmegaConfigDict, OmegaConf
+from confuk import FrozenConfig, grid, parse_config, sweep
+from confuk import parse as confuk_parse
+
+
+class TestSweep(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "base.yaml"
+        self.path.write_text("optim:\n  lr: 0.1\n  warmup_lr: ${optim.lr}\nmodel:\n  depth: 2\n  width: 8\n"
+                             "data:\n  path: /data\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_grid(self):
+        self.assertEqual(list(grid({"a": [1, 2], "b.c": ["x", "y"]})),
+                         [{"a": 1, "b.c": "x"}, {"a": 1, "b.c": "y"}, {"a": 2, "b.c": "x"}, {"a": 2, "b.c": "y"}])
+
+    def test_parses_base_once(self):
+        with mock.patch.object(confuk_parse, "_parse_yaml", wraps=confuk_parse._parse_yaml) as parse_yaml:
+            variants = list(sweep(self.path, grid({"optim.lr": [0.1, 0.01], "model.depth": [2, 4]})))
+        self.assertEqual(parse_yaml.call_count, 1)
+        self.assertEqual([(v["optim"]["lr"], v["model"]["depth"]) for v in variants],
+                         [(0.1, 2), (0.1, 4), (0.01, 2), (0.01, 4)])
+        # Overrides apply to the resolved base, like command-line overrides:
+        self.assertEqual(variants[2]["optim"]["warmup_lr"], 0.1)
+
+    def test_untouched_sections_are_shared(self):
+        base = parse_config(self.path)
+        first, second = sweep(base, [{"model.depth": 4}, {"optim.lr": 1.0, "data.cache": True}])
+        self.assertIs(first["optim"], base["optim"])
+        self.assertIs(first["data"], base["data"])
+        self.assertIs(second["model"], base["model"])
+        self.assertEqual(second["data"], {"path": "/data", "cache": True})
+        self.assertEqual(base["model"]["depth"], 2)
+
+    def test_lazy(self):
+        def overrides():
+            yield {"optim.lr": 1.0}
+            raise AssertionError("consumed eagerly")
+        self.assertEqual(next(sweep(self.path, overrides()))["optim"]["lr"], 1.0)
+
+    def test_resolves_overridden_values(self):
+        overrides = [
+            {"optim.lr": 0.5, "optim.warmup_lr": "${optim.lr}", "tag": "lr_${optim.lr}_${model.depth}"},
+            {"optim.warmup_lr": "${oc.decode:'0.25'}"},
+        ]
+        first, second = sweep(self.path, overrides)
+        self.assertEqual((first["optim"]["warmup_lr"], first["tag"]), (0.5, "lr_0.5_2"))
+        self.assertEqual(second["optim"]["warmup_lr"], 0.25)
+        unresolved = next(sweep(self.path, overrides, resolve=False))
+        self.assertEqual(unresolved["optim"]["warmup_lr"], "${optim.lr}")
+
+    def test_overrides_use_parameterized_sections(self):
+        self.path.write_text("layer(n):\n  units: U_${n}\nmodel: ${layer:1}\n")
+        variants = list(sweep(self.path, grid({"model": ["${layer:2}", "${layer:4}"]})))
+        self.assertEqual([v["model"] for v in variants], [{"units": "U_2"}, {"units": "U_4"}])
+
+    def test_output_formats(self):
+        overrides = [{"optim.lr": 0.01, "model.layers": [1, 2]}]
+        frozen = next(sweep(self.path, overrides, "frozen"))
+        self.assertIsInstance(frozen, FrozenConfig)
+        self.assertEqual((frozen.optim.lr, frozen.model.layers, frozen.model.width), (0.01, (1, 2), 8))
+        first, second = sweep(self.path, overrides * 2, "frozen")
+        self.assertIs(first.data, second.data)
+        omega = next(sweep(OmegaConf.create({"optim": {"lr": 1}, "other": "${optim.lr}"}), overrides, "omega"))
+        self.assertIsInstance(omega, OmegaConfigDict)
+        self.assertEqual((omega.optim.lr, omega.other), (0.01, 1))
+        self.assertEqual(next(sweep(self.path, overrides, "attr")).model.layers, [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import queue
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from confuk import watch_config, ConfigWatcher
+from confuk import parse as confuk_parse
+
+
+class TestConfigWatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name).resolve()
+        self.base = self.dir / "base.yaml"
+        self.base.write_text("model:\n  width: 8\n  depth: 2\n")
+        self.other = self.dir / "other.yaml"
+        self.other.write_text("data:\n  path: /data\n")
+        self.leaf = self.dir / "leaf.yaml"
+        self.leaf.write_text("pre:\n  imports:\n    - ${this_dir}/base.yaml\n    - ${this_dir}/other.yaml\n"
+                             "training:\n  lr: 0.1\n  width: ${model.width}\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _touch(self, path: Path, text: str):
+        # Bump mtime explicitly so that the test does not depend on timestamp granularity:
+        stat = os.stat(path)
+        path.write_text(text)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_watches_import_closure(self):
+        watcher = ConfigWatcher(self.leaf)
+        self.assertEqual(watcher.files, {self.leaf, self.base, self.other})
+        self.assertEqual(watcher.config["training"]["width"], 8)
+
+    def test_reparses_only_changed_files(self):
+        watcher = ConfigWatcher(self.leaf)
+        changes = []
+        watcher.subscribe(changes.append)
+        self.assertIsNone(watcher.check())
+
+        self._touch(self.base, "model:\n  width: 16\n  depth: 2\n")
+        with mock.patch.object(confuk_parse, "_load_config_file", wraps=confuk_parse._load_config_file) as load:
+            change = watcher.check()
+        self.assertEqual({call.args[0].resolve() for call in load.call_args_list}, {self.base, self.leaf})
+        self.assertEqual(changes, [change])
+        self.assertEqual(change.files, {self.base})
+        self.assertEqual(change.diff.changed, {"model.width": (8, 16), "training.width": (8, 16)})
+        self.assertEqual(watcher.config["training"]["width"], 16)
+
+    def test_follows_new_imports(self):
+        watcher = ConfigWatcher(self.leaf, "attr")
+        extra = self.dir / "extra.yaml"
+        extra.write_text("extra: 1\n")
+        self._touch(self.leaf, "pre:\n  imports:\n    - ${this_dir}/extra.yaml\n")
+        self.assertEqual(watcher.check().diff.added, {"extra": 1})
+        self.assertEqual(watcher.config.extra, 1)
+        self.assertEqual(watcher.files, {self.leaf, extra})
+
+    def test_parameterized_sections_are_dependencies(self):
+        template = self.dir / "t1.yaml"
+        template.write_text("layer(n):\n  units: X_${n}\n")
+        user = self.dir / "b.yaml"
+        user.write_text("model: ${layer:1}\n")
+        self.leaf.write_text("pre:\n  imports:\n    - ${this_dir}/t1.yaml\n    - ${this_dir}/b.yaml\n")
+        watcher = ConfigWatcher(self.leaf)
+        self.assertEqual(watcher._resolver.invalidate([]), set())
+        self._touch(template, "layer(n):\n  units: Z_${n}\n")
+        invalidate, stale = watcher._resolver.invalidate, []
+        with mock.patch.object(watcher._resolver, "invalidate", lambda paths: stale.append(invalidate(paths)) or stale[-1]):
+            change = watcher.check()
+        # `b.yaml` doesn't import `t1.yaml`, but it expanded a section defined there:
+        self.assertEqual(stale, [{template, user, self.leaf}])
+        self.assertEqual(change.diff.changed, {"model.units": ("X_1", "Z_1")})
+        self.assertEqual(watcher.config, confuk_parse.parse_config(self.leaf))
+
+    def test_keeps_config_on_errors(self):
+        watcher = ConfigWatcher(self.leaf)
+        self._touch(self.base, "model: [\n")
+        with self.assertLogs("confuk.watch", "ERROR"):
+            self.assertIsNone(watcher.check())
+        self.assertEqual(watcher.config["model"]["width"], 8)
+        self._touch(self.base, "model:\n  width: 4\n")
+        change = watcher.check()
+        self.assertEqual(change.diff.changed, {"model.width": (8, 4), "training.width": (8, 4)})
+        self.assertEqual(change.diff.removed, {"model.depth": 2})
+
+    def test_background_thread(self):
+        for use_inotify in (True, False):
+            with self.subTest(use_inotify=use_inotify):
+                changes = queue.Queue()
+                with watch_config(self.leaf, changes.put, interval=0.05, use_inotify=use_inotify):
+                    self._touch(self.other, f"data:\n  path: /{use_inotify}\n")
+                    change = changes.get(timeout=5)
+                self.assertEqual(change.diff.changed, {"data.path": ("/data", f"/{use_inotify}")})
+                self._touch(self.other, "data:\n  path: /data\n")
+
+
+if __name__ == "__main__":
+    unittest.main()